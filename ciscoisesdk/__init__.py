@@ -32,6 +32,7 @@ from .api import IdentityServicesEngineAPI
 from .exceptions import (
     AccessTokenError,
     ApiError,
+    BatchError,
     DownloadFailure,
     MalformedRequest,
     RateLimitError,
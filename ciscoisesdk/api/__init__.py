@@ -27,8 +27,17 @@ import warnings
 import ciscoisesdk.environment as ciscoise_environment
 from ciscoisesdk.config import (
     DEFAULT_BASE_URL,
+    DEFAULT_CACHE_ENABLED,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COMPRESS_REQUESTS,
+    DEFAULT_CONDITIONAL_REQUESTS,
+    DEFAULT_CONNECTION_POOL_SIZE,
     DEFAULT_DEBUG,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_BLOCK,
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_THREAD_LOCAL_SESSIONS,
+    DEFAULT_TRANSPORT,
     DEFAULT_USES_API_GATEWAY,
     DEFAULT_USES_CSRF_TOKEN,
     DEFAULT_VERIFY,
@@ -71,6 +80,9 @@ from .v3_1_0.authorization_profile import (
 from .v3_1_0.byod_portal import (
     ByodPortal as ByodPortal_v3_1_0
 )
+from .v3_1_0.byod_portal_async import (
+    AsyncByodPortal as AsyncByodPortal_v3_1_0
+)
 from .v3_1_0.backup_and_restore import (
     BackupAndRestore as BackupAndRestore_v3_1_0
 )
@@ -206,6 +218,9 @@ from .v3_1_0.network_access_authorization_rules import (
 from .v3_1_0.network_access_conditions import (
     NetworkAccessConditions as NetworkAccessConditions_v3_1_0
 )
+from .v3_1_0.network_access_conditions_async import (
+    AsyncNetworkAccessConditions as AsyncNetworkAccessConditions_v3_1_0
+)
 from .v3_1_0.network_access_dictionary import (
     NetworkAccessDictionary as NetworkAccessDictionary_v3_1_0
 )
@@ -1163,7 +1178,17 @@ class IdentityServicesEngineAPI(object):
                  uses_csrf_token=None,
                  object_factory=mydict_data_factory,
                  validator=SchemaValidator,
-                 perform_initialize=True):
+                 perform_initialize=True,
+                 use_async=False,
+                 connection_pool_size=None,
+                 transport=None,
+                 thread_local_sessions=None,
+                 max_retries=None,
+                 pool_block=None,
+                 cache_enabled=None,
+                 cache_ttl=None,
+                 conditional_requests=None,
+                 compress_requests=None):
         """Create a new IdentityServicesEngineAPI object.
         An access token is required to interact with the Identity Services Engine APIs.
         This package supports two methods for you to pass the
@@ -1254,6 +1279,63 @@ class IdentityServicesEngineAPI(object):
                 Defaults to True.
                 You can initialize/reinitialize later with `reinitialize <#ciscoisesdk.IdentityServicesEngineAPI.reinitialize>`_.
                 The original value will not change.
+            use_async(bool): The flag that, if enabled, also exposes the asyncio
+                variants of the API wrappers that support them (for example,
+                `byod_portal_async` and `network_access_conditions_async`).
+                Defaults to False.
+            connection_pool_size(int): Number of keep-alive connections each
+                RESTful session keeps per host. Raise it to match the number of
+                concurrent requests. Defaults to the
+                IDENTITY_SERVICES_ENGINE_CONNECTION_POOL_SIZE environment variable or
+                ciscoisesdk.config.DEFAULT_CONNECTION_POOL_SIZE
+                if the environment variable is not set.
+            transport(basestring): 'h1' to send the requests over HTTP/1.1,
+                or 'h2' to multiplex concurrent requests over a single HTTP/2
+                connection per host (requires the optional httpx package).
+                Defaults to the IDENTITY_SERVICES_ENGINE_TRANSPORT environment
+                variable or ciscoisesdk.config.DEFAULT_TRANSPORT
+                if the environment variable is not set.
+            thread_local_sessions(bool): Give every thread its own `requests`
+                session and connection pool, for callers that spread the
+                requests over a thread pool. Defaults to the
+                IDENTITY_SERVICES_ENGINE_THREAD_LOCAL_SESSIONS environment
+                variable or ciscoisesdk.config.DEFAULT_THREAD_LOCAL_SESSIONS
+                if the environment variable is not set.
+            max_retries(int): Number of times the idempotent requests
+                (GET, PUT, DELETE) are retried, with backoff, after a
+                connection error or a 500, 502, 503 or 504 response. Applies
+                to the 'h1' transport. Defaults to the
+                IDENTITY_SERVICES_ENGINE_MAX_RETRIES environment variable or
+                ciscoisesdk.config.DEFAULT_MAX_RETRIES
+                if the environment variable is not set.
+            pool_block(bool): Make a request wait for a pooled connection
+                when all of them are in use, instead of opening an extra one
+                that is closed after the response. Applies to the 'h1'
+                transport. Defaults to the IDENTITY_SERVICES_ENGINE_POOL_BLOCK
+                environment variable or ciscoisesdk.config.DEFAULT_POOL_BLOCK
+                if the environment variable is not set.
+            cache_enabled(bool): Keep the GET responses of the v3_1_0
+                ByodPortal and NetworkAccessConditions wrappers for
+                cache_ttl seconds. Defaults to the
+                IDENTITY_SERVICES_ENGINE_CACHE_ENABLED environment variable or
+                ciscoisesdk.config.DEFAULT_CACHE_ENABLED
+                if the environment variable is not set.
+            cache_ttl(int,float): Seconds a cached response, or a remembered
+                ETag, stays fresh. Defaults to the
+                IDENTITY_SERVICES_ENGINE_CACHE_TTL environment variable or
+                ciscoisesdk.config.DEFAULT_CACHE_TTL
+                if the environment variable is not set.
+            conditional_requests(bool): Revalidate the GET responses of the
+                v3_1_0 ByodPortal and NetworkAccessConditions wrappers with
+                If-None-Match. Defaults to the
+                IDENTITY_SERVICES_ENGINE_CONDITIONAL_REQUESTS environment
+                variable or ciscoisesdk.config.DEFAULT_CONDITIONAL_REQUESTS
+                if the environment variable is not set.
+            compress_requests(bool): Gzip the large JSON bodies of the v3_1_0
+                ByodPortal create and update methods. Defaults to the
+                IDENTITY_SERVICES_ENGINE_COMPRESS_REQUESTS environment
+                variable or ciscoisesdk.config.DEFAULT_COMPRESS_REQUESTS
+                if the environment variable is not set.
 
         Returns:
             IdentityServicesEngineAPI: A new IdentityServicesEngineAPI object.
@@ -1269,7 +1351,9 @@ class IdentityServicesEngineAPI(object):
 
         """
         check_type(perform_initialize, bool, may_be_none=True)
+        check_type(use_async, bool, may_be_none=False)
         self._perform_initialize = perform_initialize
+        self._use_async = use_async
         self._username = username or ciscoise_environment.get_env_username()
         self._password = password or ciscoise_environment.get_env_password()
         self._encoded_auth = encoded_auth or ciscoise_environment.get_env_encoded_auth()
@@ -1285,6 +1369,15 @@ class IdentityServicesEngineAPI(object):
         self._wait_on_rate_limit = wait_on_rate_limit
         self._verify = verify
         self._debug = debug
+        self._connection_pool_size = connection_pool_size
+        self._transport = transport
+        self._thread_local_sessions = thread_local_sessions
+        self._max_retries = max_retries
+        self._pool_block = pool_block
+        self._cache_enabled = cache_enabled
+        self._cache_ttl = cache_ttl
+        self._conditional_requests = conditional_requests
+        self._compress_requests = compress_requests
 
         if uses_api_gateway is None:
             self._uses_api_gateway = ciscoise_environment.get_env_uses_api_gateway()
@@ -1316,7 +1409,61 @@ class IdentityServicesEngineAPI(object):
             if self._debug is None:
                 self._debug = DEFAULT_DEBUG
 
+        if connection_pool_size is None:
+            self._connection_pool_size = ciscoise_environment.get_env_connection_pool_size()
+            if self._connection_pool_size is None:
+                self._connection_pool_size = DEFAULT_CONNECTION_POOL_SIZE
+
+        if transport is None:
+            self._transport = ciscoise_environment.get_env_transport()
+            if self._transport is None:
+                self._transport = DEFAULT_TRANSPORT
+
+        if thread_local_sessions is None:
+            self._thread_local_sessions = ciscoise_environment.get_env_thread_local_sessions()
+            if self._thread_local_sessions is None:
+                self._thread_local_sessions = DEFAULT_THREAD_LOCAL_SESSIONS
+
+        if max_retries is None:
+            self._max_retries = ciscoise_environment.get_env_max_retries()
+            if self._max_retries is None:
+                self._max_retries = DEFAULT_MAX_RETRIES
+
+        if pool_block is None:
+            self._pool_block = ciscoise_environment.get_env_pool_block()
+            if self._pool_block is None:
+                self._pool_block = DEFAULT_POOL_BLOCK
+
+        if cache_enabled is None:
+            self._cache_enabled = ciscoise_environment.get_env_cache_enabled()
+            if self._cache_enabled is None:
+                self._cache_enabled = DEFAULT_CACHE_ENABLED
+
+        if cache_ttl is None:
+            self._cache_ttl = ciscoise_environment.get_env_cache_ttl()
+            if self._cache_ttl is None:
+                self._cache_ttl = DEFAULT_CACHE_TTL
+
+        if conditional_requests is None:
+            self._conditional_requests = ciscoise_environment.get_env_conditional_requests()
+            if self._conditional_requests is None:
+                self._conditional_requests = DEFAULT_CONDITIONAL_REQUESTS
+
+        if compress_requests is None:
+            self._compress_requests = ciscoise_environment.get_env_compress_requests()
+            if self._compress_requests is None:
+                self._compress_requests = DEFAULT_COMPRESS_REQUESTS
+
         check_type(self._single_request_timeout, int)
+        check_type(self._connection_pool_size, int, may_be_none=False)
+        check_type(self._transport, basestring, may_be_none=False)
+        check_type(self._thread_local_sessions, bool, may_be_none=False)
+        check_type(self._max_retries, int, may_be_none=False)
+        check_type(self._pool_block, bool, may_be_none=False)
+        check_type(self._cache_enabled, bool, may_be_none=False)
+        check_type(self._cache_ttl, (int, float), may_be_none=False)
+        check_type(self._conditional_requests, bool, may_be_none=False)
+        check_type(self._compress_requests, bool, may_be_none=False)
         check_type(self._wait_on_rate_limit, bool)
         check_type(self._uses_api_gateway, (bool, basestring), may_be_none=False)
         check_type(self._uses_csrf_token, (bool, basestring), may_be_none=False)
@@ -1432,6 +1579,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session_ers = RestSession(
                 get_access_token=self._get_access_token,
@@ -1444,6 +1596,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session = self._session_ers
             self._session_mnt = RestSession(
@@ -1459,6 +1616,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session_px_grid = RestSession(
                 get_access_token=self._get_access_token,
@@ -1471,6 +1633,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
         else:
             self._session_ui = RestSession(
@@ -1484,6 +1651,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session_ers = RestSession(
                 get_access_token=self._get_access_token,
@@ -1496,6 +1668,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session = self._session_ers
             self._session_mnt = RestSession(
@@ -1511,6 +1688,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
             self._session_px_grid = RestSession(
                 get_access_token=self._get_access_token,
@@ -1523,6 +1705,11 @@ class IdentityServicesEngineAPI(object):
                 debug=self._debug,
                 uses_csrf_token=self._uses_csrf_token,
                 get_csrf_token=self._get_csrf_token,
+                connection_pool_size=self._connection_pool_size,
+                transport=self._transport,
+                thread_local_sessions=self._thread_local_sessions,
+                max_retries=self._max_retries,
+                pool_block=self._pool_block,
             )
 
     def _initialize_api_wrappers(self):
@@ -1563,7 +1750,11 @@ class IdentityServicesEngineAPI(object):
                 )
             self.byod_portal = \
                 ByodPortal_v3_1_0(
-                    self._session_ers, self.object_factory, self._validator
+                    self._session_ers, self.object_factory, self._validator,
+                    cache_enabled=self._cache_enabled,
+                    cache_ttl=self._cache_ttl,
+                    conditional_requests=self._conditional_requests,
+                    compress_requests=self._compress_requests,
                 )
             self.backup_and_restore = \
                 BackupAndRestore_v3_1_0(
@@ -1743,7 +1934,10 @@ class IdentityServicesEngineAPI(object):
                 )
             self.network_access_conditions = \
                 NetworkAccessConditions_v3_1_0(
-                    self._session_ui, self.object_factory, self._validator
+                    self._session_ui, self.object_factory, self._validator,
+                    cache_enabled=self._cache_enabled,
+                    cache_ttl=self._cache_ttl,
+                    conditional_requests=self._conditional_requests,
                 )
             self.network_access_dictionary = \
                 NetworkAccessDictionary_v3_1_0(
@@ -2983,12 +3177,21 @@ class IdentityServicesEngineAPI(object):
                 VnVlanMapping_v3_1_patch_1(
                     self._session_ui, self.object_factory, self._validator
                 )
+        self.byod_portal_async = None
+        self.network_access_conditions_async = None
+        if self._use_async and self._version == '3.1.0':
+            self.byod_portal_async = \
+                AsyncByodPortal_v3_1_0(self.byod_portal)
+            self.network_access_conditions_async = \
+                AsyncNetworkAccessConditions_v3_1_0(self.network_access_conditions)
         self.custom_caller = \
             CustomCaller(self._session, self.object_factory)
 
     def _not_initialize_api_wrappers(self):
         """Function used when perform_initialize is False in class init.
         Defines the top-level properties as None."""
+        self.byod_portal_async = None
+        self.network_access_conditions_async = None
         self.aci_bindings = None
         self.aci_settings = None
         self.active_directory = None
@@ -3148,6 +3351,56 @@ class IdentityServicesEngineAPI(object):
         """Utility object that provides authentication method."""
         return self._authentication
 
+    @property
+    def connection_pool_size(self):
+        """The number of keep-alive connections each RESTful session keeps per host."""
+        return self._connection_pool_size
+
+    @property
+    def transport(self):
+        """The HTTP version used by the RESTful sessions, 'h1' or 'h2'."""
+        return self._transport
+
+    @property
+    def thread_local_sessions(self):
+        """Whether every thread of the RESTful sessions uses its own `requests` session."""
+        return self._thread_local_sessions
+
+    @property
+    def max_retries(self):
+        """The number of times the RESTful sessions retry an idempotent request."""
+        return self._max_retries
+
+    @property
+    def pool_block(self):
+        """Whether the RESTful sessions wait for a pooled connection when all are in use."""
+        return self._pool_block
+
+    @property
+    def cache_enabled(self):
+        """Whether the wrappers that support it keep their GET responses."""
+        return self._cache_enabled
+
+    @property
+    def cache_ttl(self):
+        """The seconds a cached response, or a remembered ETag, stays fresh."""
+        return self._cache_ttl
+
+    @property
+    def conditional_requests(self):
+        """Whether the wrappers that support it revalidate GET responses with If-None-Match."""
+        return self._conditional_requests
+
+    @property
+    def compress_requests(self):
+        """Whether the wrappers that support it gzip large request bodies."""
+        return self._compress_requests
+
+    @property
+    def use_async(self):
+        """The flag that, if enabled, exposes the asyncio variants of the API wrappers."""
+        return self._use_async
+
     @property
     def perform_initialize(self):
         """The flag that, if enabled, initialized in the constructor all
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Batch, cache and conditional GET helpers shared by the API wrappers.
+
+Copyright (c) 2021 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import copy
+import json
+from builtins import *
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ..exceptions import BatchError
+from ..response_codes import EXPECTED_RESPONSE_CODE, NOT_MODIFIED_RESPONSE_CODE
+
+
+_CONDITIONAL_GET_CODES = EXPECTED_RESPONSE_CODE['GET'] + [NOT_MODIFIED_RESPONSE_CODE]
+
+
+def run_many(calls, max_concurrent):
+    """Run the calls in a thread pool of max_concurrent workers.
+
+    Returns the result of each call, in the order of calls, or raises a
+    BatchError holding the (index, exception) of each failure and the
+    results of the calls that succeeded.
+    """
+    results = [None] * len(calls)
+    errors = []
+    if not calls:
+        return results
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = {
+            executor.submit(call): index
+            for index, call in enumerate(calls)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                errors.append((index, e))
+    if errors:
+        raise BatchError(sorted(errors, key=lambda error: error[0]), results)
+    return results
+
+
+async def gather_many(calls, max_concurrent):
+    """Await the coroutine functions in calls, max_concurrent at a time.
+
+    The asyncio counterpart of `run_many`, with the same results and
+    BatchError.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run(call):
+        async with semaphore:
+            return await call()
+
+    outcomes = await asyncio.gather(*[run(call) for call in calls],
+                                    return_exceptions=True)
+    errors = [(index, outcome) for index, outcome in enumerate(outcomes)
+              if isinstance(outcome, Exception)]
+    if errors:
+        results = [None if isinstance(outcome, Exception) else outcome
+                   for outcome in outcomes]
+        raise BatchError(errors, results)
+    return outcomes
+
+
+class CachedGetMixin(object):
+    """GET requests through the optional response cache and ETags of a wrapper.
+
+    The wrapper provides `_session`, `_object_factory`, and `_cache` and
+    `_etags`, each a ResponseCache or None when the feature is off.
+    """
+
+    __slots__ = ()
+
+    def _get(self, model, endpoint_full_url, _params, _headers,
+             with_custom_headers):
+        if self._etags is not None:
+            return self._get_conditional(model, endpoint_full_url, _params,
+                                         dict(_headers))
+        if self._cache is not None:
+            key = (endpoint_full_url,
+                   json.dumps(_params, sort_keys=True, default=str),
+                   json.dumps(_headers, sort_keys=True, default=str)
+                   if with_custom_headers else None)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        if with_custom_headers:
+            _api_response = self._session.get(endpoint_full_url, params=_params,
+                                              headers=_headers)
+        else:
+            _api_response = self._session.get(endpoint_full_url, params=_params)
+
+        result = self._object_factory(model, _api_response)
+        if self._cache is not None:
+            self._cache.set(key, copy.deepcopy(result))
+        return result
+
+    def _get_conditional(self, model, endpoint_full_url, _params, _headers):
+        # Responses to other headers (Accept, ...) are other representations
+        key = (endpoint_full_url,
+               json.dumps(_params, sort_keys=True, default=str),
+               json.dumps({name: value for name, value in _headers.items()
+                           if name.lower() != 'if-none-match'},
+                          sort_keys=True, default=str))
+        entry = self._etags.get(key)
+        if entry is not None:
+            _headers['If-None-Match'] = entry[0]
+
+        _api_response = self._session.get(endpoint_full_url, params=_params,
+                                          headers=_headers,
+                                          erc=_CONDITIONAL_GET_CODES)
+        if _api_response.status_code == NOT_MODIFIED_RESPONSE_CODE:
+            if entry is None:
+                # The caller sent their own If-None-Match, there is no body
+                return _api_response
+            # Storing it again restarts its TTL
+            self._etags.set(key, entry)
+            return copy.deepcopy(entry[1])
+
+        etag = None
+        for name, value in _api_response.headers.items():
+            if name.lower() == 'etag':
+                etag = value
+        result = self._object_factory(model, _api_response)
+        if etag:
+            self._etags.set(key, (etag, copy.deepcopy(result)))
+        return result
+
+    def _clear_caches(self):
+        if self._cache is not None:
+            self._cache.clear()
+        if self._etags is not None:
+            self._etags.clear()
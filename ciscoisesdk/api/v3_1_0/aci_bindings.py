@@ -88,6 +88,8 @@ class AciBindings(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AciBindings
         object with the provided RestSession.
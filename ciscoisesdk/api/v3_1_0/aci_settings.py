@@ -116,6 +116,8 @@ class AciSettings(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AciSettings
         object with the provided RestSession.
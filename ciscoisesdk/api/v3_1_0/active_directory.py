@@ -29,6 +29,7 @@ from builtins import *
 
 from past.builtins import basestring
 
+from ...environment import get_env_skip_checks
 from ...pagination import get_next_page
 from ...restsession import RestSession
 from ...utils import (
@@ -36,8 +37,29 @@ from ...utils import (
     check_type,
     dict_from_items_with_values,
     dict_of_str,
+    skip_check_type,
 )
 
+if get_env_skip_checks():
+    check_type = skip_check_type
+
+_ACTIVE_DIRECTORY_URL = '/ers/config/activedirectory'
+_VERSION_INFO_URL = '/ers/config/activedirectory/versioninfo'
+
+# Request senders keyed by (is_xml_payload, with_custom_headers).
+_SEND_PUT = {
+    (False, False): lambda s, u, p, h, b: s.put(u, params=p, json=b),
+    (False, True): lambda s, u, p, h, b: s.put(u, params=p, headers=h, json=b),
+    (True, False): lambda s, u, p, h, b: s.put(u, params=p, data=b),
+    (True, True): lambda s, u, p, h, b: s.put(u, params=p, headers=h, data=b),
+}
+_SEND_POST = {
+    (False, False): lambda s, u, p, h, b: s.post(u, params=p, json=b),
+    (False, True): lambda s, u, p, h, b: s.post(u, params=p, headers=h, json=b),
+    (True, False): lambda s, u, p, h, b: s.post(u, params=p, data=b),
+    (True, True): lambda s, u, p, h, b: s.post(u, params=p, headers=h, data=b),
+}
+
 
 class ActiveDirectory(object):
     """Identity Services Engine ActiveDirectory API (version: 3.1.0).
@@ -177,6 +199,12 @@ class ActiveDirectory(object):
 
     """
 
+    __slots__ = (
+        '_session',
+        '_object_factory',
+        '_request_validator',
+    )
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new ActiveDirectory
         object with the provided RestSession.
@@ -189,7 +217,8 @@ class ActiveDirectory(object):
             TypeError: If the parameter types are incorrect.
 
         """
-        check_type(session, RestSession)
+        if __debug__:
+            check_type(session, RestSession)
 
         super(ActiveDirectory, self).__init__()
 
@@ -225,29 +254,30 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
         if headers:
             _headers.update(dict_of_str(headers))
             with_custom_headers = True
-        check_type(name, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(name, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -268,19 +298,7 @@ class ActiveDirectory(object):
 
         return self._object_factory('bpm_c6be021c4ca59e48c97afe218219bb1_v3_1_0', _api_response)
 
-    def get_by_name(self,
-                    name,
-                    headers=None,
-                    **query_parameters):
-        """Alias for `get_active_directory_by_name <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.get_active_directory_by_name>`_
-        """
-        return self.get_active_directory_by_name(
-            name=name,
-            headers=headers,
-            **query_parameters
-        )
+    get_by_name = get_active_directory_by_name
 
     def get_user_groups(self,
                         id,
@@ -320,21 +338,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -346,8 +364,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -376,15 +395,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/getUserGroups')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_b839d4dee9b958e48ccef056603e253f_v3_1_0', _api_response)
 
@@ -457,21 +470,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -483,8 +496,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -529,15 +543,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/addGroups')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_b05e80058df96e685baa727d578_v3_1_0', _api_response)
 
@@ -579,21 +587,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -605,8 +613,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -635,15 +644,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/leave')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_e84541805d1da1fa3d4d581102a9_v3_1_0', _api_response)
 
@@ -684,21 +687,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -710,8 +713,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -740,15 +744,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/isUserMemberOf')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_eae60ece5110590e97ddd910e8144ed2_v3_1_0', _api_response)
 
@@ -781,29 +779,30 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
         if headers:
             _headers.update(dict_of_str(headers))
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -863,21 +862,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -889,8 +888,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -919,15 +919,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/joinAllNodes')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_e84705b918955b53afe61fc37911eb8b_v3_1_0', _api_response)
 
@@ -969,21 +963,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -995,8 +989,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -1025,15 +1020,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/leaveAllNodes')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_d011417d18d055ccb864c1dc2ae0456d_v3_1_0', _api_response)
 
@@ -1074,21 +1063,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -1100,8 +1089,9 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -1130,15 +1120,9 @@ class ActiveDirectory(object):
         e_url = ('/ers/config/activedirectory/{id}/getGroupsByDomain')
         endpoint_full_url = apply_path_params(e_url, path_params)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_fd729f50e65695966359b589a1606b_v3_1_0', _api_response)
 
@@ -1171,29 +1155,30 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
         if headers:
             _headers.update(dict_of_str(headers))
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
@@ -1214,19 +1199,7 @@ class ActiveDirectory(object):
 
         return self._object_factory('bpm_cfcc7615d0492e2dd1b04dd03a9_v3_1_0', _api_response)
 
-    def get_by_id(self,
-                  id,
-                  headers=None,
-                  **query_parameters):
-        """Alias for `get_active_directory_by_id <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.get_active_directory_by_id>`_
-        """
-        return self.get_active_directory_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+    get_by_id = get_active_directory_by_id
 
     def delete_active_directory_by_id(self,
                                       id,
@@ -1256,41 +1229,37 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
         if headers:
             _headers.update(dict_of_str(headers))
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
         _params.update(query_parameters)
         _params = dict_from_items_with_values(_params)
 
-        path_params = {
-            'id': id,
-        }
-
-        e_url = ('/ers/config/activedirectory/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = '{}/{}'.format(_ACTIVE_DIRECTORY_URL, id)
         if with_custom_headers:
             _api_response = self._session.delete(endpoint_full_url, params=_params,
                                                  headers=_headers)
@@ -1299,19 +1268,7 @@ class ActiveDirectory(object):
 
         return self._object_factory('bpm_febbe79ed5bb780d97a98f292b606_v3_1_0', _api_response)
 
-    def delete_by_id(self,
-                     id,
-                     headers=None,
-                     **query_parameters):
-        """Alias for `delete_active_directory_by_id <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.delete_active_directory_by_id>`_
-        """
-        return self.delete_active_directory_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+    delete_by_id = delete_active_directory_by_id
 
     def join_domain(self,
                     id,
@@ -1350,21 +1307,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -1376,17 +1333,15 @@ class ActiveDirectory(object):
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
         _params = {
         }
         _params.update(query_parameters)
         _params = dict_from_items_with_values(_params)
 
-        path_params = {
-            'id': id,
-        }
         if is_xml_payload:
             _payload = payload
         else:
@@ -1403,18 +1358,11 @@ class ActiveDirectory(object):
             self._request_validator('jsd_b3284240745e5b929c51495fe80bc1c4_v3_1_0')\
                 .validate(_payload)
 
-        e_url = ('/ers/config/activedirectory/{id}/join')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = '{}/{}/join'.format(_ACTIVE_DIRECTORY_URL, id)
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              headers=_headers,
-                                              **request_params)
-
-        else:
-            _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+        send = _SEND_PUT[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_b3284240745e5b929c51495fe80bc1c4_v3_1_0', _api_response)
 
@@ -1450,29 +1398,30 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
         if headers:
             _headers.update(dict_of_str(headers))
             with_custom_headers = True
-        check_type(page, (int, basestring, list))
-        check_type(size, (int, basestring, list))
+        if __debug__:
+            check_type(page, (int, basestring, list))
+            check_type(size, (int, basestring, list))
 
         _params = {
             'page':
@@ -1483,11 +1432,7 @@ class ActiveDirectory(object):
         _params.update(query_parameters)
         _params = dict_from_items_with_values(_params)
 
-        path_params = {
-        }
-
-        e_url = ('/ers/config/activedirectory')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _ACTIVE_DIRECTORY_URL
         if with_custom_headers:
             _api_response = self._session.get(endpoint_full_url, params=_params,
                                               headers=_headers)
@@ -1496,21 +1441,7 @@ class ActiveDirectory(object):
 
         return self._object_factory('bpm_c8dbec9679d453f78cb47d894c507a7b_v3_1_0', _api_response)
 
-    def get_all(self,
-                page=None,
-                size=None,
-                headers=None,
-                **query_parameters):
-        """Alias for `get_active_directory <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.get_active_directory>`_
-        """
-        return self.get_active_directory(
-            page=page,
-            size=size,
-            headers=headers,
-            **query_parameters
-        )
+    get_all = get_active_directory
 
     def get_active_directory_generator(self,
                                        page=None,
@@ -1556,24 +1487,7 @@ class ActiveDirectory(object):
             access_next_list=["SearchResult", "nextPage", "href"],
             access_resource_list=["SearchResult", "resources"])
 
-    def get_all_generator(self,
-                          page=None,
-                          size=None,
-                          headers=None,
-                          **query_parameters):
-        """Alias for `get_active_directory_generator <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.get_active_directory_generator>`_
-        """
-        yield from get_next_page(
-            self.get_active_directory, dict(
-                page=page,
-                size=size,
-                headers=headers,
-                **query_parameters
-            ),
-            access_next_list=["SearchResult", "nextPage", "href"],
-            access_resource_list=["SearchResult", "resources"])
+    get_all_generator = get_active_directory_generator
 
     def create_active_directory(self,
                                 ad_attributes=None,
@@ -1642,21 +1556,21 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
+                if 'ERS-Media-Type' in headers:
+                    check_type(headers.get('ERS-Media-Type'),
+                               basestring)
+                if 'X-CSRF-Token' in headers:
+                    check_type(headers.get('X-CSRF-Token'),
+                               basestring)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -1674,8 +1588,6 @@ class ActiveDirectory(object):
         _params.update(query_parameters)
         _params = dict_from_items_with_values(_params)
 
-        path_params = {
-        }
         if is_xml_payload:
             _payload = payload
         else:
@@ -1708,53 +1620,15 @@ class ActiveDirectory(object):
             self._request_validator('jsd_e9318040a456978757d7abfa3e66b1_v3_1_0')\
                 .validate(_payload)
 
-        e_url = ('/ers/config/activedirectory')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _ACTIVE_DIRECTORY_URL
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
-        if with_custom_headers:
-            _api_response = self._session.post(endpoint_full_url, params=_params,
-                                               headers=_headers,
-                                               **request_params)
-        else:
-            _api_response = self._session.post(endpoint_full_url, params=_params,
-                                               **request_params)
+        send = _SEND_POST[(is_xml_payload, with_custom_headers)]
+        _api_response = send(self._session, endpoint_full_url, _params,
+                             _headers, _payload)
 
         return self._object_factory('bpm_e9318040a456978757d7abfa3e66b1_v3_1_0', _api_response)
 
-    def create(self,
-               ad_attributes=None,
-               ad_scopes_names=None,
-               adgroups=None,
-               advanced_settings=None,
-               description=None,
-               domain=None,
-               enable_domain_white_list=None,
-               id=None,
-               name=None,
-               headers=None,
-               payload=None,
-               active_validation=True,
-               **query_parameters):
-        """Alias for `create_active_directory <#ciscoisesdk.
-        api.v3_1_0.active_directory.
-        ActiveDirectory.create_active_directory>`_
-        """
-        return self.create_active_directory(
-            ad_attributes=ad_attributes,
-            ad_scopes_names=ad_scopes_names,
-            adgroups=adgroups,
-            advanced_settings=advanced_settings,
-            description=description,
-            domain=domain,
-            enable_domain_white_list=enable_domain_white_list,
-            id=id,
-            name=name,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+    create = create_active_directory
 
     def get_version(self,
                     headers=None,
@@ -1783,15 +1657,15 @@ class ActiveDirectory(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
+        if __debug__:
+            check_type(headers, dict)
+            if headers is not None:
+                if 'Content-Type' in headers:
+                    check_type(headers.get('Content-Type'),
+                               basestring, may_be_none=False)
+                if 'Accept' in headers:
+                    check_type(headers.get('Accept'),
+                               basestring, may_be_none=False)
 
         with_custom_headers = False
         _headers = self._session.headers or {}
@@ -1804,11 +1678,7 @@ class ActiveDirectory(object):
         _params.update(query_parameters)
         _params = dict_from_items_with_values(_params)
 
-        path_params = {
-        }
-
-        e_url = ('/ers/config/activedirectory/versioninfo')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _VERSION_INFO_URL
         if with_custom_headers:
             _api_response = self._session.get(endpoint_full_url, params=_params,
                                               headers=_headers)
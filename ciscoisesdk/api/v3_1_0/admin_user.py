@@ -96,6 +96,8 @@ class AdminUser(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AdminUser
         object with the provided RestSession.
@@ -244,6 +244,8 @@ class AllowedProtocols(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AllowedProtocols
         object with the provided RestSession.
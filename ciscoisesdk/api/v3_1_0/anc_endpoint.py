@@ -91,6 +91,8 @@ class AncEndpoint(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AncEndpoint
         object with the provided RestSession.
@@ -77,6 +77,8 @@ class AncPolicy(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AncPolicy
         object with the provided RestSession.
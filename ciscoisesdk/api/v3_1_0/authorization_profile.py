@@ -162,6 +162,8 @@ class AuthorizationProfile(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new AuthorizationProfile
         object with the provided RestSession.
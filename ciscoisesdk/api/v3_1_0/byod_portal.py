@@ -25,21 +25,156 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import base64
+import functools
+import gzip
 from builtins import *
+from urllib.parse import quote
 
 from past.builtins import basestring
+from requests.structures import CaseInsensitiveDict
 
-from ...pagination import get_next_page
+from ...environment import get_env_skip_checks
+from ...exceptions import MalformedRequest
+from ...pagination import get_next_page, get_next_page_prefetch
+from ...response_cache import ResponseCache
 from ...restsession import RestSession
 from ...utils import (
-    apply_path_params,
     check_type,
+    check_types,
     dict_from_items_with_values,
     dict_of_str,
+    json_dumps,
+    skip_check_type,
+    skip_check_types,
 )
-
-
-class ByodPortal(object):
+from .._helpers import CachedGetMixin, run_many
+
+if get_env_skip_checks():
+    check_type = skip_check_type
+    check_types = skip_check_types
+
+_BYOD_PORTAL_URL = '/ers/config/byodportal'
+_BYOD_PORTAL_ID_URL = _BYOD_PORTAL_URL + '/'
+_VERSION_INFO_URL = '/ers/config/byodportal/versioninfo'
+# The request body envelope is fixed, only the portal object is serialized.
+_ENVELOPE_PREFIX = b'{"BYODPortal":'
+_ENVELOPE_SUFFIX = b'}'
+
+# Smaller request bodies are sent uncompressed, gzip would barely shrink them.
+COMPRESS_MIN_BODY_SIZE = 2048
+
+# Argument type checks as (acceptable_types, may_be_none) pairs, built once.
+_ID_TYPES = (((basestring,), False),)
+_GET_BYOD_PORTAL_TYPES = (
+    ((int, basestring, list), True),
+    ((int, basestring, list), True),
+    ((basestring,), True),
+    ((basestring,), True),
+    ((basestring, list, set, tuple), True),
+    ((basestring,), True),
+)
+# Allowed values of the enumerated BYODPortal fields.
+_PORTAL_TYPES = frozenset((
+    'BYOD', 'HOTSPOTGUEST', 'MYDEVICE', 'SELFREGGUEST', 'SPONSOR',
+    'SPONSOREDGUEST',
+))
+_ALLOWED_INTERFACES = frozenset((
+    'eth0', 'eth1', 'eth2', 'eth3', 'eth4', 'eth5', 'bond0', 'bond1', 'bond2',
+))
+_DISPLAY_LANGS = frozenset(('USEBROWSERLOCALE', 'ALWAYSUSE'))
+_AUP_DISPLAYS = frozenset(('ONPAGE', 'ASLINK'))
+_VERSION_HEADER_TYPES = {
+    'Content-Type': ((basestring,), False),
+    'Accept': ((basestring,), False),
+}
+_HEADER_TYPES = dict(_VERSION_HEADER_TYPES, **{
+    'ERS-Media-Type': ((basestring,), True),
+    'X-CSRF-Token': ((basestring,), True),
+})
+
+
+def _check_enum(name, values, allowed):
+    for value in values:
+        if value is not None and value not in allowed:
+            raise MalformedRequest(
+                '{} must be one of {}, received: {}'.format(
+                    name, ', '.join(sorted(allowed)), value)
+            )
+
+
+def _check_enums(portal):
+    """Check the enumerated fields of a BYODPortal request body."""
+    settings = portal.get('settings') or {}
+    portal_settings = settings.get('portalSettings') or {}
+    welcome_settings = (settings.get('byodSettings') or {}).get('byodWelcomeSettings') or {}
+    _check_enum('portalType', (portal.get('portalType'),), _PORTAL_TYPES)
+    _check_enum('allowedInterfaces', portal_settings.get('allowedInterfaces') or (),
+                _ALLOWED_INTERFACES)
+    _check_enum('displayLang', (portal_settings.get('displayLang'),), _DISPLAY_LANGS)
+    _check_enum('aupDisplay', (welcome_settings.get('aupDisplay'),), _AUP_DISPLAYS)
+
+
+def _flatten(item, prefix=''):
+    for key, value in item.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, prefix + key + '_')
+        else:
+            yield prefix + key, value
+
+
+# Multiple of 3, so the base64 of each chunk has no padding
+_BASE64_CHUNK_SIZE = 3 * 1024
+_IMAGE_CUSTOMIZATIONS = ('mobileLogoImage', 'desktopLogoImage', 'bannerImage',
+                         'backgroundImage')
+
+
+def _encode_binary(value):
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode('ascii')
+    if hasattr(value, 'read'):
+        chunks = iter(functools.partial(value.read, _BASE64_CHUNK_SIZE), b'')
+        return ''.join(base64.b64encode(chunk).decode('ascii') for chunk in chunks)
+    return value
+
+
+def _encode_customizations(customizations):
+    """Return customizations with its binary theme and image data base64
+    encoded. The dictionaries of the caller are left unchanged."""
+    theme = customizations.get('portalTheme')
+    if isinstance(theme, dict) and 'themeData' in theme:
+        customizations = dict(customizations)
+        customizations['portalTheme'] = dict(theme, themeData=_encode_binary(theme['themeData']))
+    global_customizations = customizations.get('globalCustomizations')
+    if isinstance(global_customizations, dict):
+        global_customizations = dict(global_customizations)
+        for name in _IMAGE_CUSTOMIZATIONS:
+            image = global_customizations.get(name)
+            if isinstance(image, dict) and 'data' in image:
+                global_customizations[name] = dict(image, data=_encode_binary(image['data']))
+        customizations = dict(customizations, globalCustomizations=global_customizations)
+    return customizations
+
+
+def _check_headers(headers, header_types):
+    if headers is None:
+        return
+    check_type(headers, dict)
+    if headers:
+        # Callers send a few headers, so look each one up instead of
+        # probing for every known header name.
+        for name, value in headers.items():
+            header_type = header_types.get(name)
+            if header_type is None:
+                continue
+            acceptable_types, may_be_none = header_type
+            if isinstance(value, acceptable_types) \
+                    or (value is None and may_be_none):
+                continue
+            check_type(value, acceptable_types, may_be_none=may_be_none)
+
+
+class ByodPortal(CachedGetMixin):
     """Identity Services Engine BYODPortal API (version: 3.1.0).
 
     Wraps the Identity Services Engine BYODPortal
@@ -198,25 +333,80 @@ class ByodPortal(object):
 
     """
 
-    def __init__(self, session, object_factory, request_validator):
+    __slots__ = (
+        '_session',
+        '_object_factory',
+        '_request_validator',
+        '_validate_update',
+        '_validate_create',
+        '_cache',
+        '_etags',
+        '_compress_requests',
+    )
+
+    def __init__(self, session, object_factory, request_validator,
+                 cache_enabled=False, cache_ttl=60,
+                 conditional_requests=False, compress_requests=False):
         """Initialize a new ByodPortal
         object with the provided RestSession.
 
         Args:
             session(RestSession): The RESTful session object to be used for
                 API calls to the Identity Services Engine service.
+            cache_enabled(bool): Keep the responses of the GET methods in
+                memory and return a copy of them while they are fresh.
+                Creating, updating or deleting a portal empties the cache.
+                Defaults to False.
+            cache_ttl(int,float): Seconds a cached response stays fresh.
+                Defaults to 60.
+            conditional_requests(bool): Remember the ETag of the GET
+                responses, per URL and query parameters, and send it back as
+                If-None-Match, returning the remembered response when the
+                server answers 304 Not Modified. Entries unused for
+                cache_ttl seconds are dropped.
+                Defaults to False.
+            compress_requests(bool): Gzip the JSON bodies of the create and
+                update requests that are larger than COMPRESS_MIN_BODY_SIZE
+                bytes, for servers that accept `Content-Encoding: gzip`.
+                Defaults to False.
 
         Raises:
             TypeError: If the parameter types are incorrect.
 
         """
-        check_type(session, RestSession)
+        if __debug__:
+            check_type(session, RestSession)
+            check_type(cache_enabled, bool, may_be_none=False)
+            check_type(conditional_requests, bool, may_be_none=False)
+            check_type(compress_requests, bool, may_be_none=False)
 
         super(ByodPortal, self).__init__()
 
         self._session = session
         self._object_factory = object_factory
         self._request_validator = request_validator
+        # Resolved once, both are used on every create and update
+        self._validate_update = request_validator(
+            'jsd_e38d10b1ea257d49ebce893e87b3419_v3_1_0').validate
+        self._validate_create = request_validator(
+            'jsd_afcce33ec863567f94f3b9b73719ff8d_v3_1_0').validate
+        self._cache = ResponseCache(ttl=cache_ttl) if cache_enabled else None
+        self._etags = ResponseCache(ttl=cache_ttl) if conditional_requests else None
+        self._compress_requests = compress_requests
+
+    def _json_body(self, _payload, _headers, validate=None):
+        if validate is not None:
+            validate(_payload)
+            _check_enums(_payload.get('BYODPortal') or {})
+        if len(_payload) == 1 and 'BYODPortal' in _payload:
+            body = _ENVELOPE_PREFIX + json_dumps(_payload['BYODPortal']) \
+                + _ENVELOPE_SUFFIX
+        else:
+            body = json_dumps(_payload)
+        if self._compress_requests and len(body) > COMPRESS_MIN_BODY_SIZE:
+            _headers['Content-Encoding'] = 'gzip'
+            body = gzip.compress(body, compresslevel=1)
+        return body
 
     def get_byod_portal_by_id(self,
                               id,
@@ -225,7 +415,8 @@ class ByodPortal(object):
         """This API allows the client to get a BYOD portal by ID.
 
         Args:
-            id(basestring): id path parameter. Portal id.
+            id(basestring): id path parameter. Portal id. It is
+                percent-encoded into the URL, so pass it unencoded.
             headers(dict): Dictionary of HTTP Headers to send with the Request
                 .
             **query_parameters: Additional query parameters (provides
@@ -246,62 +437,78 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_types((id,), _ID_TYPES)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'id': id,
-        }
+        return self._get_byod_portal_by_id(id, _params, _headers, with_custom_headers)
 
-        e_url = ('/ers/config/byodportal/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+    def _get_byod_portal_by_id(self, id, _params, _headers, with_custom_headers):
+        # The arguments have already been checked
+        endpoint_full_url = _BYOD_PORTAL_ID_URL + quote(id, safe='')
+        return self._get('bpm_effdf30a3e3a5781ba1f5cf833395359_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-        return self._object_factory('bpm_effdf30a3e3a5781ba1f5cf833395359_v3_1_0', _api_response)
+    def get_byod_portal_by_id_many(self,
+                                   ids,
+                                   headers=None,
+                                   max_concurrent=8,
+                                   **query_parameters):
+        """Gets several BYOD portals by ID concurrently.
 
-    def get_by_id(self,
-                  id,
-                  headers=None,
-                  **query_parameters):
-        """Alias for `get_byod_portal_by_id <#ciscoisesdk.
+        The ids and headers are checked once for the whole batch rather
+        than once per request, see `get_byod_portal_by_id <#ciscoisesdk.
         api.v3_1_0.byod_portal.
-        ByodPortal.get_byod_portal_by_id>`_
+        ByodPortal.get_byod_portal_by_id>`_.
+
+        Args:
+            ids(list): The portal ids, as strings.
+            headers(dict): Dictionary of HTTP Headers to send with every
+                Request.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 8.
+            **query_parameters: Additional query parameters (provides
+                support for parameters that may be added in the future).
+
+        Returns:
+            list: The RestResponse of each id, in the order of ids.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the requests fails. Its errors property
+                holds the (index, exception) of each failure, and its
+                results property the responses of the other ids.
         """
-        return self.get_byod_portal_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_type(ids, (list, tuple), may_be_none=False)
+            check_types(ids, _ID_TYPES * len(ids))
+            check_type(max_concurrent, int, may_be_none=False)
+            _check_headers(headers, _HEADER_TYPES)
+
+        with_custom_headers = False
+        _headers = {}
+        if headers:
+            _headers = dict_of_str(headers)
+            with_custom_headers = True
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
+
+        return run_many([functools.partial(self._get_byod_portal_by_id, id,
+                                            _params, _headers, with_custom_headers)
+                          for id in ids], max_concurrent)
+
+    get_by_id = get_byod_portal_by_id
 
     def update_byod_portal_by_id(self,
                                  id,
@@ -320,7 +527,9 @@ class ByodPortal(object):
         Args:
             customizations(object): Defines all of the Portal
                 Customizations available for a BYOD,
-                property of the request body.
+                property of the request body. The theme data and image
+                data may be given as bytes or binary file objects, they
+                are base64 encoded for the request.
             description(string): description, property of the
                 request body.
             id(string): Resource UUID, mandatory for update,
@@ -337,7 +546,8 @@ class ByodPortal(object):
             settings(object): Defines all of the settings groups
                 available for a BYOD, property of the
                 request body.
-            id(basestring): id path parameter. Portal id.
+            id(basestring): id path parameter. Portal id. It is
+                percent-encoded into the URL, so pass it unencoded.
             headers(dict): Dictionary of HTTP Headers to send with the Request
                 .
             payload(dict): A JSON serializable Python object to send in the
@@ -362,115 +572,70 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # Header names are case-insensitive, as in the session headers
+            _headers = CaseInsensitiveDict(dict_of_str(headers))
             with_custom_headers = True
-        is_xml_payload = 'application/xml' in _headers.get('Content-Type', [])
+        _content_type = _headers.get('Content-Type') \
+            or self._session.get_header('Content-Type')
+        is_xml_payload = _content_type is not None \
+            and _content_type.startswith('application/xml')
         if active_validation and is_xml_payload:
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_types((id,), _ID_TYPES)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'id': id,
-        }
         if is_xml_payload:
             _payload = payload
         else:
-            _tmp_payload = {
-                'id':
-                    id,
-                'name':
-                    name,
-                'description':
-                    description,
-                'portalType':
-                    portal_type,
-                'portalTestUrl':
-                    portal_test_url,
-                'settings':
-                    settings,
-                'customizations':
-                    customizations,
-            }
+            if customizations:
+                customizations = _encode_customizations(customizations)
+            _fields = (
+                ('id', id),
+                ('name', name),
+                ('description', description),
+                ('portalType', portal_type),
+                ('portalTestUrl', portal_test_url),
+                ('settings', settings),
+                ('customizations', customizations),
+            )
             _payload = {
-                'BYODPortal': dict_from_items_with_values(_tmp_payload)
+                'BYODPortal': {k: v for k, v in _fields if v is not None}
             }
-            _payload.update(payload or {})
-            _payload = dict_from_items_with_values(_payload)
-        if active_validation and not is_xml_payload:
-            self._request_validator('jsd_e38d10b1ea257d49ebce893e87b3419_v3_1_0')\
-                .validate(_payload)
+            if payload:
+                _payload.update((k, v) for k, v in payload.items()
+                                if v is not None)
 
-        e_url = ('/ers/config/byodportal/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _BYOD_PORTAL_ID_URL + quote(id, safe='')
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
+        if is_xml_payload:
+            _data = _payload
+        else:
+            _data = self._json_body(_payload, _headers,
+                                    self._validate_update if active_validation else None)
+            with_custom_headers = with_custom_headers or 'Content-Encoding' in _headers
         if with_custom_headers:
             _api_response = self._session.put(endpoint_full_url, params=_params,
                                               headers=_headers,
-                                              **request_params)
-
+                                              data=_data)
         else:
             _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+                                              data=_data)
 
+        self._clear_caches()
         return self._object_factory('bpm_e38d10b1ea257d49ebce893e87b3419_v3_1_0', _api_response)
 
-    def update_by_id(self,
-                     id,
-                     customizations=None,
-                     description=None,
-                     name=None,
-                     portal_test_url=None,
-                     portal_type=None,
-                     settings=None,
-                     headers=None,
-                     payload=None,
-                     active_validation=True,
-                     **query_parameters):
-        """Alias for `update_byod_portal_by_id <#ciscoisesdk.
-        api.v3_1_0.byod_portal.
-        ByodPortal.update_byod_portal_by_id>`_
-        """
-        return self.update_byod_portal_by_id(
-            id=id,
-            customizations=customizations,
-            description=description,
-            name=name,
-            portal_test_url=portal_test_url,
-            portal_type=portal_type,
-            settings=settings,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+    update_by_id = update_byod_portal_by_id
 
     def delete_byod_portal_by_id(self,
                                  id,
@@ -479,7 +644,8 @@ class ByodPortal(object):
         """This API deletes a BYOD portal by ID.
 
         Args:
-            id(basestring): id path parameter. Portal id.
+            id(basestring): id path parameter. Portal id. It is
+                percent-encoded into the URL, so pass it unencoded.
             headers(dict): Dictionary of HTTP Headers to send with the Request
                 .
             **query_parameters: Additional query parameters (provides
@@ -500,62 +666,85 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_types((id,), _ID_TYPES)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'id': id,
-        }
+        return self._delete_byod_portal_by_id(id, _params, _headers, with_custom_headers)
 
-        e_url = ('/ers/config/byodportal/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+    def _delete_byod_portal_by_id(self, id, _params, _headers, with_custom_headers):
+        # The arguments have already been checked
+        endpoint_full_url = _BYOD_PORTAL_ID_URL + quote(id, safe='')
         if with_custom_headers:
             _api_response = self._session.delete(endpoint_full_url, params=_params,
                                                  headers=_headers)
         else:
             _api_response = self._session.delete(endpoint_full_url, params=_params)
 
+        self._clear_caches()
         return self._object_factory('bpm_df2fb34fbab65254ac87d1be50abd15f_v3_1_0', _api_response)
 
-    def delete_by_id(self,
-                     id,
-                     headers=None,
-                     **query_parameters):
-        """Alias for `delete_byod_portal_by_id <#ciscoisesdk.
+    def delete_byod_portal_by_id_many(self,
+                                      ids,
+                                      headers=None,
+                                      max_concurrent=8,
+                                      **query_parameters):
+        """Deletes several BYOD portals by ID concurrently.
+
+        The ids and headers are checked once for the whole batch, see
+        `delete_byod_portal_by_id <#ciscoisesdk.
         api.v3_1_0.byod_portal.
-        ByodPortal.delete_byod_portal_by_id>`_
+        ByodPortal.delete_byod_portal_by_id>`_. With the 'h2' transport the
+        requests are multiplexed over a single connection.
+
+        Args:
+            ids(list): The portal ids, as strings.
+            headers(dict): Dictionary of HTTP Headers to send with every
+                Request.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 8.
+            **query_parameters: Additional query parameters (provides
+                support for parameters that may be added in the future).
+
+        Returns:
+            list: The RestResponse of each id, in the order of ids.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the requests fails. Its errors property
+                holds the (index, exception) of each failure, and its
+                results property the responses of the other ids.
         """
-        return self.delete_byod_portal_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_type(ids, (list, tuple), may_be_none=False)
+            check_types(ids, _ID_TYPES * len(ids))
+            check_type(max_concurrent, int, may_be_none=False)
+            _check_headers(headers, _HEADER_TYPES)
+
+        with_custom_headers = False
+        _headers = {}
+        if headers:
+            _headers = dict_of_str(headers)
+            with_custom_headers = True
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
+
+        return run_many([functools.partial(self._delete_byod_portal_by_id, id,
+                                            _params, _headers, with_custom_headers)
+                          for id in ids], max_concurrent)
+
+    delete_by_id = delete_byod_portal_by_id
 
     def get_byod_portal(self,
                         filter=None,
@@ -632,87 +821,36 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(page, (int, basestring, list))
-        check_type(size, (int, basestring, list))
-        check_type(sortasc, basestring)
-        check_type(sortdsc, basestring)
-        check_type(filter, (basestring, list, set, tuple))
-        check_type(filter_type, basestring)
-
-        _params = {
-            'page':
-                page,
-            'size':
-                size,
-            'sortasc':
-                sortasc,
-            'sortdsc':
-                sortdsc,
-            'filter':
-                filter,
-            'filterType':
-                filter_type,
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
-
-        path_params = {
-        }
-
-        e_url = ('/ers/config/byodportal')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
-
-        return self._object_factory('bpm_a23b580495514394b125800e073c9a_v3_1_0', _api_response)
-
-    def get_all(self,
-                filter=None,
-                filter_type=None,
-                page=None,
-                size=None,
-                sortasc=None,
-                sortdsc=None,
-                headers=None,
-                **query_parameters):
-        """Alias for `get_byod_portal <#ciscoisesdk.
-        api.v3_1_0.byod_portal.
-        ByodPortal.get_byod_portal>`_
-        """
-        return self.get_byod_portal(
-            filter=filter,
-            filter_type=filter_type,
-            page=page,
-            size=size,
-            sortasc=sortasc,
-            sortdsc=sortdsc,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_types((page, size, sortasc, sortdsc, filter, filter_type),
+                        _GET_BYOD_PORTAL_TYPES)
+
+        _params = {k: v for k, v in (
+            ('page', page),
+            ('size', size),
+            ('sortasc', sortasc),
+            ('sortdsc', sortdsc),
+            ('filter', filter),
+            ('filterType', filter_type),
+        ) if v is not None}
+        if query_parameters:
+            _params.update((k, v) for k, v in query_parameters.items()
+                           if v is not None)
+
+        endpoint_full_url = _BYOD_PORTAL_URL
+        return self._get('bpm_a23b580495514394b125800e073c9a_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
+
+    get_all = get_byod_portal
 
     def get_byod_portal_generator(self,
                                   filter=None,
@@ -805,20 +943,41 @@ class ByodPortal(object):
             access_next_list=["SearchResult", "nextPage", "href"],
             access_resource_list=["SearchResult", "resources"])
 
-    def get_all_generator(self,
-                          filter=None,
-                          filter_type=None,
-                          page=None,
-                          size=None,
-                          sortasc=None,
-                          sortdsc=None,
-                          headers=None,
-                          **query_parameters):
-        """Alias for `get_byod_portal_generator <#ciscoisesdk.
+    get_all_generator = get_byod_portal_generator
+
+    def get_byod_portal_prefetch(self,
+                                 filter=None,
+                                 filter_type=None,
+                                 page=None,
+                                 size=None,
+                                 sortasc=None,
+                                 sortdsc=None,
+                                 headers=None,
+                                 workers=4,
+                                 **query_parameters):
+        """Same as `get_byod_portal_generator <#ciscoisesdk.
         api.v3_1_0.byod_portal.
-        ByodPortal.get_byod_portal_generator>`_
+        ByodPortal.get_byod_portal_generator>`_, but once the first page
+        announces the total, the following pages are requested concurrently.
+        The pages are still yielded in order.
+
+        Args:
+            workers(int): Maximum number of pages requested at the same time.
+                Defaults to 4.
+
+        Returns:
+            Generator: A generator object containing the RestResponse objects
+            for all pages.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            MalformedRequest: If the request body created is invalid.
+            ApiError: If the Identity Services Engine cloud returns an error.
         """
-        yield from get_next_page(
+        if __debug__:
+            check_type(workers, int, may_be_none=False)
+
+        yield from get_next_page_prefetch(
             self.get_byod_portal, dict(
                 filter=filter,
                 filter_type=filter_type,
@@ -829,9 +988,141 @@ class ByodPortal(object):
                 headers=headers,
                 **query_parameters
             ),
+            workers=workers,
             access_next_list=["SearchResult", "nextPage", "href"],
             access_resource_list=["SearchResult", "resources"])
 
+    def get_byod_portal_items(self,
+                              filter=None,
+                              filter_type=None,
+                              size=100,
+                              sortasc=None,
+                              sortdsc=None,
+                              headers=None,
+                              **query_parameters):
+        """Yields every BYOD portal of `get_byod_portal <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal>`_, one resource at a time.
+
+        The pages are requested in order until one comes back short or
+        without a next page link, and each page is parsed while it is
+        received when the optional ijson package is installed.
+
+        Args:
+            size(int): Number of objects requested per page. Defaults to 100.
+
+        Returns:
+            Generator: A generator object containing the
+            SearchResult.resources items as MyDict objects.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Identity Services Engine cloud returns an error.
+        """
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
+            check_type(size, int, may_be_none=False)
+            check_types((sortasc, sortdsc, filter, filter_type),
+                        _GET_BYOD_PORTAL_TYPES[2:])
+
+        _headers = dict_of_str(headers) if headers else None
+
+        _params = {k: v for k, v in (
+            ('size', size),
+            ('sortasc', sortasc),
+            ('sortdsc', sortdsc),
+            ('filter', filter),
+            ('filterType', filter_type),
+        ) if v is not None}
+        if query_parameters:
+            _params.update((k, v) for k, v in query_parameters.items()
+                           if v is not None)
+
+        # Bound once, they are used for every item
+        get_items = self._session.get_items
+        object_factory = self._object_factory
+        page = 1
+        while True:
+            _params['page'] = page
+            items = get_items(_BYOD_PORTAL_URL, ['SearchResult', 'resources'],
+                              params=_params, next_path=['SearchResult', 'nextPage', 'href'],
+                              headers=_headers)
+            count = 0
+            while True:
+                try:
+                    item = next(items)
+                except StopIteration as e:
+                    next_page = e.value
+                    break
+                count += 1
+                yield object_factory('bpm_a23b580495514394b125800e073c9a_v3_1_0', item)
+            # The last page has no next page link, even when it is full
+            if count < size or not next_page:
+                return
+            page += 1
+
+    def get_all_byod_portal_columnar(self,
+                                     filter=None,
+                                     filter_type=None,
+                                     size=100,
+                                     sortasc=None,
+                                     sortdsc=None,
+                                     as_dataframe=False,
+                                     headers=None,
+                                     **query_parameters):
+        """Fetches every BYOD portal of `get_byod_portal_items <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal_items>`_ into one list per attribute.
+
+        Nested attributes become columns named after their path, for
+        example `link_href`. A portal lacking an attribute gets None in
+        that column, so every column has one value per portal.
+
+        Args:
+            as_dataframe(bool): Return a pandas.DataFrame built from the
+                columns instead. Requires the optional pandas package.
+                Defaults to False.
+
+        Returns:
+            dict: Column names mapped to lists of values, or a
+            pandas.DataFrame if as_dataframe is True.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ImportError: If as_dataframe is True and pandas is missing.
+            ApiError: If the Identity Services Engine cloud returns an error.
+        """
+        if __debug__:
+            check_type(as_dataframe, bool, may_be_none=False)
+        if as_dataframe:
+            # Imported here, as only this path needs it and it is slow to import
+            try:
+                import pandas
+            except ImportError:
+                raise ImportError("as_dataframe requires the pandas package, "
+                                  "install it with: pip install pandas")
+
+        columns = {}
+        count = 0
+        for item in self.get_byod_portal_items(filter=filter,
+                                               filter_type=filter_type,
+                                               size=size,
+                                               sortasc=sortasc,
+                                               sortdsc=sortdsc,
+                                               headers=headers,
+                                               **query_parameters):
+            row = dict(_flatten(item))
+            for name in row:
+                if name not in columns:
+                    columns[name] = [None] * count
+            for name, values in columns.items():
+                values.append(row.get(name))
+            count += 1
+
+        if as_dataframe:
+            return pandas.DataFrame(columns)
+        return columns
+
     def create_byod_portal(self,
                            customizations=None,
                            description=None,
@@ -849,7 +1140,9 @@ class ByodPortal(object):
         Args:
             customizations(object): Defines all of the Portal
                 Customizations available for a BYOD,
-                property of the request body.
+                property of the request body. The theme data and image
+                data may be given as bytes or binary file objects, they
+                are base64 encoded for the request.
             description(string): description, property of the
                 request body.
             id(string): Resource UUID, mandatory for update,
@@ -890,111 +1183,101 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
-            if 'ERS-Media-Type' in headers:
-                check_type(headers.get('ERS-Media-Type'),
-                           basestring)
-            if 'X-CSRF-Token' in headers:
-                check_type(headers.get('X-CSRF-Token'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers, _HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # Header names are case-insensitive, as in the session headers
+            _headers = CaseInsensitiveDict(dict_of_str(headers))
             with_custom_headers = True
-        is_xml_payload = 'application/xml' in _headers.get('Content-Type', [])
+        _content_type = _headers.get('Content-Type') \
+            or self._session.get_header('Content-Type')
+        is_xml_payload = _content_type is not None \
+            and _content_type.startswith('application/xml')
         if active_validation and is_xml_payload:
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-        }
         if is_xml_payload:
             _payload = payload
         else:
-            _tmp_payload = {
-                'id':
-                    id,
-                'name':
-                    name,
-                'description':
-                    description,
-                'portalType':
-                    portal_type,
-                'portalTestUrl':
-                    portal_test_url,
-                'settings':
-                    settings,
-                'customizations':
-                    customizations,
-            }
+            if customizations:
+                customizations = _encode_customizations(customizations)
+            _fields = (
+                ('id', id),
+                ('name', name),
+                ('description', description),
+                ('portalType', portal_type),
+                ('portalTestUrl', portal_test_url),
+                ('settings', settings),
+                ('customizations', customizations),
+            )
             _payload = {
-                'BYODPortal': dict_from_items_with_values(_tmp_payload)
+                'BYODPortal': {k: v for k, v in _fields if v is not None}
             }
-            _payload.update(payload or {})
-            _payload = dict_from_items_with_values(_payload)
-        if active_validation and not is_xml_payload:
-            self._request_validator('jsd_afcce33ec863567f94f3b9b73719ff8d_v3_1_0')\
-                .validate(_payload)
+            if payload:
+                _payload.update((k, v) for k, v in payload.items()
+                                if v is not None)
 
-        e_url = ('/ers/config/byodportal')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _BYOD_PORTAL_URL
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
+        if is_xml_payload:
+            _data = _payload
+        else:
+            _data = self._json_body(_payload, _headers,
+                                    self._validate_create if active_validation else None)
+            with_custom_headers = with_custom_headers or 'Content-Encoding' in _headers
         if with_custom_headers:
             _api_response = self._session.post(endpoint_full_url, params=_params,
                                                headers=_headers,
-                                               **request_params)
+                                               data=_data)
         else:
             _api_response = self._session.post(endpoint_full_url, params=_params,
-                                               **request_params)
+                                               data=_data)
 
+        self._clear_caches()
         return self._object_factory('bpm_afcce33ec863567f94f3b9b73719ff8d_v3_1_0', _api_response)
 
-    def create(self,
-               customizations=None,
-               description=None,
-               id=None,
-               name=None,
-               portal_test_url=None,
-               portal_type=None,
-               settings=None,
-               headers=None,
-               payload=None,
-               active_validation=True,
-               **query_parameters):
-        """Alias for `create_byod_portal <#ciscoisesdk.
+    create = create_byod_portal
+
+    def create_byod_portal_many(self,
+                                items,
+                                max_concurrent=8):
+        """Creates several BYOD portals concurrently.
+
+        Each item is a dictionary with the keyword arguments of
+        `create_byod_portal <#ciscoisesdk.
         api.v3_1_0.byod_portal.
-        ByodPortal.create_byod_portal>`_
+        ByodPortal.create_byod_portal>`_.
+
+        Args:
+            items(list): The keyword arguments of each portal to create.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 8.
+
+        Returns:
+            list: The RestResponse of each item, in the order of items.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the items fails. Its errors property holds
+                the (index, exception) of each failure, and its results
+                property the responses of the items that were created.
         """
-        return self.create_byod_portal(
-            customizations=customizations,
-            description=description,
-            id=id,
-            name=name,
-            portal_test_url=portal_test_url,
-            portal_type=portal_type,
-            settings=settings,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_type(items, (list, tuple), may_be_none=False)
+            for item in items:
+                check_type(item, dict, may_be_none=False)
+            check_type(max_concurrent, int, may_be_none=False)
+
+        return run_many([functools.partial(self.create_byod_portal, **item)
+                          for item in items], max_concurrent)
 
     def get_version(self,
                     headers=None,
@@ -1023,36 +1306,19 @@ class ByodPortal(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'Content-Type' in headers:
-                check_type(headers.get('Content-Type'),
-                           basestring, may_be_none=False)
-            if 'Accept' in headers:
-                check_type(headers.get('Accept'),
-                           basestring, may_be_none=False)
+        if __debug__:
+            _check_headers(headers, _VERSION_HEADER_TYPES)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
-
-        path_params = {
-        }
-
-        e_url = ('/ers/config/byodportal/versioninfo')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        return self._object_factory('bpm_c5d2d9d8c20b58049cd3326850f2292f_v3_1_0', _api_response)
+        endpoint_full_url = _VERSION_INFO_URL
+        return self._get('bpm_c5d2d9d8c20b58049cd3326850f2292f_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Cisco Identity Services Engine BYODPortal asyncio API wrapper.
+
+Copyright (c) 2021 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import functools
+import urllib.parse
+from builtins import *
+from collections import deque
+
+from ...pagination import get_next_page_number, get_remaining_pages
+from ...utils import check_type
+from .._helpers import gather_many
+from .byod_portal import ByodPortal
+
+
+class AsyncByodPortal(object):
+    """Identity Services Engine BYODPortal API (version: 3.1.0) for asyncio.
+
+    Exposes the methods of `ByodPortal <#ciscoisesdk.
+    api.v3_1_0.byod_portal.ByodPortal>`_ as coroutines, so several
+    calls can be awaited concurrently with `asyncio.gather`.
+
+    Each call runs the synchronous wrapper in an executor, reusing its
+    RestSession, validation and response handling unchanged.
+
+    """
+
+    __slots__ = ('_byod_portal', '_executor')
+
+    def __init__(self, byod_portal, executor=None):
+        """Initialize a new AsyncByodPortal
+        object with the provided ByodPortal.
+
+        Args:
+            byod_portal(ByodPortal): The synchronous API wrapper to be used
+                for API calls to the Identity Services Engine service.
+            executor(concurrent.futures.Executor): The executor that runs the
+                blocking calls. Defaults to the event loop's default
+                executor.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(byod_portal, ByodPortal)
+
+        super(AsyncByodPortal, self).__init__()
+
+        self._byod_portal = byod_portal
+        self._executor = executor
+
+    def _run(self, function, **kwargs):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor,
+                                    functools.partial(function, **kwargs))
+
+    async def get_byod_portal_by_id(self,
+                                    id,
+                                    headers=None,
+                                    **query_parameters):
+        """Coroutine version of `get_byod_portal_by_id <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal_by_id>`_
+        """
+        return await self._run(
+            self._byod_portal.get_byod_portal_by_id,
+            id=id,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_byod_portal_by_id_many(self,
+                                         ids,
+                                         headers=None,
+                                         max_concurrent=16,
+                                         **query_parameters):
+        """Coroutine version of `get_byod_portal_by_id_many <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal_by_id_many>`_
+
+        An asyncio.Semaphore caps the requests in flight to max_concurrent,
+        they share the connection pool of the RestSession.
+        """
+        check_type(ids, (list, tuple), may_be_none=False)
+        check_type(max_concurrent, int, may_be_none=False)
+
+        return await gather_many(
+            [functools.partial(self.get_byod_portal_by_id,
+                               id, headers=headers, **query_parameters)
+             for id in ids],
+            max_concurrent
+        )
+
+    async def update_byod_portal_by_id(self,
+                                       id,
+                                       customizations=None,
+                                       description=None,
+                                       name=None,
+                                       portal_test_url=None,
+                                       portal_type=None,
+                                       settings=None,
+                                       headers=None,
+                                       payload=None,
+                                       active_validation=True,
+                                       **query_parameters):
+        """Coroutine version of `update_byod_portal_by_id <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.update_byod_portal_by_id>`_
+        """
+        return await self._run(
+            self._byod_portal.update_byod_portal_by_id,
+            id=id,
+            customizations=customizations,
+            description=description,
+            name=name,
+            portal_test_url=portal_test_url,
+            portal_type=portal_type,
+            settings=settings,
+            payload=payload,
+            active_validation=active_validation,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def delete_byod_portal_by_id(self,
+                                       id,
+                                       headers=None,
+                                       **query_parameters):
+        """Coroutine version of `delete_byod_portal_by_id <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.delete_byod_portal_by_id>`_
+        """
+        return await self._run(
+            self._byod_portal.delete_byod_portal_by_id,
+            id=id,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_byod_portal(self,
+                              filter=None,
+                              filter_type=None,
+                              page=None,
+                              size=None,
+                              sortasc=None,
+                              sortdsc=None,
+                              headers=None,
+                              **query_parameters):
+        """Coroutine version of `get_byod_portal <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal>`_
+        """
+        return await self._run(
+            self._byod_portal.get_byod_portal,
+            filter=filter,
+            filter_type=filter_type,
+            page=page,
+            size=size,
+            sortasc=sortasc,
+            sortdsc=sortdsc,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_byod_portal_generator(self,
+                                        filter=None,
+                                        filter_type=None,
+                                        page=None,
+                                        size=None,
+                                        sortasc=None,
+                                        sortdsc=None,
+                                        headers=None,
+                                        window=4,
+                                        **query_parameters):
+        """Asynchronous generator version of `get_byod_portal_generator <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_byod_portal_generator>`_
+
+        Once the first page announces the total, up to `window` of the
+        following pages are requested concurrently. The pages are still
+        yielded in order.
+        """
+        check_type(window, int, may_be_none=False)
+        params = dict(
+            filter=filter,
+            filter_type=filter_type,
+            page=get_next_page_number(page) - 1,
+            size=size,
+            sortasc=sortasc,
+            sortdsc=sortdsc,
+            headers=headers,
+            **query_parameters
+        )
+        response = await self.get_byod_portal(**params)
+        yield response
+
+        size, page_numbers = get_remaining_pages(response, params)
+        if size is None:
+            # Without a total the page count is unknown, follow the links instead
+            next_url = response.response.SearchResult.nextPage.href
+            while next_url:
+                _query_params = urllib.parse.parse_qs(urllib.parse.urlparse(next_url).query)
+                response = await self.get_byod_portal(**{**params, **_query_params})
+                yield response
+                previous_url, next_url = next_url, None
+                search_result = response.response.get('SearchResult') or {}
+                next_url = (search_result.get('nextPage') or {}).get('href')
+                if next_url == previous_url:
+                    break
+            return
+
+        page_numbers = iter(page_numbers)
+        pending = deque()
+        try:
+            for page_number in page_numbers:
+                pending.append(asyncio.ensure_future(
+                    self.get_byod_portal(**{**params, 'page': page_number, 'size': size})
+                ))
+                if len(pending) < window:
+                    continue
+                yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def create_byod_portal(self,
+                                 customizations=None,
+                                 description=None,
+                                 id=None,
+                                 name=None,
+                                 portal_test_url=None,
+                                 portal_type=None,
+                                 settings=None,
+                                 headers=None,
+                                 payload=None,
+                                 active_validation=True,
+                                 **query_parameters):
+        """Coroutine version of `create_byod_portal <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.create_byod_portal>`_
+        """
+        return await self._run(
+            self._byod_portal.create_byod_portal,
+            customizations=customizations,
+            description=description,
+            id=id,
+            name=name,
+            portal_test_url=portal_test_url,
+            portal_type=portal_type,
+            settings=settings,
+            payload=payload,
+            active_validation=active_validation,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def create_byod_portal_many(self,
+                                      items,
+                                      max_concurrent=8):
+        """Coroutine version of `create_byod_portal_many <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.create_byod_portal_many>`_
+
+        An asyncio.Semaphore caps the requests in flight to max_concurrent.
+        """
+        check_type(items, (list, tuple), may_be_none=False)
+        for item in items:
+            check_type(item, dict, may_be_none=False)
+        check_type(max_concurrent, int, may_be_none=False)
+
+        return await gather_many(
+            [functools.partial(self.create_byod_portal, **item)
+             for item in items],
+            max_concurrent
+        )
+
+    async def get_version(self,
+                          headers=None,
+                          **query_parameters):
+        """Coroutine version of `get_version <#ciscoisesdk.
+        api.v3_1_0.byod_portal.
+        ByodPortal.get_version>`_
+        """
+        return await self._run(
+            self._byod_portal.get_version,
+            headers=headers,
+            **query_parameters
+        )
+
+    get_by_id = get_byod_portal_by_id
+    update_by_id = update_byod_portal_by_id
+    delete_by_id = delete_byod_portal_by_id
+    get_all = get_byod_portal
+    get_all_generator = get_byod_portal_generator
+    create = create_byod_portal
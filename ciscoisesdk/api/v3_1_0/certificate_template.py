@@ -79,6 +79,8 @@ class CertificateTemplate(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new CertificateTemplate
         object with the provided RestSession.
@@ -49,6 +49,8 @@ class DeviceAdministrationDictionaryAttributesList(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new DeviceAdministrationDictionaryAttributesList
         object with the provided RestSession.
@@ -80,6 +80,8 @@ class DownloadableAcl(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new DownloadableAcl
         object with the provided RestSession.
@@ -98,6 +98,8 @@ class Endpoint(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new Endpoint
         object with the provided RestSession.
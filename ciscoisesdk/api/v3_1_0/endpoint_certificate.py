@@ -84,6 +84,8 @@ class EndpointCertificate(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new EndpointCertificate
         object with the provided RestSession.
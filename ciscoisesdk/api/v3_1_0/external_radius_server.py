@@ -99,6 +99,8 @@ class ExternalRadiusServer(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new ExternalRadiusServer
         object with the provided RestSession.
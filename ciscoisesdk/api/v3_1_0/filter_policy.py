@@ -80,6 +80,8 @@ class FilterPolicy(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new FilterPolicy
         object with the provided RestSession.
@@ -92,6 +92,8 @@ class GuestSmtpNotificationConfiguration(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new GuestSmtpNotificationConfiguration
         object with the provided RestSession.
@@ -72,6 +72,8 @@ class GuestSsid(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new GuestSsid
         object with the provided RestSession.
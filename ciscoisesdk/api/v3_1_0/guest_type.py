@@ -139,6 +139,8 @@ class GuestType(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new GuestType
         object with the provided RestSession.
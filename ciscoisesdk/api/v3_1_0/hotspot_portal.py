@@ -190,6 +190,8 @@ class HotspotPortal(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new HotspotPortal
         object with the provided RestSession.
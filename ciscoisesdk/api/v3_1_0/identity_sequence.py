@@ -82,6 +82,8 @@ class IdentitySequence(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new IdentitySequence
         object with the provided RestSession.
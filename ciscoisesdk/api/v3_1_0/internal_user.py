@@ -100,6 +100,8 @@ class InternalUser(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new InternalUser
         object with the provided RestSession.
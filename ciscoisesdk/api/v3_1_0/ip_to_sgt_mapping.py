@@ -84,6 +84,8 @@ class IpToSgtMapping(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new IpToSgtMapping
         object with the provided RestSession.
@@ -78,6 +78,8 @@ class IpToSgtMappingGroup(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new IpToSgtMappingGroup
         object with the provided RestSession.
@@ -71,6 +71,8 @@ class Misc(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new Misc
         object with the provided RestSession.
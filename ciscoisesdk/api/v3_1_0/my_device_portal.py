@@ -202,6 +202,8 @@ class MyDevicePortal(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new MyDevicePortal
         object with the provided RestSession.
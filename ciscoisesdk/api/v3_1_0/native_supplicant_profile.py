@@ -84,6 +84,8 @@ class NativeSupplicantProfile(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NativeSupplicantProfile
         object with the provided RestSession.
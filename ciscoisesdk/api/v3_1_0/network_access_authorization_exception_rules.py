@@ -49,6 +49,8 @@ class NetworkAccessAuthorizationExceptionRules(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NetworkAccessAuthorizationExceptionRules
         object with the provided RestSession.
@@ -25,21 +25,96 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
 from builtins import *
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 
 from past.builtins import basestring
+from requests.structures import CaseInsensitiveDict
 
+from ...environment import get_env_skip_checks
 from ...pagination import get_next_page
+from ...response_cache import ResponseCache
 from ...restsession import RestSession
 from ...utils import (
-    apply_path_params,
     check_type,
     dict_from_items_with_values,
     dict_of_str,
+    json_dumps,
+    skip_check_type,
 )
+from .._helpers import CachedGetMixin, run_many
 
+if get_env_skip_checks():
+    check_type = skip_check_type
 
-class NetworkAccessConditions(object):
+_CONDITION_URL = '/api/v1/policy/network-access/condition'
+_CONDITION_ID_URL = _CONDITION_URL + '/'
+_CONDITION_BY_NAME_URL = _CONDITION_URL + '/condition-by-name/'
+_AUTHENTICATION_URL = _CONDITION_URL + '/authentication'
+_AUTHORIZATION_URL = _CONDITION_URL + '/authorization'
+_POLICY_SET_URL = _CONDITION_URL + '/policyset'
+
+
+# Request body keys, in the order of the condition arguments zipped with them
+_CONDITION_FIELDS = (
+    'conditionType', 'isNegate', 'link', 'description', 'id', 'name',
+    'attributeName', 'attributeValue', 'dictionaryName', 'dictionaryValue',
+    'operator', 'children', 'datesRange', 'datesRangeException', 'hoursRange',
+    'hoursRangeException', 'weekDays', 'weekDaysException',
+)
+
+# Constraints of the flat properties of the update schemas
+_STRING_FIELDS = frozenset((
+    'id', 'name', 'description', 'attributeName', 'attributeValue',
+    'dictionaryName', 'dictionaryValue',
+))
+_ENUM_FIELDS = {
+    'conditionType': frozenset((
+        'ConditionAndBlock', 'ConditionAttributes', 'ConditionOrBlock',
+        'ConditionReference', 'LibraryConditionAndBlock',
+        'LibraryConditionAttributes', 'LibraryConditionOrBlock',
+        'TimeAndDateCondition',
+    )),
+    'operator': frozenset((
+        'contains', 'endsWith', 'equals', 'greaterOrEquals', 'greaterThan',
+        'in', 'ipEquals', 'ipGreaterThan', 'ipLessThan', 'ipNotEquals',
+        'lessOrEquals', 'lessThan', 'matches', 'notContains', 'notEndsWith',
+        'notEquals', 'notIn', 'notStartsWith', 'startsWith',
+    )),
+}
+
+
+def _check_headers(headers):
+    if headers is None:
+        return
+    check_type(headers, dict)
+    # One lookup, most callers do not send the header at all
+    request_id = headers.get('X-Request-ID')
+    if request_id is not None:
+        check_type(request_id, basestring)
+
+
+def _is_flat_payload(payload):
+    # The update schemas have no required properties, so a body made only
+    # of these flat properties is valid when each value passes its check.
+    for key, value in payload.items():
+        if key in _STRING_FIELDS:
+            if not isinstance(value, str):
+                return False
+        elif key == 'isNegate':
+            if not isinstance(value, bool):
+                return False
+        else:
+            allowed = _ENUM_FIELDS.get(key)
+            if allowed is None or not isinstance(value, str) \
+                    or value not in allowed:
+                return False
+    return True
+
+
+class NetworkAccessConditions(CachedGetMixin):
     """Identity Services Engine Network Access - Conditions API (version: 3.1.0).
 
     Wraps the Identity Services Engine Network Access - Conditions
@@ -49,25 +124,62 @@ class NetworkAccessConditions(object):
 
     """
 
-    def __init__(self, session, object_factory, request_validator):
+    __slots__ = ('_session', '_object_factory', '_request_validator',
+                 '_validate_create', '_validate_update_by_name',
+                 '_validate_update_by_id', '_cache', '_etags')
+
+    def __init__(self, session, object_factory, request_validator,
+                 cache_enabled=False, cache_ttl=60,
+                 conditional_requests=False):
         """Initialize a new NetworkAccessConditions
         object with the provided RestSession.
 
         Args:
             session(RestSession): The RESTful session object to be used for
                 API calls to the Identity Services Engine service.
+            cache_enabled(bool): Keep the responses of the GET methods in
+                memory and return a copy of them while they are fresh, so
+                repeated `get_network_access_condition_by_name` calls for
+                the same condition cost a single request.
+                Creating, updating or deleting a condition empties the cache.
+                Defaults to False.
+            cache_ttl(int,float): Seconds a remembered response stays
+                fresh. Defaults to 60.
+            conditional_requests(bool): Remember the ETag of the GET
+                responses, per URL and query parameters, and send it back as
+                If-None-Match, returning the remembered response when the
+                server answers 304 Not Modified. Creating, updating or
+                deleting a condition forgets them.
+                Defaults to False.
 
         Raises:
             TypeError: If the parameter types are incorrect.
 
         """
-        check_type(session, RestSession)
+        if __debug__:
+            check_type(session, RestSession)
+            check_type(cache_enabled, bool, may_be_none=False)
+            check_type(conditional_requests, bool, may_be_none=False)
 
         super(NetworkAccessConditions, self).__init__()
 
         self._session = session
         self._object_factory = object_factory
         self._request_validator = request_validator
+        # Resolved on the first validated create or update, so callers that
+        # turn active_validation off never compile the schemas
+        self._validate_create = None
+        self._validate_update_by_name = None
+        self._validate_update_by_id = None
+        self._cache = ResponseCache(ttl=cache_ttl) if cache_enabled else None
+        self._etags = ResponseCache(ttl=cache_ttl) if conditional_requests else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # Only drops the idle pooled connections, the session stays usable
+        self._session.close()
 
     def get_network_access_conditions(self,
                                       headers=None,
@@ -95,48 +207,63 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-        }
+        endpoint_full_url = _CONDITION_URL
+        return self._get('bpm_df4fb303a3e5661ba12058f18b225af_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-        e_url = ('/api/v1/policy/network-access/condition')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+    get_all = get_network_access_conditions
 
-        return self._object_factory('bpm_df4fb303a3e5661ba12058f18b225af_v3_1_0', _api_response)
+    def get_network_access_conditions_items(self,
+                                            headers=None,
+                                            **query_parameters):
+        """Yields every library condition of `get_network_access_conditions
+        <#ciscoisesdk.api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_conditions>`_, one at a
+        time.
 
-    def get_all(self,
-                headers=None,
-                **query_parameters):
-        """Alias for `get_network_access_conditions <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.get_network_access_conditions>`_
+        The response is parsed while it is received when the optional ijson
+        package is installed, so large condition libraries are never held
+        in memory at once and stopping early skips the rest of the parse.
+
+        Args:
+            headers(dict): Dictionary of HTTP Headers to send with the Request
+                .
+            **query_parameters: Additional query parameters (provides
+                support for parameters that may be added in the future).
+
+        Returns:
+            Generator: A generator object containing the response items as
+            MyDict objects.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Identity Services Engine cloud returns an error.
         """
-        return self.get_network_access_conditions(
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            _check_headers(headers)
+
+        _headers = dict_of_str(headers) if headers else None
+
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
+
+        object_factory = self._object_factory
+        for item in self._session.get_items(_CONDITION_URL, ['response'],
+                                            params=_params, headers=_headers):
+            yield object_factory('bpm_df4fb303a3e5661ba12058f18b225af_v3_1_0', item)
 
     def create_network_access_condition(self,
                                         attribute_name=None,
@@ -312,143 +439,94 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # Header names are case-insensitive, as in the session headers
+            _headers = CaseInsensitiveDict(dict_of_str(headers))
             with_custom_headers = True
-        is_xml_payload = 'application/xml' in _headers.get('Content-Type', [])
+        _content_type = _headers.get('Content-Type') \
+            or self._session.get_header('Content-Type')
+        is_xml_payload = _content_type is not None \
+            and _content_type.startswith('application/xml')
         if active_validation and is_xml_payload:
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-        }
         if is_xml_payload:
             _payload = payload
         else:
-            _payload = {
-                'conditionType':
-                    condition_type,
-                'isNegate':
-                    is_negate,
-                'link':
-                    link,
-                'description':
-                    description,
-                'id':
-                    id,
-                'name':
-                    name,
-                'attributeName':
-                    attribute_name,
-                'attributeValue':
-                    attribute_value,
-                'dictionaryName':
-                    dictionary_name,
-                'dictionaryValue':
-                    dictionary_value,
-                'operator':
-                    operator,
-                'children':
-                    children,
-                'datesRange':
-                    dates_range,
-                'datesRangeException':
-                    dates_range_exception,
-                'hoursRange':
-                    hours_range,
-                'hoursRangeException':
-                    hours_range_exception,
-                'weekDays':
-                    week_days,
-                'weekDaysException':
-                    week_days_exception,
-            }
-            _payload.update(payload or {})
-            _payload = dict_from_items_with_values(_payload)
+            _payload = {k: v for k, v in zip(_CONDITION_FIELDS, (
+                condition_type, is_negate, link, description, id, name,
+                attribute_name, attribute_value, dictionary_name,
+                dictionary_value, operator, children, dates_range,
+                dates_range_exception, hours_range, hours_range_exception,
+                week_days, week_days_exception,
+            )) if v is not None}
+            if payload:
+                _payload.update((k, v) for k, v in payload.items()
+                                if v is not None)
         if active_validation and not is_xml_payload:
-            self._request_validator('jsd_e7bd468ee94f53869e52e84454efd0e6_v3_1_0')\
-                .validate(_payload)
+            if self._validate_create is None:
+                self._validate_create = self._request_validator(
+                    'jsd_e7bd468ee94f53869e52e84454efd0e6_v3_1_0').validate
+            self._validate_create(_payload)
 
-        e_url = ('/api/v1/policy/network-access/condition')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _CONDITION_URL
 
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
+        _data = _payload if is_xml_payload else json_dumps(_payload)
         if with_custom_headers:
             _api_response = self._session.post(endpoint_full_url, params=_params,
                                                headers=_headers,
-                                               **request_params)
+                                               data=_data)
         else:
             _api_response = self._session.post(endpoint_full_url, params=_params,
-                                               **request_params)
+                                               data=_data)
 
+        self._clear_caches()
         return self._object_factory('bpm_e7bd468ee94f53869e52e84454efd0e6_v3_1_0', _api_response)
 
-    def create(self,
-               attribute_name=None,
-               attribute_value=None,
-               children=None,
-               condition_type=None,
-               dates_range=None,
-               dates_range_exception=None,
-               description=None,
-               dictionary_name=None,
-               dictionary_value=None,
-               hours_range=None,
-               hours_range_exception=None,
-               id=None,
-               is_negate=None,
-               link=None,
-               name=None,
-               operator=None,
-               week_days=None,
-               week_days_exception=None,
-               headers=None,
-               payload=None,
-               active_validation=True,
-               **query_parameters):
-        """Alias for `create_network_access_condition <#ciscoisesdk.
+    create = create_network_access_condition
+
+    def create_network_access_condition_many(self,
+                                             items,
+                                             max_concurrent=4):
+        """Creates several library conditions concurrently.
+
+        Each item is a dictionary with the keyword arguments of
+        `create_network_access_condition <#ciscoisesdk.
         api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.create_network_access_condition>`_
+        NetworkAccessConditions.create_network_access_condition>`_.
+
+        Args:
+            items(list): The keyword arguments of each condition to create.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 4.
+
+        Returns:
+            list: The RestResponse of each item, in the order of items.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the items fails. Its errors property holds
+                the (index, exception) of each failure, and its results
+                property the responses of the items that were created.
         """
-        return self.create_network_access_condition(
-            attribute_name=attribute_name,
-            attribute_value=attribute_value,
-            children=children,
-            condition_type=condition_type,
-            dates_range=dates_range,
-            dates_range_exception=dates_range_exception,
-            description=description,
-            dictionary_name=dictionary_name,
-            dictionary_value=dictionary_value,
-            hours_range=hours_range,
-            hours_range_exception=hours_range_exception,
-            id=id,
-            is_negate=is_negate,
-            link=link,
-            name=name,
-            operator=operator,
-            week_days=week_days,
-            week_days_exception=week_days_exception,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_type(items, (list, tuple), may_be_none=False)
+            for item in items:
+                check_type(item, dict, may_be_none=False)
+            check_type(max_concurrent, int, may_be_none=False)
+
+        return run_many([functools.partial(self.create_network_access_condition, **item)
+                          for item in items], max_concurrent)
 
     def get_network_access_conditions_for_authentication_rules(self,
                                                                headers=None,
@@ -477,36 +555,22 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
-
-        path_params = {
-        }
-
-        e_url = ('/api/v1/policy/network-access/condition/authentication')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        return self._object_factory('bpm_e34177d675622acd0a532f5b7c41b_v3_1_0', _api_response)
+        endpoint_full_url = _AUTHENTICATION_URL
+        return self._get('bpm_e34177d675622acd0a532f5b7c41b_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
     def get_network_access_conditions_for_authorization_rules(self,
                                                               headers=None,
@@ -535,36 +599,62 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-        }
+        endpoint_full_url = _AUTHORIZATION_URL
+        return self._get('bpm_fff985b5159a0aa52bfe9e62ba7_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-        e_url = ('/api/v1/policy/network-access/condition/authorization')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+    def get_network_access_conditions_for_all_scopes(self,
+                                                     headers=None,
+                                                     **query_parameters):
+        """Gets the library conditions, and those of the Authentication
+        and Authorization rules scopes, with the three requests in flight
+        at once.
+
+        Args:
+            headers(dict): Dictionary of HTTP Headers to send with every
+                Request.
+            **query_parameters: Additional query parameters (provides
+                support for parameters that may be added in the future).
 
-        return self._object_factory('bpm_fff985b5159a0aa52bfe9e62ba7_v3_1_0', _api_response)
+        Returns:
+            dict: The RestResponse of `get_network_access_conditions`,
+            `get_network_access_conditions_for_authentication_rules` and
+            `get_network_access_conditions_for_authorization_rules`, under
+            the 'conditions', 'authentication_rules' and
+            'authorization_rules' keys.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Identity Services Engine cloud returns an error.
+        """
+        functions = {
+            'conditions':
+                self.get_network_access_conditions,
+            'authentication_rules':
+                self.get_network_access_conditions_for_authentication_rules,
+            'authorization_rules':
+                self.get_network_access_conditions_for_authorization_rules,
+        }
+        with ThreadPoolExecutor(max_workers=len(functions)) as executor:
+            futures = {
+                scope: executor.submit(function, headers=headers,
+                                       **query_parameters)
+                for scope, function in functions.items()
+            }
+            return {scope: future.result() for scope, future in futures.items()}
 
     def get_network_access_condition_by_name(self,
                                              name,
@@ -594,54 +684,27 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(name, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(name, basestring,
+                       may_be_none=False)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'name': name,
-        }
+        endpoint_full_url = _CONDITION_BY_NAME_URL + quote(name, safe='')
+        return self._get('bpm_f3b949de4363575398dc1c9e681630bb_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-        e_url = ('/api/v1/policy/network-access/condition/condition-by-'
-                 + 'name/{name}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
-
-        return self._object_factory('bpm_f3b949de4363575398dc1c9e681630bb_v3_1_0', _api_response)
-
-    def get_by_name(self,
-                    name,
-                    headers=None,
-                    **query_parameters):
-        """Alias for `get_network_access_condition_by_name <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.get_network_access_condition_by_name>`_
-        """
-        return self.get_network_access_condition_by_name(
-            name=name,
-            headers=headers,
-            **query_parameters
-        )
+    get_by_name = get_network_access_condition_by_name
 
     def update_network_access_condition_by_name(self,
                                                 name,
@@ -791,148 +854,65 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # Header names are case-insensitive, as in the session headers
+            _headers = CaseInsensitiveDict(dict_of_str(headers))
             with_custom_headers = True
-        is_xml_payload = 'application/xml' in _headers.get('Content-Type', [])
+        _content_type = _headers.get('Content-Type') \
+            or self._session.get_header('Content-Type')
+        is_xml_payload = _content_type is not None \
+            and _content_type.startswith('application/xml')
         if active_validation and is_xml_payload:
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(name, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(name, basestring,
+                       may_be_none=False)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'name': name,
-        }
         if is_xml_payload:
             _payload = payload
         else:
-            _payload = {
-                'conditionType':
-                    condition_type,
-                'isNegate':
-                    is_negate,
-                'link':
-                    link,
-                'description':
-                    description,
-                'id':
-                    id,
-                'name':
-                    name,
-                'attributeName':
-                    attribute_name,
-                'attributeValue':
-                    attribute_value,
-                'dictionaryName':
-                    dictionary_name,
-                'dictionaryValue':
-                    dictionary_value,
-                'operator':
-                    operator,
-                'children':
-                    children,
-                'datesRange':
-                    dates_range,
-                'datesRangeException':
-                    dates_range_exception,
-                'hoursRange':
-                    hours_range,
-                'hoursRangeException':
-                    hours_range_exception,
-                'weekDays':
-                    week_days,
-                'weekDaysException':
-                    week_days_exception,
-            }
-            _payload.update(payload or {})
-            _payload = dict_from_items_with_values(_payload)
-        if active_validation and not is_xml_payload:
-            self._request_validator('jsd_bea2910401185295a9715d65cb1c07c9_v3_1_0')\
-                .validate(_payload)
-
-        e_url = ('/api/v1/policy/network-access/condition/condition-by-'
-                 + 'name/{name}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
+            _payload = {k: v for k, v in zip(_CONDITION_FIELDS, (
+                condition_type, is_negate, link, description, id, name,
+                attribute_name, attribute_value, dictionary_name,
+                dictionary_value, operator, children, dates_range,
+                dates_range_exception, hours_range, hours_range_exception,
+                week_days, week_days_exception,
+            )) if v is not None}
+            if payload:
+                _payload.update((k, v) for k, v in payload.items()
+                                if v is not None)
+        if active_validation and not is_xml_payload \
+                and not _is_flat_payload(_payload):
+            if self._validate_update_by_name is None:
+                self._validate_update_by_name = self._request_validator(
+                    'jsd_bea2910401185295a9715d65cb1c07c9_v3_1_0').validate
+            self._validate_update_by_name(_payload)
+
+        endpoint_full_url = _CONDITION_BY_NAME_URL + quote(name, safe='')
+
+        _data = _payload if is_xml_payload else json_dumps(_payload)
         if with_custom_headers:
             _api_response = self._session.put(endpoint_full_url, params=_params,
                                               headers=_headers,
-                                              **request_params)
-
+                                              data=_data)
         else:
             _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+                                              data=_data)
 
+        self._clear_caches()
         return self._object_factory('bpm_bea2910401185295a9715d65cb1c07c9_v3_1_0', _api_response)
 
-    def update_by_name(self,
-                       name,
-                       attribute_name=None,
-                       attribute_value=None,
-                       children=None,
-                       condition_type=None,
-                       dates_range=None,
-                       dates_range_exception=None,
-                       description=None,
-                       dictionary_name=None,
-                       dictionary_value=None,
-                       hours_range=None,
-                       hours_range_exception=None,
-                       id=None,
-                       is_negate=None,
-                       link=None,
-                       operator=None,
-                       week_days=None,
-                       week_days_exception=None,
-                       headers=None,
-                       payload=None,
-                       active_validation=True,
-                       **query_parameters):
-        """Alias for `update_network_access_condition_by_name <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.update_network_access_condition_by_name>`_
-        """
-        return self.update_network_access_condition_by_name(
-            name=name,
-            attribute_name=attribute_name,
-            attribute_value=attribute_value,
-            children=children,
-            condition_type=condition_type,
-            dates_range=dates_range,
-            dates_range_exception=dates_range_exception,
-            description=description,
-            dictionary_name=dictionary_name,
-            dictionary_value=dictionary_value,
-            hours_range=hours_range,
-            hours_range_exception=hours_range_exception,
-            id=id,
-            is_negate=is_negate,
-            link=link,
-            operator=operator,
-            week_days=week_days,
-            week_days_exception=week_days_exception,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+    update_by_name = update_network_access_condition_by_name
 
     def delete_network_access_condition_by_name(self,
                                                 name,
@@ -962,54 +942,33 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(name, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(name, basestring,
+                       may_be_none=False)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'name': name,
-        }
-
-        e_url = ('/api/v1/policy/network-access/condition/condition-by-'
-                 + 'name/{name}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _CONDITION_BY_NAME_URL + quote(name, safe='')
         if with_custom_headers:
             _api_response = self._session.delete(endpoint_full_url, params=_params,
                                                  headers=_headers)
         else:
             _api_response = self._session.delete(endpoint_full_url, params=_params)
 
+        self._clear_caches()
         return self._object_factory('bpm_ea1c05d19955fd4801e6c996705f3fc_v3_1_0', _api_response)
 
-    def delete_by_name(self,
-                       name,
-                       headers=None,
-                       **query_parameters):
-        """Alias for `delete_network_access_condition_by_name <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.delete_network_access_condition_by_name>`_
-        """
-        return self.delete_network_access_condition_by_name(
-            name=name,
-            headers=headers,
-            **query_parameters
-        )
+    delete_by_name = delete_network_access_condition_by_name
 
     def get_network_access_conditions_for_policy_sets(self,
                                                       headers=None,
@@ -1038,48 +997,24 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
-
-        path_params = {
-        }
-
-        e_url = ('/api/v1/policy/network-access/condition/policyset')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        return self._object_factory('bpm_c0984cde5e925c209ab87472ab905476_v3_1_0', _api_response)
+        endpoint_full_url = _POLICY_SET_URL
+        return self._get('bpm_c0984cde5e925c209ab87472ab905476_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-    def get_all_for_policy_sets(self,
-                                headers=None,
-                                **query_parameters):
-        """Alias for `get_network_access_conditions_for_policy_sets <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.get_network_access_conditions_for_policy_sets>`_
-        """
-        return self.get_network_access_conditions_for_policy_sets(
-            headers=headers,
-            **query_parameters
-        )
+    get_all_for_policy_sets = get_network_access_conditions_for_policy_sets
 
     def get_network_access_condition_by_id(self,
                                            id,
@@ -1109,53 +1044,27 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'id': id,
-        }
+        endpoint_full_url = _CONDITION_ID_URL + quote(id, safe='')
+        return self._get('bpm_f2b0a67d389a592dba005895594b77cc_v3_1_0', endpoint_full_url, _params,
+                         _headers, with_custom_headers)
 
-        e_url = ('/api/v1/policy/network-access/condition/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-        if with_custom_headers:
-            _api_response = self._session.get(endpoint_full_url, params=_params,
-                                              headers=_headers)
-        else:
-            _api_response = self._session.get(endpoint_full_url, params=_params)
-
-        return self._object_factory('bpm_f2b0a67d389a592dba005895594b77cc_v3_1_0', _api_response)
-
-    def get_by_id(self,
-                  id,
-                  headers=None,
-                  **query_parameters):
-        """Alias for `get_network_access_condition_by_id <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.get_network_access_condition_by_id>`_
-        """
-        return self.get_network_access_condition_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+    get_by_id = get_network_access_condition_by_id
 
     def update_network_access_condition_by_id(self,
                                               id,
@@ -1305,147 +1214,99 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # Header names are case-insensitive, as in the session headers
+            _headers = CaseInsensitiveDict(dict_of_str(headers))
             with_custom_headers = True
-        is_xml_payload = 'application/xml' in _headers.get('Content-Type', [])
+        _content_type = _headers.get('Content-Type') \
+            or self._session.get_header('Content-Type')
+        is_xml_payload = _content_type is not None \
+            and _content_type.startswith('application/xml')
         if active_validation and is_xml_payload:
             check_type(payload, basestring)
         if active_validation and not is_xml_payload:
             check_type(payload, dict)
-        check_type(id, basestring,
-                   may_be_none=False)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        path_params = {
-            'id': id,
-        }
         if is_xml_payload:
             _payload = payload
         else:
-            _payload = {
-                'conditionType':
-                    condition_type,
-                'isNegate':
-                    is_negate,
-                'link':
-                    link,
-                'description':
-                    description,
-                'id':
-                    id,
-                'name':
-                    name,
-                'attributeName':
-                    attribute_name,
-                'attributeValue':
-                    attribute_value,
-                'dictionaryName':
-                    dictionary_name,
-                'dictionaryValue':
-                    dictionary_value,
-                'operator':
-                    operator,
-                'children':
-                    children,
-                'datesRange':
-                    dates_range,
-                'datesRangeException':
-                    dates_range_exception,
-                'hoursRange':
-                    hours_range,
-                'hoursRangeException':
-                    hours_range_exception,
-                'weekDays':
-                    week_days,
-                'weekDaysException':
-                    week_days_exception,
-            }
-            _payload.update(payload or {})
-            _payload = dict_from_items_with_values(_payload)
-        if active_validation and not is_xml_payload:
-            self._request_validator('jsd_e405a20316825460a1f37a2f161e7ac5_v3_1_0')\
-                .validate(_payload)
-
-        e_url = ('/api/v1/policy/network-access/condition/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
-
-        request_params = {'data': _payload} if is_xml_payload else {'json': _payload}
+            _payload = {k: v for k, v in zip(_CONDITION_FIELDS, (
+                condition_type, is_negate, link, description, id, name,
+                attribute_name, attribute_value, dictionary_name,
+                dictionary_value, operator, children, dates_range,
+                dates_range_exception, hours_range, hours_range_exception,
+                week_days, week_days_exception,
+            )) if v is not None}
+            if payload:
+                _payload.update((k, v) for k, v in payload.items()
+                                if v is not None)
+        if active_validation and not is_xml_payload \
+                and not _is_flat_payload(_payload):
+            if self._validate_update_by_id is None:
+                self._validate_update_by_id = self._request_validator(
+                    'jsd_e405a20316825460a1f37a2f161e7ac5_v3_1_0').validate
+            self._validate_update_by_id(_payload)
+
+        endpoint_full_url = _CONDITION_ID_URL + quote(id, safe='')
+
+        _data = _payload if is_xml_payload else json_dumps(_payload)
         if with_custom_headers:
             _api_response = self._session.put(endpoint_full_url, params=_params,
                                               headers=_headers,
-                                              **request_params)
-
+                                              data=_data)
         else:
             _api_response = self._session.put(endpoint_full_url, params=_params,
-                                              **request_params)
+                                              data=_data)
 
+        self._clear_caches()
         return self._object_factory('bpm_e405a20316825460a1f37a2f161e7ac5_v3_1_0', _api_response)
 
-    def update_by_id(self,
-                     id,
-                     attribute_name=None,
-                     attribute_value=None,
-                     children=None,
-                     condition_type=None,
-                     dates_range=None,
-                     dates_range_exception=None,
-                     description=None,
-                     dictionary_name=None,
-                     dictionary_value=None,
-                     hours_range=None,
-                     hours_range_exception=None,
-                     is_negate=None,
-                     link=None,
-                     name=None,
-                     operator=None,
-                     week_days=None,
-                     week_days_exception=None,
-                     headers=None,
-                     payload=None,
-                     active_validation=True,
-                     **query_parameters):
-        """Alias for `update_network_access_condition_by_id <#ciscoisesdk.
+    update_by_id = update_network_access_condition_by_id
+
+    def update_network_access_condition_by_id_many(self,
+                                                   items,
+                                                   max_concurrent=4):
+        """Updates several library conditions by id concurrently.
+
+        Each item is a dictionary with the keyword arguments of
+        `update_network_access_condition_by_id <#ciscoisesdk.
         api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.update_network_access_condition_by_id>`_
+        NetworkAccessConditions.update_network_access_condition_by_id>`_,
+        including the id.
+
+        Args:
+            items(list): The keyword arguments of each condition to update.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 4.
+
+        Returns:
+            list: The RestResponse of each item, in the order of items.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the items fails. Its errors property holds
+                the (index, exception) of each failure, and its results
+                property the responses of the items that were updated.
         """
-        return self.update_network_access_condition_by_id(
-            id=id,
-            attribute_name=attribute_name,
-            attribute_value=attribute_value,
-            children=children,
-            condition_type=condition_type,
-            dates_range=dates_range,
-            dates_range_exception=dates_range_exception,
-            description=description,
-            dictionary_name=dictionary_name,
-            dictionary_value=dictionary_value,
-            hours_range=hours_range,
-            hours_range_exception=hours_range_exception,
-            is_negate=is_negate,
-            link=link,
-            name=name,
-            operator=operator,
-            week_days=week_days,
-            week_days_exception=week_days_exception,
-            payload=payload,
-            active_validation=active_validation,
-            headers=headers,
-            **query_parameters
-        )
+        if __debug__:
+            check_type(items, (list, tuple), may_be_none=False)
+            for item in items:
+                check_type(item, dict, may_be_none=False)
+            check_type(max_concurrent, int, may_be_none=False)
+
+        return run_many([functools.partial(self.update_network_access_condition_by_id, **item)
+                          for item in items], max_concurrent)
 
     def delete_network_access_condition_by_id(self,
                                               id,
@@ -1475,50 +1336,31 @@ class NetworkAccessConditions(object):
             MalformedRequest: If the request body created is invalid.
             ApiError: If the Identity Services Engine cloud returns an error.
         """
-        check_type(headers, dict)
-
-        if headers is not None:
-            if 'X-Request-ID' in headers:
-                check_type(headers.get('X-Request-ID'),
-                           basestring)
+        if __debug__:
+            _check_headers(headers)
 
         with_custom_headers = False
-        _headers = self._session.headers or {}
+        _headers = {}
         if headers:
-            _headers.update(dict_of_str(headers))
+            # requests merges them over the session headers
+            _headers = dict_of_str(headers)
             with_custom_headers = True
-        check_type(id, basestring,
-                   may_be_none=False)
-
-        _params = {
-        }
-        _params.update(query_parameters)
-        _params = dict_from_items_with_values(_params)
+        if __debug__:
+            check_type(id, basestring,
+                       may_be_none=False)
 
-        path_params = {
-            'id': id,
-        }
+        _params = dict_from_items_with_values(query_parameters) \
+            if query_parameters else None
 
-        e_url = ('/api/v1/policy/network-access/condition/{id}')
-        endpoint_full_url = apply_path_params(e_url, path_params)
+        endpoint_full_url = _CONDITION_ID_URL + quote(id, safe='')
         if with_custom_headers:
             _api_response = self._session.delete(endpoint_full_url, params=_params,
                                                  headers=_headers)
         else:
             _api_response = self._session.delete(endpoint_full_url, params=_params)
 
+        self._clear_caches()
         return self._object_factory('bpm_d87a24994c514d955149d33e1a99fb_v3_1_0', _api_response)
 
-    def delete_by_id(self,
-                     id,
-                     headers=None,
-                     **query_parameters):
-        """Alias for `delete_network_access_condition_by_id <#ciscoisesdk.
-        api.v3_1_0.network_access_conditions.
-        NetworkAccessConditions.delete_network_access_condition_by_id>`_
-        """
-        return self.delete_network_access_condition_by_id(
-            id=id,
-            headers=headers,
-            **query_parameters
-        )
+    delete_by_id = delete_network_access_condition_by_id
+
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""Cisco Identity Services Engine Network Access - Conditions asyncio API wrapper.
+
+Copyright (c) 2021 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import functools
+from builtins import *
+
+from ...utils import check_type
+from .._helpers import gather_many
+from .network_access_conditions import NetworkAccessConditions
+
+
+class AsyncNetworkAccessConditions(object):
+    """Identity Services Engine Network Access - Conditions API (version: 3.1.0) for asyncio.
+
+    Exposes the methods of `NetworkAccessConditions <#ciscoisesdk.
+    api.v3_1_0.network_access_conditions.NetworkAccessConditions>`_ as
+    coroutines, so several calls can be awaited concurrently with
+    `asyncio.gather`.
+
+    Each call runs the synchronous wrapper in an executor, reusing its
+    RestSession, validation and response handling unchanged.
+    """
+
+    __slots__ = ('_network_access_conditions', '_executor')
+
+    def __init__(self, network_access_conditions, executor=None):
+        """Initialize a new AsyncNetworkAccessConditions
+        object with the provided NetworkAccessConditions.
+
+        Args:
+            network_access_conditions(NetworkAccessConditions): The
+                synchronous API wrapper to be used for API calls to the
+                Identity Services Engine service.
+            executor(concurrent.futures.Executor): The executor that runs the
+                blocking calls. Defaults to the event loop's default
+                executor.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(network_access_conditions, NetworkAccessConditions)
+
+        super(AsyncNetworkAccessConditions, self).__init__()
+
+        self._network_access_conditions = network_access_conditions
+        self._executor = executor
+
+    def _run(self, function, **kwargs):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor,
+                                    functools.partial(function, **kwargs))
+
+    async def get_network_access_conditions(self,
+                                            headers=None,
+                                            **query_parameters):
+        """Coroutine version of `get_network_access_conditions <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_conditions>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_conditions,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def create_network_access_condition(self,
+                                              attribute_name=None,
+                                              attribute_value=None,
+                                              children=None,
+                                              condition_type=None,
+                                              dates_range=None,
+                                              dates_range_exception=None,
+                                              description=None,
+                                              dictionary_name=None,
+                                              dictionary_value=None,
+                                              hours_range=None,
+                                              hours_range_exception=None,
+                                              id=None,
+                                              is_negate=None,
+                                              link=None,
+                                              name=None,
+                                              operator=None,
+                                              week_days=None,
+                                              week_days_exception=None,
+                                              headers=None,
+                                              payload=None,
+                                              active_validation=True,
+                                              **query_parameters):
+        """Coroutine version of `create_network_access_condition <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.create_network_access_condition>`_
+        """
+        return await self._run(
+            self._network_access_conditions.create_network_access_condition,
+            attribute_name=attribute_name,
+            attribute_value=attribute_value,
+            children=children,
+            condition_type=condition_type,
+            dates_range=dates_range,
+            dates_range_exception=dates_range_exception,
+            description=description,
+            dictionary_name=dictionary_name,
+            dictionary_value=dictionary_value,
+            hours_range=hours_range,
+            hours_range_exception=hours_range_exception,
+            id=id,
+            is_negate=is_negate,
+            link=link,
+            name=name,
+            operator=operator,
+            week_days=week_days,
+            week_days_exception=week_days_exception,
+            payload=payload,
+            active_validation=active_validation,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_network_access_conditions_for_authentication_rules(self,
+                                                                     headers=None,
+                                                                     **query_parameters):
+        """Coroutine version of `get_network_access_conditions_for_authentication_rules <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_conditions_for_authentication_rules>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_conditions_for_authentication_rules,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_network_access_conditions_for_authorization_rules(self,
+                                                                    headers=None,
+                                                                    **query_parameters):
+        """Coroutine version of `get_network_access_conditions_for_authorization_rules <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_conditions_for_authorization_rules>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_conditions_for_authorization_rules,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_network_access_condition_by_name(self,
+                                                   name,
+                                                   headers=None,
+                                                   **query_parameters):
+        """Coroutine version of `get_network_access_condition_by_name <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_condition_by_name>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_condition_by_name,
+            name=name,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def update_network_access_condition_by_name(self,
+                                                      name,
+                                                      attribute_name=None,
+                                                      attribute_value=None,
+                                                      children=None,
+                                                      condition_type=None,
+                                                      dates_range=None,
+                                                      dates_range_exception=None,
+                                                      description=None,
+                                                      dictionary_name=None,
+                                                      dictionary_value=None,
+                                                      hours_range=None,
+                                                      hours_range_exception=None,
+                                                      id=None,
+                                                      is_negate=None,
+                                                      link=None,
+                                                      operator=None,
+                                                      week_days=None,
+                                                      week_days_exception=None,
+                                                      headers=None,
+                                                      payload=None,
+                                                      active_validation=True,
+                                                      **query_parameters):
+        """Coroutine version of `update_network_access_condition_by_name <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.update_network_access_condition_by_name>`_
+        """
+        return await self._run(
+            self._network_access_conditions.update_network_access_condition_by_name,
+            name=name,
+            attribute_name=attribute_name,
+            attribute_value=attribute_value,
+            children=children,
+            condition_type=condition_type,
+            dates_range=dates_range,
+            dates_range_exception=dates_range_exception,
+            description=description,
+            dictionary_name=dictionary_name,
+            dictionary_value=dictionary_value,
+            hours_range=hours_range,
+            hours_range_exception=hours_range_exception,
+            id=id,
+            is_negate=is_negate,
+            link=link,
+            operator=operator,
+            week_days=week_days,
+            week_days_exception=week_days_exception,
+            payload=payload,
+            active_validation=active_validation,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def delete_network_access_condition_by_name(self,
+                                                      name,
+                                                      headers=None,
+                                                      **query_parameters):
+        """Coroutine version of `delete_network_access_condition_by_name <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.delete_network_access_condition_by_name>`_
+        """
+        return await self._run(
+            self._network_access_conditions.delete_network_access_condition_by_name,
+            name=name,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def delete_network_access_condition_by_name_many(self,
+                                                           names,
+                                                           headers=None,
+                                                           max_concurrent=16,
+                                                           **query_parameters):
+        """Deletes several library conditions by name concurrently, with
+        `delete_network_access_condition_by_name <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.delete_network_access_condition_by_name>`_.
+
+        An asyncio.Semaphore caps the requests in flight to max_concurrent,
+        they share the connection pool of the RestSession.
+
+        Args:
+            names(list): The names of the conditions to delete.
+            headers(dict): Dictionary of HTTP Headers to send with each
+                Request.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 16.
+            **query_parameters: Additional query parameters of each Request.
+
+        Returns:
+            list: The RestResponse of each name, in the order of names.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the names fails. Its errors property holds
+                the (index, exception) of each failure, and its results
+                property the responses of the names that were deleted.
+        """
+        check_type(names, (list, tuple), may_be_none=False)
+        check_type(max_concurrent, int, may_be_none=False)
+
+        return await gather_many(
+            [functools.partial(self.delete_network_access_condition_by_name,
+                               name, headers=headers, **query_parameters)
+             for name in names],
+            max_concurrent
+        )
+
+    async def get_network_access_conditions_for_policy_sets(self,
+                                                            headers=None,
+                                                            **query_parameters):
+        """Coroutine version of `get_network_access_conditions_for_policy_sets <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_conditions_for_policy_sets>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_conditions_for_policy_sets,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_network_access_condition_by_id(self,
+                                                 id,
+                                                 headers=None,
+                                                 **query_parameters):
+        """Coroutine version of `get_network_access_condition_by_id <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_condition_by_id>`_
+        """
+        return await self._run(
+            self._network_access_conditions.get_network_access_condition_by_id,
+            id=id,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def get_network_access_condition_by_id_many(self,
+                                                      ids,
+                                                      headers=None,
+                                                      max_concurrent=16,
+                                                      **query_parameters):
+        """Gets several library conditions by id concurrently, with
+        `get_network_access_condition_by_id <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.get_network_access_condition_by_id>`_.
+
+        An asyncio.Semaphore caps the requests in flight to max_concurrent,
+        they share the connection pool of the RestSession.
+
+        Args:
+            ids(list): The ids of the conditions to get.
+            headers(dict): Dictionary of HTTP Headers to send with each
+                Request.
+            max_concurrent(int): Maximum number of requests in flight.
+                Defaults to 16.
+            **query_parameters: Additional query parameters of each Request.
+
+        Returns:
+            list: The RestResponse of each id, in the order of ids.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            BatchError: If any of the ids fails. Its errors property holds
+                the (index, exception) of each failure, and its results
+                property the responses of the ids that were fetched.
+        """
+        check_type(ids, (list, tuple), may_be_none=False)
+        check_type(max_concurrent, int, may_be_none=False)
+
+        return await gather_many(
+            [functools.partial(self.get_network_access_condition_by_id,
+                               id, headers=headers, **query_parameters)
+             for id in ids],
+            max_concurrent
+        )
+
+    async def update_network_access_condition_by_id(self,
+                                                    id,
+                                                    attribute_name=None,
+                                                    attribute_value=None,
+                                                    children=None,
+                                                    condition_type=None,
+                                                    dates_range=None,
+                                                    dates_range_exception=None,
+                                                    description=None,
+                                                    dictionary_name=None,
+                                                    dictionary_value=None,
+                                                    hours_range=None,
+                                                    hours_range_exception=None,
+                                                    is_negate=None,
+                                                    link=None,
+                                                    name=None,
+                                                    operator=None,
+                                                    week_days=None,
+                                                    week_days_exception=None,
+                                                    headers=None,
+                                                    payload=None,
+                                                    active_validation=True,
+                                                    **query_parameters):
+        """Coroutine version of `update_network_access_condition_by_id <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.update_network_access_condition_by_id>`_
+        """
+        return await self._run(
+            self._network_access_conditions.update_network_access_condition_by_id,
+            id=id,
+            attribute_name=attribute_name,
+            attribute_value=attribute_value,
+            children=children,
+            condition_type=condition_type,
+            dates_range=dates_range,
+            dates_range_exception=dates_range_exception,
+            description=description,
+            dictionary_name=dictionary_name,
+            dictionary_value=dictionary_value,
+            hours_range=hours_range,
+            hours_range_exception=hours_range_exception,
+            is_negate=is_negate,
+            link=link,
+            name=name,
+            operator=operator,
+            week_days=week_days,
+            week_days_exception=week_days_exception,
+            payload=payload,
+            active_validation=active_validation,
+            headers=headers,
+            **query_parameters
+        )
+
+    async def delete_network_access_condition_by_id(self,
+                                                    id,
+                                                    headers=None,
+                                                    **query_parameters):
+        """Coroutine version of `delete_network_access_condition_by_id <#ciscoisesdk.
+        api.v3_1_0.network_access_conditions.
+        NetworkAccessConditions.delete_network_access_condition_by_id>`_
+        """
+        return await self._run(
+            self._network_access_conditions.delete_network_access_condition_by_id,
+            id=id,
+            headers=headers,
+            **query_parameters
+        )
+
+    get_all = get_network_access_conditions
+    create = create_network_access_condition
+    get_by_name = get_network_access_condition_by_name
+    update_by_name = update_network_access_condition_by_name
+    delete_by_name = delete_network_access_condition_by_name
+    get_all_for_policy_sets = get_network_access_conditions_for_policy_sets
+    get_by_id = get_network_access_condition_by_id
+    update_by_id = update_network_access_condition_by_id
+    delete_by_id = delete_network_access_condition_by_id
@@ -49,6 +49,8 @@ class NetworkAccessProfiles(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NetworkAccessProfiles
         object with the provided RestSession.
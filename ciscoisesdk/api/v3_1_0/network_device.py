@@ -184,6 +184,8 @@ class NetworkDevice(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NetworkDevice
         object with the provided RestSession.
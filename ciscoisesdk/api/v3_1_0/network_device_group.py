@@ -76,6 +76,8 @@ class NetworkDeviceGroup(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NetworkDeviceGroup
         object with the provided RestSession.
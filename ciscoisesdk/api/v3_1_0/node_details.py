@@ -104,6 +104,8 @@ class NodeDetails(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new NodeDetails
         object with the provided RestSession.
@@ -70,6 +70,8 @@ class PortalGlobalSetting(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new PortalGlobalSetting
         object with the provided RestSession.
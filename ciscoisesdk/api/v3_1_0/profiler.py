@@ -70,6 +70,8 @@ class Profiler(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new Profiler
         object with the provided RestSession.
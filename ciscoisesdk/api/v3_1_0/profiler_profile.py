@@ -74,6 +74,8 @@ class ProfilerProfile(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new ProfilerProfile
         object with the provided RestSession.
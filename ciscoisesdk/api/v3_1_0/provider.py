@@ -70,6 +70,8 @@ class Provider(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new Provider
         object with the provided RestSession.
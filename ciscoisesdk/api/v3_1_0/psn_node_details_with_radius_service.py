@@ -74,6 +74,8 @@ class PsnNodeDetailsWithRadiusService(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new PsnNodeDetailsWithRadiusService
         object with the provided RestSession.
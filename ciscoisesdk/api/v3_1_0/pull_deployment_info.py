@@ -154,6 +154,8 @@ class PullDeploymentInfo(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new PullDeploymentInfo
         object with the provided RestSession.
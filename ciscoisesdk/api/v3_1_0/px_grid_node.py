@@ -105,6 +105,8 @@ class PxGridNode(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new PxGridNode
         object with the provided RestSession.
@@ -76,6 +76,8 @@ class PxGridSettings(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new PxGridSettings
         object with the provided RestSession.
@@ -70,6 +70,8 @@ class RadiusFailure(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new RadiusFailure
         object with the provided RestSession.
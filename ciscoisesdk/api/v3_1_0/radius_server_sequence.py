@@ -120,6 +120,8 @@ class RadiusServerSequence(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new RadiusServerSequence
         object with the provided RestSession.
@@ -89,6 +89,8 @@ class RestidStore(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new RestidStore
         object with the provided RestSession.
@@ -93,6 +93,8 @@ class SecurityGroupToVirtualNetwork(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SecurityGroupToVirtualNetwork
         object with the provided RestSession.
@@ -94,6 +94,8 @@ class SecurityGroups(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SecurityGroups
         object with the provided RestSession.
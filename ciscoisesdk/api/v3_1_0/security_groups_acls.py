@@ -88,6 +88,8 @@ class SecurityGroupsAcls(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SecurityGroupsAcls
         object with the provided RestSession.
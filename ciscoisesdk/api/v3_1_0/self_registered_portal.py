@@ -414,6 +414,8 @@ class SelfRegisteredPortal(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SelfRegisteredPortal
         object with the provided RestSession.
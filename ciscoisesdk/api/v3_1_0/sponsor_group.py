@@ -130,6 +130,8 @@ class SponsorGroup(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SponsorGroup
         object with the provided RestSession.
@@ -204,6 +204,8 @@ class SponsorPortal(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SponsorPortal
         object with the provided RestSession.
@@ -254,6 +254,8 @@ class SponsoredGuestPortal(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SponsoredGuestPortal
         object with the provided RestSession.
@@ -74,6 +74,8 @@ class SupportBundleDownload(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SupportBundleDownload
         object with the provided RestSession.
@@ -84,6 +84,8 @@ class SupportBundleStatus(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SupportBundleStatus
         object with the provided RestSession.
@@ -90,6 +90,8 @@ class SxpConnections(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SxpConnections
         object with the provided RestSession.
@@ -86,6 +86,8 @@ class SxpLocalBindings(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SxpLocalBindings
         object with the provided RestSession.
@@ -50,6 +50,8 @@ class SyncIseNode(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SyncIseNode
         object with the provided RestSession.
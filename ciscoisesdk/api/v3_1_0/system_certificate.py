@@ -118,6 +118,8 @@ class SystemCertificate(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new SystemCertificate
         object with the provided RestSession.
@@ -82,6 +82,8 @@ class TacacsExternalServers(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new TacacsExternalServers
         object with the provided RestSession.
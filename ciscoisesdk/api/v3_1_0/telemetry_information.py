@@ -78,6 +78,8 @@ class TelemetryInformation(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new TelemetryInformation
         object with the provided RestSession.
@@ -70,6 +70,8 @@ class TrustSecConfiguration(object):
 
     """
 
+    __slots__ = ('_session', '_object_factory', '_request_validator')
+
     def __init__(self, session, object_factory, request_validator):
         """Initialize a new TrustSecConfiguration
         object with the provided RestSession.
@@ -52,3 +52,42 @@ DEFAULT_USES_API_GATEWAY = True
 #: **uses_csrf_token** default value.
 #: Controls wheter we send the X-CSRF-Token to ISE' ERS APIs.
 DEFAULT_USES_CSRF_TOKEN = False
+
+#: **connection_pool_size** default value.
+#: Number of keep-alive connections kept per host by each RESTful session.
+DEFAULT_CONNECTION_POOL_SIZE = 10
+
+#: **transport** default value.
+#: HTTP version used by each RESTful session, 'h1' (HTTP/1.1) or 'h2' (HTTP/2).
+DEFAULT_TRANSPORT = 'h1'
+
+#: **thread_local_sessions** default value.
+#: Controls whether every thread gets its own `requests` session and pool.
+DEFAULT_THREAD_LOCAL_SESSIONS = False
+
+#: **max_retries** default value.
+#: Times an idempotent request is retried after a connection error or a 5xx
+#: response, 0 disables the retries.
+DEFAULT_MAX_RETRIES = 0
+
+#: **pool_block** default value.
+#: Controls whether a request waits for a pooled connection when all of them
+#: are in use, rather than opening one that is discarded afterwards.
+DEFAULT_POOL_BLOCK = False
+
+#: **cache_enabled** default value.
+#: Controls whether the wrappers that support it keep their GET responses.
+DEFAULT_CACHE_ENABLED = False
+
+#: **cache_ttl** default value.
+#: Seconds a cached response, or a remembered ETag, stays fresh.
+DEFAULT_CACHE_TTL = 60
+
+#: **conditional_requests** default value.
+#: Controls whether the wrappers that support it revalidate their GET
+#: responses with If-None-Match.
+DEFAULT_CONDITIONAL_REQUESTS = False
+
+#: **compress_requests** default value.
+#: Controls whether the wrappers that support it gzip large request bodies.
+DEFAULT_COMPRESS_REQUESTS = False
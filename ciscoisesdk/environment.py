@@ -74,6 +74,40 @@ PX_GRID_BASE_URL_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_PX_GRID_BASE_U
 #: name of the envirorment use_csrf_token
 USES_CSRF_TOKEN_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_USES_CSRF_TOKEN'
 
+#: name of the environment connection_pool_size variable
+CONNECTION_POOL_SIZE_ENVIRONMENT_VARIABLE = \
+    'IDENTITY_SERVICES_ENGINE_CONNECTION_POOL_SIZE'
+
+#: name of the environment transport variable
+TRANSPORT_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_TRANSPORT'
+
+#: name of the environment thread_local_sessions variable
+THREAD_LOCAL_SESSIONS_ENVIRONMENT_VARIABLE = \
+    'IDENTITY_SERVICES_ENGINE_THREAD_LOCAL_SESSIONS'
+
+#: name of the environment max_retries variable
+MAX_RETRIES_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_MAX_RETRIES'
+
+#: name of the environment pool_block variable
+POOL_BLOCK_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_POOL_BLOCK'
+
+#: name of the environment cache_enabled variable
+CACHE_ENABLED_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_CACHE_ENABLED'
+
+#: name of the environment cache_ttl variable
+CACHE_TTL_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_CACHE_TTL'
+
+#: name of the environment conditional_requests variable
+CONDITIONAL_REQUESTS_ENVIRONMENT_VARIABLE = \
+    'IDENTITY_SERVICES_ENGINE_CONDITIONAL_REQUESTS'
+
+#: name of the environment compress_requests variable
+COMPRESS_REQUESTS_ENVIRONMENT_VARIABLE = \
+    'IDENTITY_SERVICES_ENGINE_COMPRESS_REQUESTS'
+
+#: name of the environment skip_checks variable
+SKIP_CHECKS_ENVIRONMENT_VARIABLE = 'IDENTITY_SERVICES_ENGINE_SKIP_CHECKS'
+
 
 def is_bool(value):
     if isinstance(value, str):
@@ -178,3 +212,72 @@ def get_env_uses_csrf_token():
         USES_CSRF_TOKEN_ENVIRONMENT_VARIABLE,
         bool, is_bool)
     return IDENTITY_SERVICES_ENGINE_USES_CSRF_TOKEN
+
+
+def get_env_skip_checks():
+    IDENTITY_SERVICES_ENGINE_SKIP_CHECKS = _get_env_value(
+        SKIP_CHECKS_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_SKIP_CHECKS
+
+
+def get_env_connection_pool_size():
+    IDENTITY_SERVICES_ENGINE_CONNECTION_POOL_SIZE = _get_env_value(
+        CONNECTION_POOL_SIZE_ENVIRONMENT_VARIABLE,
+        int, int)
+    return IDENTITY_SERVICES_ENGINE_CONNECTION_POOL_SIZE
+
+
+def get_env_transport():
+    IDENTITY_SERVICES_ENGINE_TRANSPORT = _get_env_value(
+        TRANSPORT_ENVIRONMENT_VARIABLE, str, str)
+    return IDENTITY_SERVICES_ENGINE_TRANSPORT
+
+
+def get_env_thread_local_sessions():
+    IDENTITY_SERVICES_ENGINE_THREAD_LOCAL_SESSIONS = _get_env_value(
+        THREAD_LOCAL_SESSIONS_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_THREAD_LOCAL_SESSIONS
+
+
+def get_env_max_retries():
+    IDENTITY_SERVICES_ENGINE_MAX_RETRIES = _get_env_value(
+        MAX_RETRIES_ENVIRONMENT_VARIABLE,
+        int, int)
+    return IDENTITY_SERVICES_ENGINE_MAX_RETRIES
+
+
+def get_env_pool_block():
+    IDENTITY_SERVICES_ENGINE_POOL_BLOCK = _get_env_value(
+        POOL_BLOCK_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_POOL_BLOCK
+
+
+def get_env_cache_enabled():
+    IDENTITY_SERVICES_ENGINE_CACHE_ENABLED = _get_env_value(
+        CACHE_ENABLED_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_CACHE_ENABLED
+
+
+def get_env_cache_ttl():
+    IDENTITY_SERVICES_ENGINE_CACHE_TTL = _get_env_value(
+        CACHE_TTL_ENVIRONMENT_VARIABLE,
+        float, float)
+    return IDENTITY_SERVICES_ENGINE_CACHE_TTL
+
+
+def get_env_conditional_requests():
+    IDENTITY_SERVICES_ENGINE_CONDITIONAL_REQUESTS = _get_env_value(
+        CONDITIONAL_REQUESTS_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_CONDITIONAL_REQUESTS
+
+
+def get_env_compress_requests():
+    IDENTITY_SERVICES_ENGINE_COMPRESS_REQUESTS = _get_env_value(
+        COMPRESS_REQUESTS_ENVIRONMENT_VARIABLE,
+        bool, is_bool)
+    return IDENTITY_SERVICES_ENGINE_COMPRESS_REQUESTS
@@ -219,3 +219,28 @@ class RateLimitWarning(UserWarning):
 class MalformedRequest(ciscoisesdkException):
     """Raised when a malformed request is received from Identity Services Engine user."""
     pass
+
+
+class BatchError(ciscoisesdkException):
+    """Raised when some of the requests sent by a batch helper fail.
+
+    The requests that succeeded are not rolled back.
+    """
+
+    def __init__(self, errors, results):
+        # Extended exception attributes
+        self.errors = errors
+        """List of (index, exception) tuples of the failed items, sorted by index."""
+
+        self.results = results
+        """List of results in input order, None for the failed items."""
+
+        super(BatchError, self).__init__(
+            "{failed} of {total} requests failed: {errors}".format(
+                failed=len(self.errors),
+                total=len(self.results),
+                errors=", ".join(
+                    "[{0}] {1!r}".format(index, error) for index, error in self.errors
+                ),
+            )
+        )
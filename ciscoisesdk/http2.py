@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""HTTP/2 transport adapter for the RESTful sessions.
+
+Copyright (c) 2021 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import http.client
+import io
+import threading
+from builtins import *
+
+from past.builtins import basestring
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.response import HTTPResponse
+from requests.utils import select_proxy
+
+from .config import DEFAULT_CONNECTION_POOL_SIZE
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# httpx already decoded the body, these no longer describe it
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class _StreamBody(io.RawIOBase):
+    """File-like body that reads a streamed httpx response as it arrives."""
+
+    def __init__(self, response):
+        super(_StreamBody, self).__init__()
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        self._response.close()
+        super(_StreamBody, self).close()
+
+
+class _OriginalResponse(object):
+    """Stands for the http.client.HTTPResponse of urllib3, requests reads the
+    Set-Cookie headers of the session cookie jar from its msg."""
+
+    def __init__(self, response, method):
+        self.msg = http.client.HTTPMessage()
+        for key, value in response.headers.multi_items():
+            self.msg[key] = value
+        self._method = method
+        self._response = response
+
+    def isclosed(self):
+        return self._response.is_closed
+
+    def close(self):
+        self._response.close()
+
+
+class HTTP2Adapter(HTTPAdapter):
+    """Transport adapter that sends the requests of a `requests` session with
+    httpx over HTTP/2, so concurrent requests to a host are multiplexed on a
+    single TCP+TLS connection.
+
+    Requires the optional httpx package with HTTP/2 support
+    (``pip install httpx[http2]``).
+    """
+
+    def __init__(self, max_connections=DEFAULT_CONNECTION_POOL_SIZE):
+        """Initialize a new HTTP2Adapter object.
+
+        Args:
+            max_connections(int): Maximum number of connections kept open.
+
+        Raises:
+            ImportError: If the httpx package is not installed.
+
+        """
+        if httpx is None:
+            raise ImportError("The 'h2' transport requires the httpx package, "
+                              "install it with: pip install httpx[http2]")
+
+        super(HTTP2Adapter, self).__init__()
+
+        self._limits = httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_connections)
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _get_client(self, verify, cert):
+        # httpx sets the TLS verification and client certificate per client,
+        # not per request
+        key = (verify if isinstance(verify, basestring) else bool(verify), cert)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = httpx.Client(http2=True, verify=verify, cert=cert,
+                                      limits=self._limits)
+                self._clients[key] = client
+            return client
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        """Sends the PreparedRequest with httpx and returns a
+        requests.Response, as `requests.adapters.HTTPAdapter.send` does.
+
+        Raises:
+            ValueError: If a proxy applies to the URL of the request.
+
+        """
+        proxy = select_proxy(request.url, proxies)
+        if proxy:
+            raise ValueError("The 'h2' transport does not go through proxies, "
+                             "use the 'h1' transport to reach {} through {}"
+                             .format(request.url, proxy))
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+
+        body = request.body
+        if hasattr(body, 'read'):
+            body = body.read()
+
+        client = self._get_client(verify, cert)
+        response = client.send(
+            client.build_request(request.method, request.url,
+                                 headers=request.headers, content=body,
+                                 timeout=timeout),
+            stream=True,
+        )
+        if stream:
+            body = _StreamBody(response)
+        else:
+            try:
+                body = io.BytesIO(response.read())
+            finally:
+                response.close()
+        raw = HTTPResponse(
+            body=body,
+            headers=[(key, value) for key, value in response.headers.multi_items()
+                     if key.lower() not in _DROPPED_HEADERS],
+            status=response.status_code,
+            reason=response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            original_response=_OriginalResponse(response, request.method),
+        )
+        return self.build_response(request, raw)
+
+    def close(self):
+        """Closes the httpx clients and the pooled connections."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+        super(HTTP2Adapter, self).close()
@@ -1 +1,45 @@
 # -*- coding: utf-8 -*-
+"""Helpers shared by the request schema validators.
+
+Copyright (c) 2021 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+from builtins import *
+
+import fastjsonschema
+
+# Compiled validators by schema content. Many endpoints share the same
+# request schema, which is then compiled only once.
+_compiled_schemas = {}
+
+
+def compile_schema(schema):
+    """Compile a JSON schema, reusing the validator of an identical one."""
+    key = json.dumps(schema, sort_keys=True)
+    validator = _compiled_schemas.get(key)
+    if validator is None:
+        validator = fastjsonschema.compile(schema)
+        _compiled_schemas[key] = validator
+    return validator
@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidator9F955525B0B38A57A3Bed311(object):
     """createCertificateProfile request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidator9F955525B0B38A57A3Bed311, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "CertificateProfile": {
-                "properties": {
-                "allowedAsUserName": {
-                "type": "boolean"
-                },
-                "certificateAttributeName": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "externalIdentityStoreName": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "matchMode": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "usernameFrom": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "allowedAsUserName": {
+                            "type": "boolean"
+                        },
+                        "certificateAttributeName": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "externalIdentityStoreName": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "matchMode": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "usernameFrom": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
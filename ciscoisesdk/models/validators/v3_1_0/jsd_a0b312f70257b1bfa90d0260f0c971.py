@@ -25,284 +25,283 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA0B312F70257B1Bfa90D0260F0C971(object):
     """updateAllowedProtocolById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA0B312F70257B1Bfa90D0260F0C971, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "AllowedProtocols": {
-                "properties": {
-                "allowChap": {
-                "type": "boolean"
-                },
-                "allowEapFast": {
-                "type": "boolean"
-                },
-                "allowEapMd5": {
-                "type": "boolean"
-                },
-                "allowEapTls": {
-                "type": "boolean"
-                },
-                "allowEapTtls": {
-                "type": "boolean"
-                },
-                "allowLeap": {
-                "type": "boolean"
-                },
-                "allowMsChapV1": {
-                "type": "boolean"
-                },
-                "allowMsChapV2": {
-                "type": "boolean"
-                },
-                "allowPapAscii": {
-                "type": "boolean"
-                },
-                "allowPeap": {
-                "type": "boolean"
-                },
-                "allowPreferredEapProtocol": {
-                "type": "boolean"
-                },
-                "allowTeap": {
-                "type": "boolean"
-                },
-                "allowWeakCiphersForEap": {
-                "type": "boolean"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "eapFast": {
-                "properties": {
-                "allowEapFastEapGtc": {
-                "type": "boolean"
-                },
-                "allowEapFastEapGtcPwdChange": {
-                "type": "boolean"
-                },
-                "allowEapFastEapGtcPwdChangeRetries": {
-                "type": "integer"
-                },
-                "allowEapFastEapMsChapV2": {
-                "type": "boolean"
-                },
-                "allowEapFastEapMsChapV2PwdChange": {
-                "type": "boolean"
-                },
-                "allowEapFastEapMsChapV2PwdChangeRetries": {
-                "type": "integer"
-                },
-                "allowEapFastEapTls": {
-                "type": "boolean"
-                },
-                "allowEapFastEapTlsAuthOfExpiredCerts": {
-                "type": "boolean"
-                },
-                "eapFastDontUsePacsAcceptClientCert": {
-                "type": "boolean"
-                },
-                "eapFastDontUsePacsAllowMachineAuthentication": {
-                "type": "boolean"
-                },
-                "eapFastEnableEAPChaining": {
-                "type": "boolean"
-                },
-                "eapFastUsePacs": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsAcceptClientCert": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsAllowAnonymProvisioning": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsAllowAuthenProvisioning": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsAllowMachineAuthentication": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsAuthorizationPacTtl": {
-                "type": "integer"
-                },
-                "eapFastUsePacsAuthorizationPacTtlUnits": {
-                "type": "string"
-                },
-                "eapFastUsePacsMachinePacTtl": {
-                "type": "integer"
-                },
-                "eapFastUsePacsMachinePacTtlUnits": {
-                "type": "string"
-                },
-                "eapFastUsePacsReturnAccessAcceptAfterAuthenticatedProvisioning": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsStatelessSessionResume": {
-                "type": "boolean"
-                },
-                "eapFastUsePacsTunnelPacTtl": {
-                "type": "integer"
-                },
-                "eapFastUsePacsTunnelPacTtlUnits": {
-                "type": "string"
-                },
-                "eapFastUsePacsUseProactivePacUpdatePrecentage": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "eapTls": {
-                "properties": {
-                "allowEapTlsAuthOfExpiredCerts": {
-                "type": "boolean"
-                },
-                "eapTlsEnableStatelessSessionResume": {
-                "type": "boolean"
-                },
-                "eapTlsSessionTicketPrecentage": {
-                "type": "integer"
-                },
-                "eapTlsSessionTicketTtl": {
-                "type": "integer"
-                },
-                "eapTlsSessionTicketTtlUnits": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "eapTlsLBit": {
-                "type": "boolean"
-                },
-                "eapTtls": {
-                "properties": {
-                "eapTtlsChap": {
-                "type": "boolean"
-                },
-                "eapTtlsEapMd5": {
-                "type": "boolean"
-                },
-                "eapTtlsEapMsChapV2": {
-                "type": "boolean"
-                },
-                "eapTtlsEapMsChapV2PwdChange": {
-                "type": "boolean"
-                },
-                "eapTtlsEapMsChapV2PwdChangeRetries": {
-                "type": "integer"
-                },
-                "eapTtlsMsChapV1": {
-                "type": "boolean"
-                },
-                "eapTtlsMsChapV2": {
-                "type": "boolean"
-                },
-                "eapTtlsPapAscii": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "peap": {
-                "properties": {
-                "allowPeapEapGtc": {
-                "type": "boolean"
-                },
-                "allowPeapEapGtcPwdChange": {
-                "type": "boolean"
-                },
-                "allowPeapEapGtcPwdChangeRetries": {
-                "type": "integer"
-                },
-                "allowPeapEapMsChapV2": {
-                "type": "boolean"
-                },
-                "allowPeapEapMsChapV2PwdChange": {
-                "type": "boolean"
-                },
-                "allowPeapEapMsChapV2PwdChangeRetries": {
-                "type": "integer"
-                },
-                "allowPeapEapTls": {
-                "type": "boolean"
-                },
-                "allowPeapEapTlsAuthOfExpiredCerts": {
-                "type": "boolean"
-                },
-                "allowPeapV0": {
-                "type": "boolean"
-                },
-                "requireCryptobinding": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "preferredEapProtocol": {
-                "type": "string"
-                },
-                "processHostLookup": {
-                "type": "boolean"
-                },
-                "requireMessageAuth": {
-                "type": "boolean"
-                },
-                "teap": {
-                "properties": {
-                "acceptClientCertDuringTunnelEst": {
-                "type": "boolean"
-                },
-                "allowDowngradeMsk": {
-                "type": "boolean"
-                },
-                "allowTeapEapMsChapV2": {
-                "type": "boolean"
-                },
-                "allowTeapEapMsChapV2PwdChange": {
-                "type": "boolean"
-                },
-                "allowTeapEapMsChapV2PwdChangeRetries": {
-                "type": "integer"
-                },
-                "allowTeapEapTls": {
-                "type": "boolean"
-                },
-                "allowTeapEapTlsAuthOfExpiredCerts": {
-                "type": "boolean"
-                },
-                "enableEapChaining": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "allowChap": {
+                            "type": "boolean"
+                        },
+                        "allowEapFast": {
+                            "type": "boolean"
+                        },
+                        "allowEapMd5": {
+                            "type": "boolean"
+                        },
+                        "allowEapTls": {
+                            "type": "boolean"
+                        },
+                        "allowEapTtls": {
+                            "type": "boolean"
+                        },
+                        "allowLeap": {
+                            "type": "boolean"
+                        },
+                        "allowMsChapV1": {
+                            "type": "boolean"
+                        },
+                        "allowMsChapV2": {
+                            "type": "boolean"
+                        },
+                        "allowPapAscii": {
+                            "type": "boolean"
+                        },
+                        "allowPeap": {
+                            "type": "boolean"
+                        },
+                        "allowPreferredEapProtocol": {
+                            "type": "boolean"
+                        },
+                        "allowTeap": {
+                            "type": "boolean"
+                        },
+                        "allowWeakCiphersForEap": {
+                            "type": "boolean"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "eapFast": {
+                            "properties": {
+                                "allowEapFastEapGtc": {
+                                    "type": "boolean"
+                                },
+                                "allowEapFastEapGtcPwdChange": {
+                                    "type": "boolean"
+                                },
+                                "allowEapFastEapGtcPwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "allowEapFastEapMsChapV2": {
+                                    "type": "boolean"
+                                },
+                                "allowEapFastEapMsChapV2PwdChange": {
+                                    "type": "boolean"
+                                },
+                                "allowEapFastEapMsChapV2PwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "allowEapFastEapTls": {
+                                    "type": "boolean"
+                                },
+                                "allowEapFastEapTlsAuthOfExpiredCerts": {
+                                    "type": "boolean"
+                                },
+                                "eapFastDontUsePacsAcceptClientCert": {
+                                    "type": "boolean"
+                                },
+                                "eapFastDontUsePacsAllowMachineAuthentication": {
+                                    "type": "boolean"
+                                },
+                                "eapFastEnableEAPChaining": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacs": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsAcceptClientCert": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsAllowAnonymProvisioning": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsAllowAuthenProvisioning": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsAllowMachineAuthentication": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsAuthorizationPacTtl": {
+                                    "type": "integer"
+                                },
+                                "eapFastUsePacsAuthorizationPacTtlUnits": {
+                                    "type": "string"
+                                },
+                                "eapFastUsePacsMachinePacTtl": {
+                                    "type": "integer"
+                                },
+                                "eapFastUsePacsMachinePacTtlUnits": {
+                                    "type": "string"
+                                },
+                                "eapFastUsePacsReturnAccessAcceptAfterAuthenticatedProvisioning": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsStatelessSessionResume": {
+                                    "type": "boolean"
+                                },
+                                "eapFastUsePacsTunnelPacTtl": {
+                                    "type": "integer"
+                                },
+                                "eapFastUsePacsTunnelPacTtlUnits": {
+                                    "type": "string"
+                                },
+                                "eapFastUsePacsUseProactivePacUpdatePrecentage": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "eapTls": {
+                            "properties": {
+                                "allowEapTlsAuthOfExpiredCerts": {
+                                    "type": "boolean"
+                                },
+                                "eapTlsEnableStatelessSessionResume": {
+                                    "type": "boolean"
+                                },
+                                "eapTlsSessionTicketPrecentage": {
+                                    "type": "integer"
+                                },
+                                "eapTlsSessionTicketTtl": {
+                                    "type": "integer"
+                                },
+                                "eapTlsSessionTicketTtlUnits": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "eapTlsLBit": {
+                            "type": "boolean"
+                        },
+                        "eapTtls": {
+                            "properties": {
+                                "eapTtlsChap": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsEapMd5": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsEapMsChapV2": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsEapMsChapV2PwdChange": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsEapMsChapV2PwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "eapTtlsMsChapV1": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsMsChapV2": {
+                                    "type": "boolean"
+                                },
+                                "eapTtlsPapAscii": {
+                                    "type": "boolean"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "peap": {
+                            "properties": {
+                                "allowPeapEapGtc": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapEapGtcPwdChange": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapEapGtcPwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "allowPeapEapMsChapV2": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapEapMsChapV2PwdChange": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapEapMsChapV2PwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "allowPeapEapTls": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapEapTlsAuthOfExpiredCerts": {
+                                    "type": "boolean"
+                                },
+                                "allowPeapV0": {
+                                    "type": "boolean"
+                                },
+                                "requireCryptobinding": {
+                                    "type": "boolean"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "preferredEapProtocol": {
+                            "type": "string"
+                        },
+                        "processHostLookup": {
+                            "type": "boolean"
+                        },
+                        "requireMessageAuth": {
+                            "type": "boolean"
+                        },
+                        "teap": {
+                            "properties": {
+                                "acceptClientCertDuringTunnelEst": {
+                                    "type": "boolean"
+                                },
+                                "allowDowngradeMsk": {
+                                    "type": "boolean"
+                                },
+                                "allowTeapEapMsChapV2": {
+                                    "type": "boolean"
+                                },
+                                "allowTeapEapMsChapV2PwdChange": {
+                                    "type": "boolean"
+                                },
+                                "allowTeapEapMsChapV2PwdChangeRetries": {
+                                    "type": "integer"
+                                },
+                                "allowTeapEapTls": {
+                                    "type": "boolean"
+                                },
+                                "allowTeapEapTlsAuthOfExpiredCerts": {
+                                    "type": "boolean"
+                                },
+                                "enableEapChaining": {
+                                    "type": "boolean"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
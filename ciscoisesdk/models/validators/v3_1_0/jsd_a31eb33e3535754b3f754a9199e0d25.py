@@ -25,33 +25,33 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA31Eb33E3535754B3F754A9199E0D25(object):
     """createGuestSsid request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA31Eb33E3535754B3F754A9199E0D25, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "GuestSSID": {
-                "properties": {
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,42 +25,42 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA5A26C964E53B3Be3F9F0C103F304C(object):
     """updateIPToSGTMappingGroupById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA5A26C964E53B3Be3F9F0C103F304C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SGMappingGroup": {
-                "properties": {
-                "deployTo": {
-                "type": "string"
-                },
-                "deployType": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sgt": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "deployTo": {
+                            "type": "string"
+                        },
+                        "deployType": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sgt": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,96 +25,95 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA60B29BfE2B055299E4360D84380Ddd4(object):
     """updateNetworkAccessDictionaryAttributeByName request schema
     definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA60B29BfE2B055299E4360D84380Ddd4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "allowedValues": {
-                "items": {
-                "properties": {
-                "isDefault": {
-                "type": "boolean"
-                },
-                "key": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "key",
-                "value"
-                ],
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "properties": {
+                            "isDefault": {
+                                "type": "boolean"
+                            },
+                            "key": {
+                                "type": "string"
+                            },
+                            "value": {
+                                "type": "string"
+                            }
+                        },
+                        "required": [
+                            "key",
+                            "value"
+                        ],
+                        "type": "object"
+                    },
+                    "type": "array"
                 },
                 "dataType": {
-                "enum": [
-                "BOOLEAN",
-                "DATE",
-                "FLOAT",
-                "INT",
-                "IP",
-                "IPV4",
-                "IPV6",
-                "IPV6INTERFACE",
-                "IPV6PREFIX",
-                "LONG",
-                "OCTET_STRING",
-                "STRING",
-                "UINT64",
-                "UNIT32"
-                ],
-                "type": "string"
+                    "enum": [
+                        "BOOLEAN",
+                        "DATE",
+                        "FLOAT",
+                        "INT",
+                        "IP",
+                        "IPV4",
+                        "IPV6",
+                        "IPV6INTERFACE",
+                        "IPV6PREFIX",
+                        "LONG",
+                        "OCTET_STRING",
+                        "STRING",
+                        "UINT64",
+                        "UNIT32"
+                    ],
+                    "type": "string"
                 },
-                "description":
-                 {
-                "type": "string"
+                "description": {
+                    "type": "string"
                 },
                 "dictionaryName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "directionType": {
-                "enum": [
-                "BOTH",
-                "IN",
-                "NONE",
-                "OUT"
-                ],
-                "type": "string"
+                    "enum": [
+                        "BOTH",
+                        "IN",
+                        "NONE",
+                        "OUT"
+                    ],
+                    "type": "string"
                 },
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "internalName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "dataType",
                 "internalName",
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
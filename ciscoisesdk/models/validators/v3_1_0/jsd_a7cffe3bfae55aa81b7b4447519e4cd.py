@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA7Cffe3Bfae55Aa81B7B4447519E4Cd(object):
     """updateTACACSExternalServersById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA7Cffe3Bfae55Aa81B7B4447519E4Cd, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "TacacsExternalServer": {
-                "properties": {
-                "connectionPort": {
-                "type": "integer"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "hostIP": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sharedSecret": {
-                "type": "string"
-                },
-                "singleConnect": {
-                "type": "boolean"
-                },
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "connectionPort": {
+                            "type": "integer"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "hostIP": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sharedSecret": {
+                            "type": "string"
+                        },
+                        "singleConnect": {
+                            "type": "boolean"
+                        },
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,59 +25,58 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA99695Fd5Ee0B00EFce79A5761Ff(object):
     """updateNodeGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA99695Fd5Ee0B00EFce79A5761Ff, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
-                "description":
-                 {
-                "maxLength": 256,
-                "minLength": 1,
-                "type": "string"
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
+                "description": {
+                    "maxLength": 256,
+                    "minLength": 1,
+                    "type": "string"
                 },
                 "mar-cache": {
-                "properties": {
-                "enabled": {
-                "type": "boolean"
-                },
-                "query-attempts": {
-                "maximum": 5,
-                "minimum": 0,
-                "type": "integer"
-                },
-                "query-timeout": {
-                "maximum": 10,
-                "minimum": 1,
-                "type": "integer"
-                },
-                "replication-attempts": {
-                "maximum": 5,
-                "minimum": 0,
-                "type": "integer"
-                },
-                "replication-timeout": {
-                "maximum": 10,
-                "minimum": 1,
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "enabled": {
+                            "type": "boolean"
+                        },
+                        "query-attempts": {
+                            "maximum": 5,
+                            "minimum": 0,
+                            "type": "integer"
+                        },
+                        "query-timeout": {
+                            "maximum": 10,
+                            "minimum": 1,
+                            "type": "integer"
+                        },
+                        "replication-attempts": {
+                            "maximum": 5,
+                            "minimum": 0,
+                            "type": "integer"
+                        },
+                        "replication-timeout": {
+                            "maximum": 10,
+                            "minimum": 1,
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,113 +25,112 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAb88Be5092Bf4BA9F522E8E26F(object):
     """createEndpoint request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAb88Be5092Bf4BA9F522E8E26F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSEndPoint": {
-                "properties": {
-                "customAttributes": {
-                "properties": {
-                "customAttributes": {
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "groupId": {
-                "type": "string"
-                },
-                "identityStore": {
-                "type": "string"
-                },
-                "identityStoreId": {
-                "type": "string"
-                },
-                "mac": {
-                "type": "string"
-                },
-                "mdmAttributes": {
-                "properties": {
-                "mdmComplianceStatus": {
-                "type": "boolean"
-                },
-                "mdmEncrypted": {
-                "type": "boolean"
-                },
-                "mdmEnrolled": {
-                "type": "boolean"
-                },
-                "mdmIMEI": {
-                "type": "string"
-                },
-                "mdmJailBroken": {
-                "type": "boolean"
-                },
-                "mdmManufacturer": {
-                "type": "string"
-                },
-                "mdmModel": {
-                "type": "string"
-                },
-                "mdmOS": {
-                "type": "string"
-                },
-                "mdmPhoneNumber": {
-                "type": "string"
-                },
-                "mdmPinlock": {
-                "type": "boolean"
-                },
-                "mdmReachable": {
-                "type": "boolean"
-                },
-                "mdmSerial": {
-                "type": "string"
-                },
-                "mdmServerName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalUser": {
-                "type": "string"
-                },
-                "profileId": {
-                "type": "string"
-                },
-                "staticGroupAssignment": {
-                "type": "boolean"
-                },
-                "staticProfileAssignment": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customAttributes": {
+                            "properties": {
+                                "customAttributes": {
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "groupId": {
+                            "type": "string"
+                        },
+                        "identityStore": {
+                            "type": "string"
+                        },
+                        "identityStoreId": {
+                            "type": "string"
+                        },
+                        "mac": {
+                            "type": "string"
+                        },
+                        "mdmAttributes": {
+                            "properties": {
+                                "mdmComplianceStatus": {
+                                    "type": "boolean"
+                                },
+                                "mdmEncrypted": {
+                                    "type": "boolean"
+                                },
+                                "mdmEnrolled": {
+                                    "type": "boolean"
+                                },
+                                "mdmIMEI": {
+                                    "type": "string"
+                                },
+                                "mdmJailBroken": {
+                                    "type": "boolean"
+                                },
+                                "mdmManufacturer": {
+                                    "type": "string"
+                                },
+                                "mdmModel": {
+                                    "type": "string"
+                                },
+                                "mdmOS": {
+                                    "type": "string"
+                                },
+                                "mdmPhoneNumber": {
+                                    "type": "string"
+                                },
+                                "mdmPinlock": {
+                                    "type": "boolean"
+                                },
+                                "mdmReachable": {
+                                    "type": "boolean"
+                                },
+                                "mdmSerial": {
+                                    "type": "string"
+                                },
+                                "mdmServerName": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalUser": {
+                            "type": "string"
+                        },
+                        "profileId": {
+                            "type": "string"
+                        },
+                        "staticGroupAssignment": {
+                            "type": "boolean"
+                        },
+                        "staticProfileAssignment": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,116 +25,115 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAd6Ca0642C5750Af6CA9905721A9D7(object):
     """createRadiusServerSequence request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAd6Ca0642C5750Af6CA9905721A9D7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "RadiusServerSequence": {
-                "properties": {
-                "BeforeAcceptAttrManipulatorsList": {
-                "items": {
-                "properties": {
-                "action": {
-                "type": "string"
-                },
-                "attributeName": {
-                "type": "string"
-                },
-                "changedVal": {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "OnRequestAttrManipulatorList": {
-                "items": {
-                "properties": {
-                "action": {
-                "type": "string"
-                },
-                "attributeName": {
-                "type": "string"
-                },
-                "changedVal": {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "RadiusServerList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "continueAuthorzPolicy": {
-                "type": "boolean"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "localAccounting": {
-                "type": "boolean"
-                },
-                "name": {
-                "type": "string"
-                },
-                "prefixSeparator": {
-                "type": "string"
-                },
-                "remoteAccounting": {
-                "type": "boolean"
-                },
-                "stripPrefix": {
-                "type": "boolean"
-                },
-                "stripSuffix": {
-                "type": "boolean"
-                },
-                "suffixSeparator": {
-                "type": "string"
-                },
-                "useAttrSetBeforeAcc": {
-                "type": "boolean"
-                },
-                "useAttrSetOnRequest": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "BeforeAcceptAttrManipulatorsList": {
+                            "items": {
+                                "properties": {
+                                    "action": {
+                                        "type": "string"
+                                    },
+                                    "attributeName": {
+                                        "type": "string"
+                                    },
+                                    "changedVal": {
+                                        "type": "string"
+                                    },
+                                    "dictionaryName": {
+                                        "type": "string"
+                                    },
+                                    "value": {
+                                        "type": "string"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "OnRequestAttrManipulatorList": {
+                            "items": {
+                                "properties": {
+                                    "action": {
+                                        "type": "string"
+                                    },
+                                    "attributeName": {
+                                        "type": "string"
+                                    },
+                                    "changedVal": {
+                                        "type": "string"
+                                    },
+                                    "dictionaryName": {
+                                        "type": "string"
+                                    },
+                                    "value": {
+                                        "type": "string"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "RadiusServerList": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "continueAuthorzPolicy": {
+                            "type": "boolean"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "localAccounting": {
+                            "type": "boolean"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "prefixSeparator": {
+                            "type": "string"
+                        },
+                        "remoteAccounting": {
+                            "type": "boolean"
+                        },
+                        "stripPrefix": {
+                            "type": "boolean"
+                        },
+                        "stripSuffix": {
+                            "type": "boolean"
+                        },
+                        "suffixSeparator": {
+                            "type": "string"
+                        },
+                        "useAttrSetBeforeAcc": {
+                            "type": "boolean"
+                        },
+                        "useAttrSetOnRequest": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
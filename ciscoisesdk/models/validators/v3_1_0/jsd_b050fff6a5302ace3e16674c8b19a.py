@@ -25,43 +25,43 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB050FFf6A5302Ace3E16674C8B19A(object):
     """createSgVnMapping request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB050FFf6A5302Ace3E16674C8B19A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "lastUpdate": {
-                "type": "string"
+                    "type": "string"
                 },
                 "sgName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "sgtId": {
-                "type": "string"
+                    "type": "string"
                 },
                 "vnId": {
-                "type": "string"
+                    "type": "string"
                 },
                 "vnName": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,33 +25,33 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB11E2F1Af656BcB5880A7B33720Ec5(object):
     """promoteNode request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB11E2F1Af656BcB5880A7B33720Ec5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "promotionType": {
-                "enum": [
-                "SECONDARY_TO_PRIMARY",
-                "STANDALONE_TO_PRIMARY",
-                "TO_STANDALONE"
-                ],
-                "type": "string"
+                    "enum": [
+                        "SECONDARY_TO_PRIMARY",
+                        "STANDALONE_TO_PRIMARY",
+                        "TO_STANDALONE"
+                    ],
+                    "type": "string"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,43 +25,43 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB8319A8B5D195348A8763Acd95Ca2967(object):
     """restoreConfigBackup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB8319A8B5D195348A8763Acd95Ca2967, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "backupEncryptionKey": {
-                "type": "string"
+                    "type": "string"
                 },
                 "repositoryName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "restoreFile": {
-                "type": "string"
+                    "type": "string"
                 },
                 "restoreIncludeAdeos": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "backupEncryptionKey",
                 "repositoryName",
                 "restoreFile",
                 "restoreIncludeAdeos"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
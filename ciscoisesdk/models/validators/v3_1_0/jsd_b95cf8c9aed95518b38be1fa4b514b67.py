@@ -25,147 +25,145 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB95Cf8C9Aed95518B38BE1Fa4B514B67(object):
     """createDeviceAdminNetworkCondition request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB95Cf8C9Aed95518B38BE1Fa4B514B67, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "conditionType": {
-                "enum": [
-                "DeviceCondition",
-                "DevicePortCondition",
-                "EndstationCondition"
-                ],
-                "type": "string"
+                    "enum": [
+                        "DeviceCondition",
+                        "DevicePortCondition",
+                        "EndstationCondition"
+                    ],
+                    "type": "string"
                 },
                 "conditions": {
-                "items": {
-                "properties": {
-                "cliDnisList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "conditionType": {
-                "enum": [
-                "DeviceCondition",
-                "DevicePortCondition",
-                "EndstationCondition"
-                ],
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "deviceGroupList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "deviceList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "id": {
-                "readOnly": true,
-                "type": "string"
-                },
-                "ipAddrList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "macAddrList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "description":
-                 {
-                "type": "string"
+                    "items": {
+                        "properties": {
+                            "cliDnisList": {
+                                "items": {
+                                    "type": "string"
+                                },
+                                "type": "array"
+                            },
+                            "conditionType": {
+                                "enum": [
+                                    "DeviceCondition",
+                                    "DevicePortCondition",
+                                    "EndstationCondition"
+                                ],
+                                "type": "string"
+                            },
+                            "description": {
+                                "type": "string"
+                            },
+                            "deviceGroupList": {
+                                "items": {
+                                    "type": "string"
+                                },
+                                "type": "array"
+                            },
+                            "deviceList": {
+                                "items": {
+                                    "type": "string"
+                                },
+                                "type": "array"
+                            },
+                            "id": {
+                                "readOnly": True,
+                                "type": "string"
+                            },
+                            "ipAddrList": {
+                                "items": {
+                                    "type": "string"
+                                },
+                                "type": "array"
+                            },
+                            "link": {
+                                "properties": {
+                                    "href": {
+                                        "type": "string"
+                                    },
+                                    "rel": {
+                                        "enum": [
+                                            "next",
+                                            "previous",
+                                            "self",
+                                            "status"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": {
+                                        "type": "string"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "macAddrList": {
+                                "items": {
+                                    "type": "string"
+                                },
+                                "type": "array"
+                            },
+                            "name": {
+                                "type": "string"
+                            }
+                        },
+                        "type": "object"
+                    },
+                    "type": "array"
+                },
+                "description": {
+                    "type": "string"
                 },
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "href"
-                ],
-                "type": "object"
+                    "properties": {
+                        "href": {
+                            "type": "string"
+                        },
+                        "rel": {
+                            "enum": [
+                                "next",
+                                "previous",
+                                "self",
+                                "status"
+                            ],
+                            "type": "string"
+                        },
+                        "type": {
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "href"
+                    ],
+                    "type": "object"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "conditionType",
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
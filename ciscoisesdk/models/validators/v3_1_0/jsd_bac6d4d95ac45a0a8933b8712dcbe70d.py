@@ -25,138 +25,137 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBac6D4D95Ac45A0A8933B8712Dcbe70D(object):
     """updateGuestTypeById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBac6D4D95Ac45A0A8933B8712Dcbe70D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "GuestType": {
-                "properties": {
-                "accessTime": {
-                "properties": {
-                "allowAccessOnSpecificDaysTimes": {
-                "type": "boolean"
-                },
-                "dayTimeLimits": {
-                "items": {
-                "properties": {
-                "days": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "defaultDuration": {
-                "type": "integer"
-                },
-                "durationTimeUnit": {
-                "type": "string"
-                },
-                "fromFirstLogin": {
-                "type": "boolean"
-                },
-                "maxAccountDuration": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "expirationNotification": {
-                "properties": {
-                "advanceNotificationDuration": {
-                "type": "integer"
-                },
-                "advanceNotificationUnits": {
-                "type": "string"
-                },
-                "emailText": {
-                "type": "string"
-                },
-                "enableNotification": {
-                "type": "boolean"
-                },
-                "sendEmailNotification": {
-                "type": "boolean"
-                },
-                "sendSmsNotification": {
-                "type": "boolean"
-                },
-                "smsText": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "id": {
-                "type": "string"
-                },
-                "isDefaultType": {
-                "type": "boolean"
-                },
-                "loginOptions": {
-                "properties": {
-                "allowGuestPortalBypass": {
-                "type": "boolean"
-                },
-                "failureAction": {
-                "type": "string"
-                },
-                "identityGroupId": {
-                "type": "string"
-                },
-                "limitSimultaneousLogins": {
-                "type": "boolean"
-                },
-                "maxRegisteredDevices": {
-                "type": "integer"
-                },
-                "maxSimultaneousLogins": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sponsorGroups": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "accessTime": {
+                            "properties": {
+                                "allowAccessOnSpecificDaysTimes": {
+                                    "type": "boolean"
+                                },
+                                "dayTimeLimits": {
+                                    "items": {
+                                        "properties": {
+                                            "days": {
+                                                "items": {
+                                                    "type": "string"
+                                                },
+                                                "type": "array"
+                                            },
+                                            "endTime": {
+                                                "type": "string"
+                                            },
+                                            "startTime": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                },
+                                "defaultDuration": {
+                                    "type": "integer"
+                                },
+                                "durationTimeUnit": {
+                                    "type": "string"
+                                },
+                                "fromFirstLogin": {
+                                    "type": "boolean"
+                                },
+                                "maxAccountDuration": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "expirationNotification": {
+                            "properties": {
+                                "advanceNotificationDuration": {
+                                    "type": "integer"
+                                },
+                                "advanceNotificationUnits": {
+                                    "type": "string"
+                                },
+                                "emailText": {
+                                    "type": "string"
+                                },
+                                "enableNotification": {
+                                    "type": "boolean"
+                                },
+                                "sendEmailNotification": {
+                                    "type": "boolean"
+                                },
+                                "sendSmsNotification": {
+                                    "type": "boolean"
+                                },
+                                "smsText": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "isDefaultType": {
+                            "type": "boolean"
+                        },
+                        "loginOptions": {
+                            "properties": {
+                                "allowGuestPortalBypass": {
+                                    "type": "boolean"
+                                },
+                                "failureAction": {
+                                    "type": "string"
+                                },
+                                "identityGroupId": {
+                                    "type": "string"
+                                },
+                                "limitSimultaneousLogins": {
+                                    "type": "boolean"
+                                },
+                                "maxRegisteredDevices": {
+                                    "type": "integer"
+                                },
+                                "maxSimultaneousLogins": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sponsorGroups": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
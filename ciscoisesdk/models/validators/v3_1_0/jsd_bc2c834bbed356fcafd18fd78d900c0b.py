@@ -25,55 +25,55 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBc2C834BBed356FcAfd18Fd78D900C0B(object):
     """bulkUpdateVnVlanMappings request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBc2C834BBed356FcAfd18Fd78D900C0B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "items": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "items": {
                 "properties": {
-                "id": {
-                "type": "string"
-                },
-                "isData": {
-                "type": "boolean"
-                },
-                "isDefaultVlan": {
-                "type": "boolean"
-                },
-                "lastUpdate": {
-                "type": "string"
-                },
-                "maxValue": {
-                "type": "integer"
-                },
-                "name": {
-                "type": "string"
-                },
-                "vnId": {
-                "type": "string"
-                },
-                "vnName": {
-                "type": "string"
-                }
+                    "id": {
+                        "type": "string"
+                    },
+                    "isData": {
+                        "type": "boolean"
+                    },
+                    "isDefaultVlan": {
+                        "type": "boolean"
+                    },
+                    "lastUpdate": {
+                        "type": "string"
+                    },
+                    "maxValue": {
+                        "type": "integer"
+                    },
+                    "name": {
+                        "type": "string"
+                    },
+                    "vnId": {
+                        "type": "string"
+                    },
+                    "vnName": {
+                        "type": "string"
+                    }
                 },
                 "required": [
-                "name"
+                    "name"
                 ],
                 "type": "object"
-                },
-                "type": "array"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "array"
+        })
 
     def validate(self, request):
         try:
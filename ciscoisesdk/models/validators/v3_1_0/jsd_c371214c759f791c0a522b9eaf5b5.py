@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC371214C759F791C0A522B9Eaf5B5(object):
     """createSXPConnections request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC371214C759F791C0A522B9Eaf5B5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSSxpConnection": {
-                "properties": {
-                "description":
-                 {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "ipAddress": {
-                "type": "string"
-                },
-                "sxpMode": {
-                "type": "string"
-                },
-                "sxpNode": {
-                "type": "string"
-                },
-                "sxpPeer": {
-                "type": "string"
-                },
-                "sxpVersion": {
-                "type": "string"
-                },
-                "sxpVpn": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "description": {
+                            "type": "string"
+                        },
+                        "enabled": {
+                            "type": "boolean"
+                        },
+                        "ipAddress": {
+                            "type": "string"
+                        },
+                        "sxpMode": {
+                            "type": "string"
+                        },
+                        "sxpNode": {
+                            "type": "string"
+                        },
+                        "sxpPeer": {
+                            "type": "string"
+                        },
+                        "sxpVersion": {
+                            "type": "string"
+                        },
+                        "sxpVpn": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
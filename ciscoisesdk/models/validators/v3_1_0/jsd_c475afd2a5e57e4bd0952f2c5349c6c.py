@@ -25,296 +25,295 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC475Afd2A5E57E4Bd0952F2C5349C6C(object):
     """createNetworkAccessLocalExceptionRule request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC475Afd2A5E57E4Bd0952F2C5349C6C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "href"
-                ],
-                "type": "object"
+                    "properties": {
+                        "href": {
+                            "type": "string"
+                        },
+                        "rel": {
+                            "enum": [
+                                "next",
+                                "previous",
+                                "self",
+                                "status"
+                            ],
+                            "type": "string"
+                        },
+                        "type": {
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "href"
+                    ],
+                    "type": "object"
                 },
                 "profile": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "rule": {
-                "properties": {
-                "condition": {
-                "properties": {
-                "attributeName": {
-                "type": "string"
-                },
-                "attributeValue": {
-                "type": "string"
-                },
-                "children": {
-                "items": {
-                "properties": {
-                "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
-                },
-                "isNegate": {
-                "type": "boolean"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
-                },
-                "datesRange": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "datesRangeException": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "dictionaryValue": {
-                "type": "string"
-                },
-                "hoursRange": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "hoursRangeException": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "id": {
-                "type": "string"
-                },
-                "isNegate": {
-                "type": "boolean"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                },
-                "operator": {
-                "enum": [
-                "contains",
-                "endsWith",
-                "equals",
-                "greaterOrEquals",
-                "greaterThan",
-                "in",
-                "ipEquals",
-                "ipGreaterThan",
-                "ipLessThan",
-                "ipNotEquals",
-                "lessOrEquals",
-                "lessThan",
-                "matches",
-                "notContains",
-                "notEndsWith",
-                "notEquals",
-                "notIn",
-                "notStartsWith",
-                "startsWith"
-                ],
-                "type": "string"
-                },
-                "weekDays": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "weekDaysException": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "default": {
-                "type": "boolean"
-                },
-                "hitCounts": {
-                "type": "integer"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "rank": {
-                "type": "integer"
-                },
-                "state": {
-                "enum": [
-                "disabled",
-                "enabled",
-                "monitor"
-                ],
-                "type": "string"
-                }
-                },
-                "required": [
-                "name"
-                ],
-                "type": "object"
+                    "properties": {
+                        "condition": {
+                            "properties": {
+                                "attributeName": {
+                                    "type": "string"
+                                },
+                                "attributeValue": {
+                                    "type": "string"
+                                },
+                                "children": {
+                                    "items": {
+                                        "properties": {
+                                            "conditionType": {
+                                                "enum": [
+                                                    "ConditionAndBlock",
+                                                    "ConditionAttributes",
+                                                    "ConditionOrBlock",
+                                                    "ConditionReference",
+                                                    "LibraryConditionAndBlock",
+                                                    "LibraryConditionAttributes",
+                                                    "LibraryConditionOrBlock",
+                                                    "TimeAndDateCondition"
+                                                ],
+                                                "type": "string"
+                                            },
+                                            "isNegate": {
+                                                "type": "boolean"
+                                            },
+                                            "link": {
+                                                "properties": {
+                                                    "href": {
+                                                        "type": "string"
+                                                    },
+                                                    "rel": {
+                                                        "enum": [
+                                                            "next",
+                                                            "previous",
+                                                            "self",
+                                                            "status"
+                                                        ],
+                                                        "type": "string"
+                                                    },
+                                                    "type": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                },
+                                "conditionType": {
+                                    "enum": [
+                                        "ConditionAndBlock",
+                                        "ConditionAttributes",
+                                        "ConditionOrBlock",
+                                        "ConditionReference",
+                                        "LibraryConditionAndBlock",
+                                        "LibraryConditionAttributes",
+                                        "LibraryConditionOrBlock",
+                                        "TimeAndDateCondition"
+                                    ],
+                                    "type": "string"
+                                },
+                                "datesRange": {
+                                    "properties": {
+                                        "endDate": {
+                                            "type": "string"
+                                        },
+                                        "startDate": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "datesRangeException": {
+                                    "properties": {
+                                        "endDate": {
+                                            "type": "string"
+                                        },
+                                        "startDate": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "description": {
+                                    "type": "string"
+                                },
+                                "dictionaryName": {
+                                    "type": "string"
+                                },
+                                "dictionaryValue": {
+                                    "type": "string"
+                                },
+                                "hoursRange": {
+                                    "properties": {
+                                        "endTime": {
+                                            "type": "string"
+                                        },
+                                        "startTime": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "hoursRangeException": {
+                                    "properties": {
+                                        "endTime": {
+                                            "type": "string"
+                                        },
+                                        "startTime": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "id": {
+                                    "type": "string"
+                                },
+                                "isNegate": {
+                                    "type": "boolean"
+                                },
+                                "link": {
+                                    "properties": {
+                                        "href": {
+                                            "type": "string"
+                                        },
+                                        "rel": {
+                                            "enum": [
+                                                "next",
+                                                "previous",
+                                                "self",
+                                                "status"
+                                            ],
+                                            "type": "string"
+                                        },
+                                        "type": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "name": {
+                                    "type": "string"
+                                },
+                                "operator": {
+                                    "enum": [
+                                        "contains",
+                                        "endsWith",
+                                        "equals",
+                                        "greaterOrEquals",
+                                        "greaterThan",
+                                        "in",
+                                        "ipEquals",
+                                        "ipGreaterThan",
+                                        "ipLessThan",
+                                        "ipNotEquals",
+                                        "lessOrEquals",
+                                        "lessThan",
+                                        "matches",
+                                        "notContains",
+                                        "notEndsWith",
+                                        "notEquals",
+                                        "notIn",
+                                        "notStartsWith",
+                                        "startsWith"
+                                    ],
+                                    "type": "string"
+                                },
+                                "weekDays": {
+                                    "items": {
+                                        "enum": [
+                                            "Friday",
+                                            "Monday",
+                                            "Saturday",
+                                            "Sunday",
+                                            "Thursday",
+                                            "Tuesday",
+                                            "Wednesday"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": "array"
+                                },
+                                "weekDaysException": {
+                                    "items": {
+                                        "enum": [
+                                            "Friday",
+                                            "Monday",
+                                            "Saturday",
+                                            "Sunday",
+                                            "Thursday",
+                                            "Tuesday",
+                                            "Wednesday"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": "array"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "default": {
+                            "type": "boolean"
+                        },
+                        "hitCounts": {
+                            "type": "integer"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "rank": {
+                            "type": "integer"
+                        },
+                        "state": {
+                            "enum": [
+                                "disabled",
+                                "enabled",
+                                "monitor"
+                            ],
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "name"
+                    ],
+                    "type": "object"
                 },
                 "securityGroup": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "rule"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,116 +25,115 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC8B30Af4B84B5A90Be2FC152Cf26Ad42(object):
     """updateEndpointById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC8B30Af4B84B5A90Be2FC152Cf26Ad42, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSEndPoint": {
-                "properties": {
-                "customAttributes": {
-                "properties": {
-                "customAttributes": {
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "groupId": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "identityStore": {
-                "type": "string"
-                },
-                "identityStoreId": {
-                "type": "string"
-                },
-                "mac": {
-                "type": "string"
-                },
-                "mdmAttributes": {
-                "properties": {
-                "mdmComplianceStatus": {
-                "type": "boolean"
-                },
-                "mdmEncrypted": {
-                "type": "boolean"
-                },
-                "mdmEnrolled": {
-                "type": "boolean"
-                },
-                "mdmIMEI": {
-                "type": "string"
-                },
-                "mdmJailBroken": {
-                "type": "boolean"
-                },
-                "mdmManufacturer": {
-                "type": "string"
-                },
-                "mdmModel": {
-                "type": "string"
-                },
-                "mdmOS": {
-                "type": "string"
-                },
-                "mdmPhoneNumber": {
-                "type": "string"
-                },
-                "mdmPinlock": {
-                "type": "boolean"
-                },
-                "mdmReachable": {
-                "type": "boolean"
-                },
-                "mdmSerial": {
-                "type": "string"
-                },
-                "mdmServerName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalUser": {
-                "type": "string"
-                },
-                "profileId": {
-                "type": "string"
-                },
-                "staticGroupAssignment": {
-                "type": "boolean"
-                },
-                "staticProfileAssignment": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customAttributes": {
+                            "properties": {
+                                "customAttributes": {
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "groupId": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "identityStore": {
+                            "type": "string"
+                        },
+                        "identityStoreId": {
+                            "type": "string"
+                        },
+                        "mac": {
+                            "type": "string"
+                        },
+                        "mdmAttributes": {
+                            "properties": {
+                                "mdmComplianceStatus": {
+                                    "type": "boolean"
+                                },
+                                "mdmEncrypted": {
+                                    "type": "boolean"
+                                },
+                                "mdmEnrolled": {
+                                    "type": "boolean"
+                                },
+                                "mdmIMEI": {
+                                    "type": "string"
+                                },
+                                "mdmJailBroken": {
+                                    "type": "boolean"
+                                },
+                                "mdmManufacturer": {
+                                    "type": "string"
+                                },
+                                "mdmModel": {
+                                    "type": "string"
+                                },
+                                "mdmOS": {
+                                    "type": "string"
+                                },
+                                "mdmPhoneNumber": {
+                                    "type": "string"
+                                },
+                                "mdmPinlock": {
+                                    "type": "boolean"
+                                },
+                                "mdmReachable": {
+                                    "type": "boolean"
+                                },
+                                "mdmSerial": {
+                                    "type": "string"
+                                },
+                                "mdmServerName": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalUser": {
+                            "type": "string"
+                        },
+                        "profileId": {
+                            "type": "string"
+                        },
+                        "staticGroupAssignment": {
+                            "type": "boolean"
+                        },
+                        "staticProfileAssignment": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,296 +25,295 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCa61Ff725FedB94FBa602D7Afe46(object):
     """updateDeviceAdminAuthenticationRuleById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCa61Ff725FedB94FBa602D7Afe46, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "identitySourceName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "ifAuthFail": {
-                "type": "string"
+                    "type": "string"
                 },
                 "ifProcessFail": {
-                "type": "string"
+                    "type": "string"
                 },
                 "ifUserNotFound": {
-                "type": "string"
+                    "type": "string"
                 },
                 "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "href"
-                ],
-                "type": "object"
+                    "properties": {
+                        "href": {
+                            "type": "string"
+                        },
+                        "rel": {
+                            "enum": [
+                                "next",
+                                "previous",
+                                "self",
+                                "status"
+                            ],
+                            "type": "string"
+                        },
+                        "type": {
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "href"
+                    ],
+                    "type": "object"
                 },
                 "rule": {
-                "properties": {
-                "condition": {
-                "properties": {
-                "attributeName": {
-                "type": "string"
-                },
-                "attributeValue": {
-                "type": "string"
-                },
-                "children": {
-                "items": {
-                "properties": {
-                "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
-                },
-                "isNegate": {
-                "type": "boolean"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
-                },
-                "datesRange": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "datesRangeException": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "dictionaryValue": {
-                "type": "string"
-                },
-                "hoursRange": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
+                    "properties": {
+                        "condition": {
+                            "properties": {
+                                "attributeName": {
+                                    "type": "string"
+                                },
+                                "attributeValue": {
+                                    "type": "string"
+                                },
+                                "children": {
+                                    "items": {
+                                        "properties": {
+                                            "conditionType": {
+                                                "enum": [
+                                                    "ConditionAndBlock",
+                                                    "ConditionAttributes",
+                                                    "ConditionOrBlock",
+                                                    "ConditionReference",
+                                                    "LibraryConditionAndBlock",
+                                                    "LibraryConditionAttributes",
+                                                    "LibraryConditionOrBlock",
+                                                    "TimeAndDateCondition"
+                                                ],
+                                                "type": "string"
+                                            },
+                                            "isNegate": {
+                                                "type": "boolean"
+                                            },
+                                            "link": {
+                                                "properties": {
+                                                    "href": {
+                                                        "type": "string"
+                                                    },
+                                                    "rel": {
+                                                        "enum": [
+                                                            "next",
+                                                            "previous",
+                                                            "self",
+                                                            "status"
+                                                        ],
+                                                        "type": "string"
+                                                    },
+                                                    "type": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                },
+                                "conditionType": {
+                                    "enum": [
+                                        "ConditionAndBlock",
+                                        "ConditionAttributes",
+                                        "ConditionOrBlock",
+                                        "ConditionReference",
+                                        "LibraryConditionAndBlock",
+                                        "LibraryConditionAttributes",
+                                        "LibraryConditionOrBlock",
+                                        "TimeAndDateCondition"
+                                    ],
+                                    "type": "string"
+                                },
+                                "datesRange": {
+                                    "properties": {
+                                        "endDate": {
+                                            "type": "string"
+                                        },
+                                        "startDate": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "datesRangeException": {
+                                    "properties": {
+                                        "endDate": {
+                                            "type": "string"
+                                        },
+                                        "startDate": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "description": {
+                                    "type": "string"
+                                },
+                                "dictionaryName": {
+                                    "type": "string"
+                                },
+                                "dictionaryValue": {
+                                    "type": "string"
+                                },
+                                "hoursRange": {
+                                    "properties": {
+                                        "endTime": {
+                                            "type": "string"
+                                        },
+                                        "startTime": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "hoursRangeException": {
+                                    "properties": {
+                                        "endTime": {
+                                            "type": "string"
+                                        },
+                                        "startTime": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "id": {
+                                    "type": "string"
+                                },
+                                "isNegate": {
+                                    "type": "boolean"
+                                },
+                                "link": {
+                                    "properties": {
+                                        "href": {
+                                            "type": "string"
+                                        },
+                                        "rel": {
+                                            "enum": [
+                                                "next",
+                                                "previous",
+                                                "self",
+                                                "status"
+                                            ],
+                                            "type": "string"
+                                        },
+                                        "type": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "name": {
+                                    "type": "string"
+                                },
+                                "operator": {
+                                    "enum": [
+                                        "contains",
+                                        "endsWith",
+                                        "equals",
+                                        "greaterOrEquals",
+                                        "greaterThan",
+                                        "in",
+                                        "ipEquals",
+                                        "ipGreaterThan",
+                                        "ipLessThan",
+                                        "ipNotEquals",
+                                        "lessOrEquals",
+                                        "lessThan",
+                                        "matches",
+                                        "notContains",
+                                        "notEndsWith",
+                                        "notEquals",
+                                        "notIn",
+                                        "notStartsWith",
+                                        "startsWith"
+                                    ],
+                                    "type": "string"
+                                },
+                                "weekDays": {
+                                    "items": {
+                                        "enum": [
+                                            "Friday",
+                                            "Monday",
+                                            "Saturday",
+                                            "Sunday",
+                                            "Thursday",
+                                            "Tuesday",
+                                            "Wednesday"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": "array"
+                                },
+                                "weekDaysException": {
+                                    "items": {
+                                        "enum": [
+                                            "Friday",
+                                            "Monday",
+                                            "Saturday",
+                                            "Sunday",
+                                            "Thursday",
+                                            "Tuesday",
+                                            "Wednesday"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": "array"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "default": {
+                            "type": "boolean"
+                        },
+                        "hitCounts": {
+                            "type": "integer"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "rank": {
+                            "type": "integer"
+                        },
+                        "state": {
+                            "enum": [
+                                "disabled",
+                                "enabled",
+                                "monitor"
+                            ],
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "name"
+                    ],
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                },
-                "hoursRangeException": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "id": {
-                "type": "string"
-                },
-                "isNegate": {
-                "type": "boolean"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                },
-                "operator": {
-                "enum": [
-                "contains",
-                "endsWith",
-                "equals",
-                "greaterOrEquals",
-                "greaterThan",
-                "in",
-                "ipEquals",
-                "ipGreaterThan",
-                "ipLessThan",
-                "ipNotEquals",
-                "lessOrEquals",
-                "lessThan",
-                "matches",
-                "notContains",
-                "notEndsWith",
-                "notEquals",
-                "notIn",
-                "notStartsWith",
-                "startsWith"
-                ],
-                "type": "string"
-                },
-                "weekDays": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "weekDaysException": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "default": {
-                "type": "boolean"
-                },
-                "hitCounts": {
-                "type": "integer"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "rank": {
-                "type": "integer"
-                },
-                "state": {
-                "enum": [
-                "disabled",
-                "enabled",
-                "monitor"
-                ],
-                "type": "string"
-                }
-                },
-                "required": [
-                "name"
-                ],
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
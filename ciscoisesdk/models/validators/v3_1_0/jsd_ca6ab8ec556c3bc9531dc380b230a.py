@@ -25,209 +25,208 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCa6Ab8Ec556C3Bc9531Dc380B230A(object):
     """createNetworkDevice request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCa6Ab8Ec556C3Bc9531Dc380B230A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "NetworkDevice": {
-                "properties": {
-                "NetworkDeviceGroupList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "NetworkDeviceIPList": {
-                "items": {
-                "properties": {
-                "getIpaddressExclude": {
-                "type": "string"
-                },
-                "ipaddress": {
-                "type": "string"
-                },
-                "mask": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "authenticationSettings": {
-                "properties": {
-                "dtlsRequired": {
-                "type": "boolean"
-                },
-                "enableKeyWrap": {
-                "type": "boolean"
-                },
-                "enableMultiSecret": {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "keyEncryptionKey": {
-                "type": "string"
-                },
-                "keyInputFormat": {
-                "type": "string"
-                },
-                "messageAuthenticatorCodeKey": {
-                "type": "string"
-                },
-                "networkProtocol": {
-                "type": "string"
-                },
-                "radiusSharedSecret": {
-                "type": "string"
-                },
-                "secondRadiusSharedSecret": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "coaPort": {
-                "type": "integer"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "dtlsDnsName": {
-                "type": "string"
-                },
-                "modelName": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "profileName": {
-                "type": "string"
-                },
-                "snmpsettings": {
-                "properties": {
-                "linkTrapQuery": {
-                "type": "boolean"
-                },
-                "macTrapQuery": {
-                "type": "boolean"
-                },
-                "originatingPolicyServicesNode": {
-                "type": "string"
-                },
-                "pollingInterval": {
-                "type": "integer"
-                },
-                "roCommunity": {
-                "type": "string"
-                },
-                "version": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "softwareVersion": {
-                "type": "string"
-                },
-                "tacacsSettings": {
-                "properties": {
-                "connectModeOptions": {
-                "type": "string"
-                },
-                "sharedSecret": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "trustsecsettings": {
-                "properties": {
-                "deviceAuthenticationSettings": {
-                "properties": {
-                "sgaDeviceId": {
-                "type": "string"
-                },
-                "sgaDevicePassword": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "deviceConfigurationDeployment": {
-                "properties": {
-                "enableModePassword": {
-                "type": "string"
-                },
-                "execModePassword": {
-                "type": "string"
-                },
-                "execModeUsername": {
-                "type": "string"
-                },
-                "includeWhenDeployingSGTUpdates": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "pushIdSupport": {
-                "type": "boolean"
-                },
-                "sgaNotificationAndUpdates": {
-                "properties": {
-                "coaSourceHost": {
-                "type": "string"
-                },
-                "downlaodEnvironmentDataEveryXSeconds": {
-                "type": "integer"
-                },
-                "downlaodPeerAuthorizationPolicyEveryXSeconds": {
-                "type": "integer"
-                },
-                "downloadSGACLListsEveryXSeconds": {
-                "type": "integer"
-                },
-                "otherSGADevicesToTrustThisDevice": {
-                "type": "boolean"
-                },
-                "reAuthenticationEveryXSeconds": {
-                "type": "integer"
-                },
-                "sendConfigurationToDevice": {
-                "type": "boolean"
-                },
-                "sendConfigurationToDeviceUsing": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "NetworkDeviceGroupList": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "NetworkDeviceIPList": {
+                            "items": {
+                                "properties": {
+                                    "getIpaddressExclude": {
+                                        "type": "string"
+                                    },
+                                    "ipaddress": {
+                                        "type": "string"
+                                    },
+                                    "mask": {
+                                        "type": "integer"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "authenticationSettings": {
+                            "properties": {
+                                "dtlsRequired": {
+                                    "type": "boolean"
+                                },
+                                "enableKeyWrap": {
+                                    "type": "boolean"
+                                },
+                                "enableMultiSecret": {
+                                    "type": "string"
+                                },
+                                "enabled": {
+                                    "type": "boolean"
+                                },
+                                "keyEncryptionKey": {
+                                    "type": "string"
+                                },
+                                "keyInputFormat": {
+                                    "type": "string"
+                                },
+                                "messageAuthenticatorCodeKey": {
+                                    "type": "string"
+                                },
+                                "networkProtocol": {
+                                    "type": "string"
+                                },
+                                "radiusSharedSecret": {
+                                    "type": "string"
+                                },
+                                "secondRadiusSharedSecret": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "coaPort": {
+                            "type": "integer"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "dtlsDnsName": {
+                            "type": "string"
+                        },
+                        "modelName": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "profileName": {
+                            "type": "string"
+                        },
+                        "snmpsettings": {
+                            "properties": {
+                                "linkTrapQuery": {
+                                    "type": "boolean"
+                                },
+                                "macTrapQuery": {
+                                    "type": "boolean"
+                                },
+                                "originatingPolicyServicesNode": {
+                                    "type": "string"
+                                },
+                                "pollingInterval": {
+                                    "type": "integer"
+                                },
+                                "roCommunity": {
+                                    "type": "string"
+                                },
+                                "version": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "softwareVersion": {
+                            "type": "string"
+                        },
+                        "tacacsSettings": {
+                            "properties": {
+                                "connectModeOptions": {
+                                    "type": "string"
+                                },
+                                "sharedSecret": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "trustsecsettings": {
+                            "properties": {
+                                "deviceAuthenticationSettings": {
+                                    "properties": {
+                                        "sgaDeviceId": {
+                                            "type": "string"
+                                        },
+                                        "sgaDevicePassword": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "deviceConfigurationDeployment": {
+                                    "properties": {
+                                        "enableModePassword": {
+                                            "type": "string"
+                                        },
+                                        "execModePassword": {
+                                            "type": "string"
+                                        },
+                                        "execModeUsername": {
+                                            "type": "string"
+                                        },
+                                        "includeWhenDeployingSGTUpdates": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "pushIdSupport": {
+                                    "type": "boolean"
+                                },
+                                "sgaNotificationAndUpdates": {
+                                    "properties": {
+                                        "coaSourceHost": {
+                                            "type": "string"
+                                        },
+                                        "downlaodEnvironmentDataEveryXSeconds": {
+                                            "type": "integer"
+                                        },
+                                        "downlaodPeerAuthorizationPolicyEveryXSeconds": {
+                                            "type": "integer"
+                                        },
+                                        "downloadSGACLListsEveryXSeconds": {
+                                            "type": "integer"
+                                        },
+                                        "otherSGADevicesToTrustThisDevice": {
+                                            "type": "boolean"
+                                        },
+                                        "reAuthenticationEveryXSeconds": {
+                                            "type": "integer"
+                                        },
+                                        "sendConfigurationToDevice": {
+                                            "type": "boolean"
+                                        },
+                                        "sendConfigurationToDeviceUsing": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
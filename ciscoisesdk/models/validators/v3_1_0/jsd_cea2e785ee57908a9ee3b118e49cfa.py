@@ -25,102 +25,102 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCea2E785Ee57908A9EE3B118E49Cfa(object):
     """updateAciSettingsById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCea2E785Ee57908A9EE3B118E49Cfa, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "AciSettings": {
-                "properties": {
-                "aci50": {
-                "type": "boolean"
-                },
-                "aci51": {
-                "type": "boolean"
-                },
-                "aciipaddress": {
-                "type": "string"
-                },
-                "acipassword": {
-                "type": "string"
-                },
-                "aciuserName": {
-                "type": "string"
-                },
-                "adminName": {
-                "type": "string"
-                },
-                "adminPassword": {
-                "type": "string"
-                },
-                "allSxpDomain": {
-                "type": "boolean"
-                },
-                "defaultSgtName": {
-                "type": "string"
-                },
-                "enableAci": {
-                "type": "boolean"
-                },
-                "enableDataPlane": {
-                "type": "boolean"
-                },
-                "enableElementsLimit": {
-                "type": "boolean"
-                },
-                "id": {
-                "type": "string"
-                },
-                "ipAddressHostName": {
-                "type": "string"
-                },
-                "l3RouteNetwork": {
-                "type": "string"
-                },
-                "maxNumIepgFromAci": {
-                "type": "integer"
-                },
-                "maxNumSgtToAci": {
-                "type": "integer"
-                },
-                "specificSxpDomain": {
-                "type": "boolean"
-                },
-                "specifixSxpDomainList": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "suffixToEpg": {
-                "type": "string"
-                },
-                "suffixToSgt": {
-                "type": "string"
-                },
-                "tenantName": {
-                "type": "string"
-                },
-                "untaggedPacketIepgName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "aci50": {
+                            "type": "boolean"
+                        },
+                        "aci51": {
+                            "type": "boolean"
+                        },
+                        "aciipaddress": {
+                            "type": "string"
+                        },
+                        "acipassword": {
+                            "type": "string"
+                        },
+                        "aciuserName": {
+                            "type": "string"
+                        },
+                        "adminName": {
+                            "type": "string"
+                        },
+                        "adminPassword": {
+                            "type": "string"
+                        },
+                        "allSxpDomain": {
+                            "type": "boolean"
+                        },
+                        "defaultSgtName": {
+                            "type": "string"
+                        },
+                        "enableAci": {
+                            "type": "boolean"
+                        },
+                        "enableDataPlane": {
+                            "type": "boolean"
+                        },
+                        "enableElementsLimit": {
+                            "type": "boolean"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "ipAddressHostName": {
+                            "type": "string"
+                        },
+                        "l3RouteNetwork": {
+                            "type": "string"
+                        },
+                        "maxNumIepgFromAci": {
+                            "type": "integer"
+                        },
+                        "maxNumSgtToAci": {
+                            "type": "integer"
+                        },
+                        "specificSxpDomain": {
+                            "type": "boolean"
+                        },
+                        "specifixSxpDomainList": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "suffixToEpg": {
+                            "type": "string"
+                        },
+                        "suffixToSgt": {
+                            "type": "string"
+                        },
+                        "tenantName": {
+                            "type": "string"
+                        },
+                        "untaggedPacketIepgName": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
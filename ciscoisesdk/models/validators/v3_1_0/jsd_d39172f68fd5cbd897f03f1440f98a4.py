@@ -25,398 +25,397 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD39172F68Fd5Cbd897F03F1440F98A4(object):
     """updateSponsoredGuestPortalById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD39172F68Fd5Cbd897F03F1440F98A4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SponsoredGuestPortal": {
-                "properties": {
-                "customizations": {
-                "properties": {
-                "globalCustomizations": {
-                "properties": {
-                "backgroundImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerTitle": {
-                "type": "string"
-                },
-                "contactText": {
-                "type": "string"
-                },
-                "desktopLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "footerElement": {
-                "type": "string"
-                },
-                "mobileLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "language": {
-                "properties": {
-                "viewLanguage": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "pageCustomizations": {
-                "properties": {
-                "data": {
-                "items": {
-                "properties": {
-                "key": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "portalTheme": {
-                "properties": {
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "themeData": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "portalTweakSettings": {
-                "properties": {
-                "bannerColor": {
-                "type": "string"
-                },
-                "bannerTextColor": {
-                "type": "string"
-                },
-                "pageBackgroundColor": {
-                "type": "string"
-                },
-                "pageLabelAndTextColor": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalTestUrl": {
-                "type": "string"
-                },
-                "portalType": {
-                "type": "string"
-                },
-                "settings": {
-                "properties": {
-                "aupSettings": {
-                "properties": {
-                "displayFrequency": {
-                "type": "string"
-                },
-                "displayFrequencyIntervalDays": {
-                "type": "integer"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "requireAupScrolling": {
-                "type": "boolean"
-                },
-                "requireScrolling": {
-                "type": "boolean"
-                },
-                "skipAupForEmployees": {
-                "type": "boolean"
-                },
-                "useDiffAupForEmployees": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "authSuccessSettings": {
-                "properties": {
-                "redirectUrl": {
-                "type": "string"
-                },
-                "successRedirect": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "byodSettings": {
-                "properties": {
-                "byodRegistrationSettings": {
-                "properties": {
-                "endPointIdentityGroupId": {
-                "type": "string"
-                },
-                "showDeviceID": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "byodRegistrationSuccessSettings": {
-                "properties": {
-                "redirectUrl": {
-                "type": "string"
-                },
-                "successRedirect": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "byodWelcomeSettings": {
-                "properties": {
-                "aupDisplay": {
-                "type": "string"
-                },
-                "enableBYOD": {
-                "type": "boolean"
-                },
-                "enableGuestAccess": {
-                "type": "boolean"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "requireAupAcceptance": {
-                "type": "boolean"
-                },
-                "requireMDM": {
-                "type": "boolean"
-                },
-                "requireScrolling": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "guestChangePasswordSettings": {
-                "properties": {
-                "allowChangePasswdAtFirstLogin": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "guestDeviceRegistrationSettings": {
-                "properties": {
-                "allowGuestsToRegisterDevices": {
-                "type": "boolean"
-                },
-                "autoRegisterGuestDevices": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "loginPageSettings": {
-                "properties": {
-                "accessCode": {
-                "type": "string"
-                },
-                "allowAlternateGuestPortal": {
-                "type": "boolean"
-                },
-                "allowForgotPassword": {
-                "type": "boolean"
-                },
-                "allowGuestToChangePassword": {
-                "type": "boolean"
-                },
-                "allowGuestToCreateAccounts": {
-                "type": "boolean"
-                },
-                "aupDisplay": {
-                "type": "string"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "maxFailedAttemptsBeforeRateLimit": {
-                "type": "integer"
-                },
-                "requireAccessCode": {
-                "type": "boolean"
-                },
-                "requireAupAcceptance": {
-                "type": "boolean"
-                },
-                "socialConfigs": {
-                "items": {
-                "properties": {
-                "socialMediaType": {
-                "type": "string"
-                },
-                "socialMediaValue": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "timeBetweenLoginsDuringRateLimit": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "portalSettings": {
-                "properties": {
-                "allowedInterfaces": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "alwaysUsedLanguage": {
-                "type": "string"
-                },
-                "assignedGuestTypeForEmployee": {
-                "type": "string"
-                },
-                "authenticationMethod": {
-                "type": "string"
-                },
-                "certificateGroupTag": {
-                "type": "string"
-                },
-                "displayLang": {
-                "type": "string"
-                },
-                "fallbackLanguage": {
-                "type": "string"
-                },
-                "httpsPort": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "postAccessBannerSettings": {
-                "properties": {
-                "includePostAccessBanner": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "postLoginBannerSettings": {
-                "properties": {
-                "includePostAccessBanner": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "supportInfoSettings": {
-                "properties": {
-                "defaultEmptyFieldValue": {
-                "type": "string"
-                },
-                "emptyFieldDisplay": {
-                "type": "string"
-                },
-                "includeBrowserUserAgent": {
-                "type": "boolean"
-                },
-                "includeFailureCode": {
-                "type": "boolean"
-                },
-                "includeIpAddress": {
-                "type": "boolean"
-                },
-                "includeMacAddr": {
-                "type": "boolean"
-                },
-                "includePolicyServer": {
-                "type": "boolean"
-                },
-                "includeSupportInfoPage": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customizations": {
+                            "properties": {
+                                "globalCustomizations": {
+                                    "properties": {
+                                        "backgroundImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerTitle": {
+                                            "type": "string"
+                                        },
+                                        "contactText": {
+                                            "type": "string"
+                                        },
+                                        "desktopLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "footerElement": {
+                                            "type": "string"
+                                        },
+                                        "mobileLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "language": {
+                                    "properties": {
+                                        "viewLanguage": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "pageCustomizations": {
+                                    "properties": {
+                                        "data": {
+                                            "items": {
+                                                "properties": {
+                                                    "key": {
+                                                        "type": "string"
+                                                    },
+                                                    "value": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            },
+                                            "type": "array"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTheme": {
+                                    "properties": {
+                                        "id": {
+                                            "type": "string"
+                                        },
+                                        "name": {
+                                            "type": "string"
+                                        },
+                                        "themeData": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTweakSettings": {
+                                    "properties": {
+                                        "bannerColor": {
+                                            "type": "string"
+                                        },
+                                        "bannerTextColor": {
+                                            "type": "string"
+                                        },
+                                        "pageBackgroundColor": {
+                                            "type": "string"
+                                        },
+                                        "pageLabelAndTextColor": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalTestUrl": {
+                            "type": "string"
+                        },
+                        "portalType": {
+                            "type": "string"
+                        },
+                        "settings": {
+                            "properties": {
+                                "aupSettings": {
+                                    "properties": {
+                                        "displayFrequency": {
+                                            "type": "string"
+                                        },
+                                        "displayFrequencyIntervalDays": {
+                                            "type": "integer"
+                                        },
+                                        "includeAup": {
+                                            "type": "boolean"
+                                        },
+                                        "requireAupScrolling": {
+                                            "type": "boolean"
+                                        },
+                                        "requireScrolling": {
+                                            "type": "boolean"
+                                        },
+                                        "skipAupForEmployees": {
+                                            "type": "boolean"
+                                        },
+                                        "useDiffAupForEmployees": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "authSuccessSettings": {
+                                    "properties": {
+                                        "redirectUrl": {
+                                            "type": "string"
+                                        },
+                                        "successRedirect": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "byodSettings": {
+                                    "properties": {
+                                        "byodRegistrationSettings": {
+                                            "properties": {
+                                                "endPointIdentityGroupId": {
+                                                    "type": "string"
+                                                },
+                                                "showDeviceID": {
+                                                    "type": "boolean"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "byodRegistrationSuccessSettings": {
+                                            "properties": {
+                                                "redirectUrl": {
+                                                    "type": "string"
+                                                },
+                                                "successRedirect": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "byodWelcomeSettings": {
+                                            "properties": {
+                                                "aupDisplay": {
+                                                    "type": "string"
+                                                },
+                                                "enableBYOD": {
+                                                    "type": "boolean"
+                                                },
+                                                "enableGuestAccess": {
+                                                    "type": "boolean"
+                                                },
+                                                "includeAup": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireAupAcceptance": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireMDM": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireScrolling": {
+                                                    "type": "boolean"
+                                                }
+                                            },
+                                            "type": "object"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "guestChangePasswordSettings": {
+                                    "properties": {
+                                        "allowChangePasswdAtFirstLogin": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "guestDeviceRegistrationSettings": {
+                                    "properties": {
+                                        "allowGuestsToRegisterDevices": {
+                                            "type": "boolean"
+                                        },
+                                        "autoRegisterGuestDevices": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "loginPageSettings": {
+                                    "properties": {
+                                        "accessCode": {
+                                            "type": "string"
+                                        },
+                                        "allowAlternateGuestPortal": {
+                                            "type": "boolean"
+                                        },
+                                        "allowForgotPassword": {
+                                            "type": "boolean"
+                                        },
+                                        "allowGuestToChangePassword": {
+                                            "type": "boolean"
+                                        },
+                                        "allowGuestToCreateAccounts": {
+                                            "type": "boolean"
+                                        },
+                                        "aupDisplay": {
+                                            "type": "string"
+                                        },
+                                        "includeAup": {
+                                            "type": "boolean"
+                                        },
+                                        "maxFailedAttemptsBeforeRateLimit": {
+                                            "type": "integer"
+                                        },
+                                        "requireAccessCode": {
+                                            "type": "boolean"
+                                        },
+                                        "requireAupAcceptance": {
+                                            "type": "boolean"
+                                        },
+                                        "socialConfigs": {
+                                            "items": {
+                                                "properties": {
+                                                    "socialMediaType": {
+                                                        "type": "string"
+                                                    },
+                                                    "socialMediaValue": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            },
+                                            "type": "array"
+                                        },
+                                        "timeBetweenLoginsDuringRateLimit": {
+                                            "type": "integer"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalSettings": {
+                                    "properties": {
+                                        "allowedInterfaces": {
+                                            "items": {
+                                                "type": "string"
+                                            },
+                                            "type": "array"
+                                        },
+                                        "alwaysUsedLanguage": {
+                                            "type": "string"
+                                        },
+                                        "assignedGuestTypeForEmployee": {
+                                            "type": "string"
+                                        },
+                                        "authenticationMethod": {
+                                            "type": "string"
+                                        },
+                                        "certificateGroupTag": {
+                                            "type": "string"
+                                        },
+                                        "displayLang": {
+                                            "type": "string"
+                                        },
+                                        "fallbackLanguage": {
+                                            "type": "string"
+                                        },
+                                        "httpsPort": {
+                                            "type": "integer"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "postAccessBannerSettings": {
+                                    "properties": {
+                                        "includePostAccessBanner": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "postLoginBannerSettings": {
+                                    "properties": {
+                                        "includePostAccessBanner": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "supportInfoSettings": {
+                                    "properties": {
+                                        "defaultEmptyFieldValue": {
+                                            "type": "string"
+                                        },
+                                        "emptyFieldDisplay": {
+                                            "type": "string"
+                                        },
+                                        "includeBrowserUserAgent": {
+                                            "type": "boolean"
+                                        },
+                                        "includeFailureCode": {
+                                            "type": "boolean"
+                                        },
+                                        "includeIpAddress": {
+                                            "type": "boolean"
+                                        },
+                                        "includeMacAddr": {
+                                            "type": "boolean"
+                                        },
+                                        "includePolicyServer": {
+                                            "type": "boolean"
+                                        },
+                                        "includeSupportInfoPage": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,48 +25,48 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD79B507Bda155C180D42F0A67Ef64D5(object):
     """updateAncPolicyById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD79B507Bda155C180D42F0A67Ef64D5, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ErsAncPolicy": {
-                "properties": {
-                "actions": {
-                "items": {
-                "enum": [
-                "QUARANTINE",
-                "PORTBOUNCE",
-                "SHUTDOWN",
-                "RE_AUTHENTICATE"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "actions": {
+                            "items": {
+                                "enum": [
+                                    "QUARANTINE",
+                                    "PORTBOUNCE",
+                                    "SHUTDOWN",
+                                    "RE_AUTHENTICATE"
+                                ],
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
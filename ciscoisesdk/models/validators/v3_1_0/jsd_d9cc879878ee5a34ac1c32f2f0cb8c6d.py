@@ -25,62 +25,61 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD9Cc879878Ee5A34Ac1C32F2F0Cb8C6D(object):
     """createTACACSCommandSets request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD9Cc879878Ee5A34Ac1C32F2F0Cb8C6D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "TacacsCommandSets": {
-                "properties": {
-                "commands": {
-                "properties": {
-                "commandList": {
-                "items": {
-                "properties": {
-                "arguments": {
-                "type": "string"
-                },
-                "command": {
-                "type": "string"
-                },
-                "grant": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "permitUnmatched": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "commands": {
+                            "properties": {
+                                "commandList": {
+                                    "items": {
+                                        "properties": {
+                                            "arguments": {
+                                                "type": "string"
+                                            },
+                                            "command": {
+                                                "type": "string"
+                                            },
+                                            "grant": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "permitUnmatched": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
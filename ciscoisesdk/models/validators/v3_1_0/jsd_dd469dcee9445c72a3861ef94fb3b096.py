@@ -25,103 +25,103 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorDd469DceE9445C72A3861Ef94Fb3B096(object):
     """createSystemCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorDd469DceE9445C72A3861Ef94Fb3B096, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSSystemCertificate": {
-                "properties": {
-                "ersLocalCertStub": {
-                "properties": {
-                "allowWildcardCerts": {
-                "type": "string"
-                },
-                "certificatePolicies": {
-                "type": "string"
-                },
-                "certificateSanDns": {
-                "type": "string"
-                },
-                "certificateSanIp": {
-                "type": "string"
-                },
-                "certificateSanUri": {
-                "type": "string"
-                },
-                "digest": {
-                "type": "string"
-                },
-                "ersSubjectStub": {
-                "properties": {
-                "commonName": {
-                "type": "string"
-                },
-                "countryName": {
-                "type": "string"
-                },
-                "localityName": {
-                "type": "string"
-                },
-                "organizationName": {
-                "type": "string"
-                },
-                "organizationalUnitName": {
-                "type": "string"
-                },
-                "stateOrProvinceName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "expirationTTL": {
-                "type": "integer"
-                },
-                "friendlyName": {
-                "type": "string"
-                },
-                "groupTagDD": {
-                "type": "string"
-                },
-                "keyLength": {
-                "type": "string"
-                },
-                "keyType": {
-                "type": "string"
-                },
-                "samlCertificate": {
-                "type": "string"
-                },
-                "selectedExpirationTTLUnit": {
-                "type": "string"
-                },
-                "xgridCertificate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "nodeId": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "ersLocalCertStub": {
+                            "properties": {
+                                "allowWildcardCerts": {
+                                    "type": "string"
+                                },
+                                "certificatePolicies": {
+                                    "type": "string"
+                                },
+                                "certificateSanDns": {
+                                    "type": "string"
+                                },
+                                "certificateSanIp": {
+                                    "type": "string"
+                                },
+                                "certificateSanUri": {
+                                    "type": "string"
+                                },
+                                "digest": {
+                                    "type": "string"
+                                },
+                                "ersSubjectStub": {
+                                    "properties": {
+                                        "commonName": {
+                                            "type": "string"
+                                        },
+                                        "countryName": {
+                                            "type": "string"
+                                        },
+                                        "localityName": {
+                                            "type": "string"
+                                        },
+                                        "organizationName": {
+                                            "type": "string"
+                                        },
+                                        "organizationalUnitName": {
+                                            "type": "string"
+                                        },
+                                        "stateOrProvinceName": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "expirationTTL": {
+                                    "type": "integer"
+                                },
+                                "friendlyName": {
+                                    "type": "string"
+                                },
+                                "groupTagDD": {
+                                    "type": "string"
+                                },
+                                "keyLength": {
+                                    "type": "string"
+                                },
+                                "keyType": {
+                                    "type": "string"
+                                },
+                                "samlCertificate": {
+                                    "type": "string"
+                                },
+                                "selectedExpirationTTLUnit": {
+                                    "type": "string"
+                                },
+                                "xgridCertificate": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "nodeId": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
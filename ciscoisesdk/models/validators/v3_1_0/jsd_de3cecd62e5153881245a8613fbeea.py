@@ -25,54 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorDe3CecD62E5153881245A8613Fbeea(object):
     """updateIPToSGTMappingById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorDe3CecD62E5153881245A8613Fbeea, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SGMapping": {
-                "properties": {
-                "deployTo": {
-                "type": "string"
-                },
-                "deployType": {
-                "type": "string"
-                },
-                "hostIp": {
-                "type": "string"
-                },
-                "hostName": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "mappingGroup": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sgt": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "deployTo": {
+                            "type": "string"
+                        },
+                        "deployType": {
+                            "type": "string"
+                        },
+                        "hostIp": {
+                            "type": "string"
+                        },
+                        "hostName": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "mappingGroup": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sgt": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,60 +25,60 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE27D5Df9Cbe5B29A7E16Bb7C877A4Ce(object):
     """createEndpointCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE27D5Df9Cbe5B29A7E16Bb7C877A4Ce, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSEndPointCert": {
-                "properties": {
-                "certTemplateName": {
-                "type": "string"
-                },
-                "certificateRequest": {
-                "properties": {
-                "cn": {
-                "type": "string"
-                },
-                "san": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "cn",
-                "san"
-                ],
-                "type": "object"
-                },
-                "format": {
-                "type": "string"
-                },
-                "password": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "certTemplateName",
-                "certificateRequest",
-                "format",
-                "password"
-                ],
-                "type": "object"
+                    "properties": {
+                        "certTemplateName": {
+                            "type": "string"
+                        },
+                        "certificateRequest": {
+                            "properties": {
+                                "cn": {
+                                    "type": "string"
+                                },
+                                "san": {
+                                    "type": "string"
+                                }
+                            },
+                            "required": [
+                                "cn",
+                                "san"
+                            ],
+                            "type": "object"
+                        },
+                        "format": {
+                            "type": "string"
+                        },
+                        "password": {
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "certTemplateName",
+                        "certificateRequest",
+                        "format",
+                        "password"
+                    ],
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
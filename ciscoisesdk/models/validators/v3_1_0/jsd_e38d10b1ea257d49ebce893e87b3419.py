@@ -25,271 +25,270 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE38D10B1Ea257D49EbcE893E87B3419(object):
     """updateByodPortalById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE38D10B1Ea257D49EbcE893E87B3419, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "BYODPortal": {
-                "properties": {
-                "customizations": {
-                "properties": {
-                "globalCustomizations": {
-                "properties": {
-                "backgroundImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerTitle": {
-                "type": "string"
-                },
-                "contactText": {
-                "type": "string"
-                },
-                "desktopLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "footerElement": {
-                "type": "string"
-                },
-                "mobileLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "language": {
-                "properties": {
-                "viewLanguage": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "pageCustomizations": {
-                "properties": {
-                "data": {
-                "items": {
-                "properties": {
-                "key": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "portalTheme": {
-                "properties": {
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "themeData": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "portalTweakSettings": {
-                "properties": {
-                "bannerColor": {
-                "type": "string"
-                },
-                "bannerTextColor": {
-                "type": "string"
-                },
-                "pageBackgroundColor": {
-                "type": "string"
-                },
-                "pageLabelAndTextColor": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalTestUrl": {
-                "type": "string"
-                },
-                "portalType": {
-                "type": "string"
-                },
-                "settings": {
-                "properties": {
-                "byodSettings": {
-                "properties": {
-                "byodRegistrationSettings": {
-                "properties": {
-                "endPointIdentityGroupId": {
-                "type": "string"
-                },
-                "showDeviceID": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "byodRegistrationSuccessSettings": {
-                "properties": {
-                "redirectUrl": {
-                "type": "string"
-                },
-                "successRedirect": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "byodWelcomeSettings": {
-                "properties": {
-                "aupDisplay": {
-                "type": "string"
-                },
-                "enableBYOD": {
-                "type": "boolean"
-                },
-                "enableGuestAccess": {
-                "type": "boolean"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "requireAupAcceptance": {
-                "type": "boolean"
-                },
-                "requireMDM": {
-                "type": "boolean"
-                },
-                "requireScrolling": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "portalSettings": {
-                "properties": {
-                "allowedInterfaces": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "alwaysUsedLanguage": {
-                "type": "string"
-                },
-                "certificateGroupTag": {
-                "type": "string"
-                },
-                "displayLang": {
-                "type": "string"
-                },
-                "endpointIdentityGroup": {
-                "type": "string"
-                },
-                "fallbackLanguage": {
-                "type": "string"
-                },
-                "httpsPort": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "supportInfoSettings": {
-                "properties": {
-                "defaultEmptyFieldValue": {
-                "type": "string"
-                },
-                "emptyFieldDisplay": {
-                "type": "string"
-                },
-                "includeBrowserUserAgent": {
-                "type": "boolean"
-                },
-                "includeFailureCode": {
-                "type": "boolean"
-                },
-                "includeIpAddress": {
-                "type": "boolean"
-                },
-                "includeMacAddr": {
-                "type": "boolean"
-                },
-                "includePolicyServer": {
-                "type": "boolean"
-                },
-                "includeSupportInfoPage": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customizations": {
+                            "properties": {
+                                "globalCustomizations": {
+                                    "properties": {
+                                        "backgroundImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerTitle": {
+                                            "type": "string"
+                                        },
+                                        "contactText": {
+                                            "type": "string"
+                                        },
+                                        "desktopLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "footerElement": {
+                                            "type": "string"
+                                        },
+                                        "mobileLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "language": {
+                                    "properties": {
+                                        "viewLanguage": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "pageCustomizations": {
+                                    "properties": {
+                                        "data": {
+                                            "items": {
+                                                "properties": {
+                                                    "key": {
+                                                        "type": "string"
+                                                    },
+                                                    "value": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            },
+                                            "type": "array"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTheme": {
+                                    "properties": {
+                                        "id": {
+                                            "type": "string"
+                                        },
+                                        "name": {
+                                            "type": "string"
+                                        },
+                                        "themeData": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTweakSettings": {
+                                    "properties": {
+                                        "bannerColor": {
+                                            "type": "string"
+                                        },
+                                        "bannerTextColor": {
+                                            "type": "string"
+                                        },
+                                        "pageBackgroundColor": {
+                                            "type": "string"
+                                        },
+                                        "pageLabelAndTextColor": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalTestUrl": {
+                            "type": "string"
+                        },
+                        "portalType": {
+                            "type": "string"
+                        },
+                        "settings": {
+                            "properties": {
+                                "byodSettings": {
+                                    "properties": {
+                                        "byodRegistrationSettings": {
+                                            "properties": {
+                                                "endPointIdentityGroupId": {
+                                                    "type": "string"
+                                                },
+                                                "showDeviceID": {
+                                                    "type": "boolean"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "byodRegistrationSuccessSettings": {
+                                            "properties": {
+                                                "redirectUrl": {
+                                                    "type": "string"
+                                                },
+                                                "successRedirect": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "byodWelcomeSettings": {
+                                            "properties": {
+                                                "aupDisplay": {
+                                                    "type": "string"
+                                                },
+                                                "enableBYOD": {
+                                                    "type": "boolean"
+                                                },
+                                                "enableGuestAccess": {
+                                                    "type": "boolean"
+                                                },
+                                                "includeAup": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireAupAcceptance": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireMDM": {
+                                                    "type": "boolean"
+                                                },
+                                                "requireScrolling": {
+                                                    "type": "boolean"
+                                                }
+                                            },
+                                            "type": "object"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalSettings": {
+                                    "properties": {
+                                        "allowedInterfaces": {
+                                            "items": {
+                                                "type": "string"
+                                            },
+                                            "type": "array"
+                                        },
+                                        "alwaysUsedLanguage": {
+                                            "type": "string"
+                                        },
+                                        "certificateGroupTag": {
+                                            "type": "string"
+                                        },
+                                        "displayLang": {
+                                            "type": "string"
+                                        },
+                                        "endpointIdentityGroup": {
+                                            "type": "string"
+                                        },
+                                        "fallbackLanguage": {
+                                            "type": "string"
+                                        },
+                                        "httpsPort": {
+                                            "type": "integer"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "supportInfoSettings": {
+                                    "properties": {
+                                        "defaultEmptyFieldValue": {
+                                            "type": "string"
+                                        },
+                                        "emptyFieldDisplay": {
+                                            "type": "string"
+                                        },
+                                        "includeBrowserUserAgent": {
+                                            "type": "boolean"
+                                        },
+                                        "includeFailureCode": {
+                                            "type": "boolean"
+                                        },
+                                        "includeIpAddress": {
+                                            "type": "boolean"
+                                        },
+                                        "includeMacAddr": {
+                                            "type": "boolean"
+                                        },
+                                        "includePolicyServer": {
+                                            "type": "boolean"
+                                        },
+                                        "includeSupportInfoPage": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,125 +25,125 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE39868Ea7Aec5EfcAaf55009699Eda5D(object):
     """generateCSR request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE39868Ea7Aec5EfcAaf55009699Eda5D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "allowWildCardCert": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "certificatePolicies": {
-                "type": "string"
+                    "type": "string"
                 },
                 "digestType": {
-                "enum": [
-                "SHA-256",
-                "SHA-384",
-                "SHA-512"
-                ],
-                "type": "string"
+                    "enum": [
+                        "SHA-256",
+                        "SHA-384",
+                        "SHA-512"
+                    ],
+                    "type": "string"
                 },
                 "hostnames": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "keyLength": {
-                "enum": [
-                "1024",
-                "2048",
-                "4096",
-                "512"
-                ],
-                "type": "string"
+                    "enum": [
+                        "1024",
+                        "2048",
+                        "4096",
+                        "512"
+                    ],
+                    "type": "string"
                 },
                 "keyType": {
-                "enum": [
-                "ECDSA",
-                "RSA"
-                ],
-                "type": "string"
+                    "enum": [
+                        "ECDSA",
+                        "RSA"
+                    ],
+                    "type": "string"
                 },
                 "portalGroupTag": {
-                "type": "string"
+                    "type": "string"
                 },
                 "sanDNS": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "sanDir": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "sanIP": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "sanURI": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "subjectCity": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectCommonName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectCountry": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectOrg": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectOrgUnit": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectState": {
-                "type": "string"
+                    "type": "string"
                 },
                 "usedFor": {
-                "enum": [
-                "ADMIN",
-                "DTLS-AUTH",
-                "EAP-AUTH",
-                "IMS",
-                "MULTI-USE",
-                "PORTAL",
-                "PXGRID",
-                "SAML"
-                ],
-                "type": "string"
+                    "enum": [
+                        "ADMIN",
+                        "DTLS-AUTH",
+                        "EAP-AUTH",
+                        "IMS",
+                        "MULTI-USE",
+                        "PORTAL",
+                        "PXGRID",
+                        "SAML"
+                    ],
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "digestType",
                 "keyLength",
                 "keyType",
                 "usedFor"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,43 +25,43 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE3C62Bba9F9E5344A38479F6437Cf8B4(object):
     """bulkUpdateVirtualNetworks request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE3C62Bba9F9E5344A38479F6437Cf8B4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "items": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "items": {
                 "properties": {
-                "additionalAttributes": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "lastUpdate": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                }
+                    "additionalAttributes": {
+                        "type": "string"
+                    },
+                    "id": {
+                        "type": "string"
+                    },
+                    "lastUpdate": {
+                        "type": "string"
+                    },
+                    "name": {
+                        "type": "string"
+                    }
                 },
                 "required": [
-                "name"
+                    "name"
                 ],
                 "type": "object"
-                },
-                "type": "array"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "array"
+        })
 
     def validate(self, request):
         try:
@@ -25,36 +25,36 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE5Dd9B5979A409B9F456265Db0(object):
     """autoapprovePxGridSettings request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE5Dd9B5979A409B9F456265Db0, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "PxgridSettings": {
-                "properties": {
-                "allowPasswordBasedAccounts": {
-                "type": "boolean"
-                },
-                "autoApproveCertBasedAccounts": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "allowPasswordBasedAccounts": {
+                            "type": "boolean"
+                        },
+                        "autoApproveCertBasedAccounts": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
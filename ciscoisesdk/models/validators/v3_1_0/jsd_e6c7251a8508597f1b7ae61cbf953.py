@@ -25,86 +25,87 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE6C7251A8508597F1B7Ae61Cbf953(object):
     """ImportSystemCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE6C7251A8508597F1B7Ae61Cbf953, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "admin": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowExtendedValidity": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowOutOfDateCert": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfCertificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfPortalGroupTag": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowSHA1Certificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowWildCardCertificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "data": {
-                "type": "string"
+                    "type": "string"
                 },
                 "eap": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "ims": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "password": {
-                "type": "string"
+                    "type": "string"
                 },
                 "portal": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "portalGroupTag": {
-                "type": "string"
+                    "type": "string"
                 },
                 "portalTagTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "privateKeyData": {
-                "type": "string"
+                    "type": "string"
                 },
                 "pxgrid": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "radius": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "roleTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "saml": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "validateCertificateExtensions": {
-                "type": "boolean"
+                    "type": "boolean"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowExtendedValidity",
                 "allowOutOfDateCert",
                 "allowReplacementOfCertificates",
@@ -112,10 +113,9 @@ class JSONSchemaValidatorE6C7251A8508597F1B7Ae61Cbf953(object):
                 "allowSHA1Certificates",
                 "data",
                 "privateKeyData"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
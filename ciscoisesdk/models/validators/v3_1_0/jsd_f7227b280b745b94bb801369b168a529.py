@@ -25,76 +25,75 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorF7227B280B745B94Bb801369B168A529(object):
     """updateInternalUserById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorF7227B280B745B94Bb801369B168A529, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "InternalUser": {
-                "properties": {
-                "changePassword": {
-                "type": "boolean"
-                },
-                "customAttributes": {
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "email": {
-                "type": "string"
-                },
-                "enablePassword": {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "expiryDate": {
-                "type": "string"
-                },
-                "expiryDateEnabled": {
-                "type": "boolean"
-                },
-                "firstName": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "identityGroups": {
-                "type": "string"
-                },
-                "lastName": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "password": {
-                "type": "string"
-                },
-                "passwordIDStore": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "changePassword": {
+                            "type": "boolean"
+                        },
+                        "customAttributes": {
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "email": {
+                            "type": "string"
+                        },
+                        "enablePassword": {
+                            "type": "string"
+                        },
+                        "enabled": {
+                            "type": "boolean"
+                        },
+                        "expiryDate": {
+                            "type": "string"
+                        },
+                        "expiryDateEnabled": {
+                            "type": "boolean"
+                        },
+                        "firstName": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "identityGroups": {
+                            "type": "string"
+                        },
+                        "lastName": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "password": {
+                            "type": "string"
+                        },
+                        "passwordIDStore": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
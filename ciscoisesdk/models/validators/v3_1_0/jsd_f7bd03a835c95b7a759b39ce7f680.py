@@ -25,36 +25,36 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorF7Bd03A835C95B7A759B39Ce7F680(object):
     """bulkRequestForSecurityGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorF7Bd03A835C95B7A759B39Ce7F680, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SgtBulkRequest": {
-                "properties": {
-                "operationType": {
-                "type": "string"
-                },
-                "resourceMediaType": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "operationType": {
+                            "type": "string"
+                        },
+                        "resourceMediaType": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,53 +25,53 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFc9A4Ee495785518Bd2251B6B4Fb41F4(object):
     """enablePanHA request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFc9A4Ee495785518Bd2251B6B4Fb41F4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "request": {
-                "properties": {
-                "failedAttempts": {
-                "maximum": 60,
-                "minimum": 2,
-                "type": "integer"
-                },
-                "isEnabled": {
-                "type": "boolean"
-                },
-                "pollingInterval": {
-                "maximum": 300,
-                "minimum": 30,
-                "type": "integer"
-                },
-                "primaryHealthCheckNode": {
-                "maxLength": 64,
-                "minLength": 1,
-                "type": "string"
-                },
-                "secondaryHealthCheckNode": {
-                "maxLength": 64,
-                "minLength": 1,
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "failedAttempts": {
+                            "maximum": 60,
+                            "minimum": 2,
+                            "type": "integer"
+                        },
+                        "isEnabled": {
+                            "type": "boolean"
+                        },
+                        "pollingInterval": {
+                            "maximum": 300,
+                            "minimum": 30,
+                            "type": "integer"
+                        },
+                        "primaryHealthCheckNode": {
+                            "maxLength": 64,
+                            "minLength": 1,
+                            "type": "string"
+                        },
+                        "secondaryHealthCheckNode": {
+                            "maxLength": 64,
+                            "minLength": 1,
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,52 +25,51 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAb61F24Bdaf508590F7686E1130913F(object):
     """createSecurityGroupsAcl request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAb61F24Bdaf508590F7686E1130913F, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "Sgacl": {
-                "properties": {
-                "aclcontent": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "generationId": {
-                "type": "string"
-                },
-                "ipVersion": {
-                "type": "string"
-                },
-                "isReadOnly": {
-                "type": "boolean"
-                },
-                "modelledContent": {
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "aclcontent": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "generationId": {
+                            "type": "string"
+                        },
+                        "ipVersion": {
+                            "type": "string"
+                        },
+                        "isReadOnly": {
+                            "type": "boolean"
+                        },
+                        "modelledContent": {
+                            "type": "object"
+                        },
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,137 +25,136 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAcd30D35Ee2Ae16Ff23757De7D8(object):
     """createSponsorGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAcd30D35Ee2Ae16Ff23757De7D8, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SponsorGroup": {
-                "properties": {
-                "autoNotification": {
-                "type": "boolean"
-                },
-                "createPermissions": {
-                "properties": {
-                "canCreateRandomAccounts": {
-                "type": "boolean"
-                },
-                "canImportMultipleAccounts": {
-                "type": "boolean"
-                },
-                "canSetFutureStartDate": {
-                "type": "boolean"
-                },
-                "canSpecifyUsernamePrefix": {
-                "type": "boolean"
-                },
-                "defaultUsernamePrefix": {
-                "type": "string"
-                },
-                "importBatchSizeLimit": {
-                "type": "integer"
-                },
-                "randomBatchSizeLimit": {
-                "type": "integer"
-                },
-                "startDateFutureLimitDays": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "guestTypes": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "isDefaultGroup": {
-                "type": "boolean"
-                },
-                "isEnabled": {
-                "type": "boolean"
-                },
-                "locations": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "managePermission": {
-                "type": "string"
-                },
-                "memberGroups": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "name": {
-                "type": "string"
-                },
-                "otherPermissions": {
-                "properties": {
-                "canAccessViaRest": {
-                "type": "boolean"
-                },
-                "canApproveSelfregGuests": {
-                "type": "boolean"
-                },
-                "canDeleteGuestAccounts": {
-                "type": "boolean"
-                },
-                "canExtendGuestAccounts": {
-                "type": "boolean"
-                },
-                "canReinstateSuspendedAccounts": {
-                "type": "boolean"
-                },
-                "canResetGuestPasswords": {
-                "type": "boolean"
-                },
-                "canSendSmsNotifications": {
-                "type": "boolean"
-                },
-                "canSuspendGuestAccounts": {
-                "type": "boolean"
-                },
-                "canUpdateGuestContactInfo": {
-                "type": "boolean"
-                },
-                "canViewGuestPasswords": {
-                "type": "boolean"
-                },
-                "limitApprovalToSponsorsGuests": {
-                "type": "boolean"
-                },
-                "requireSuspensionReason": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "autoNotification": {
+                            "type": "boolean"
+                        },
+                        "createPermissions": {
+                            "properties": {
+                                "canCreateRandomAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canImportMultipleAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canSetFutureStartDate": {
+                                    "type": "boolean"
+                                },
+                                "canSpecifyUsernamePrefix": {
+                                    "type": "boolean"
+                                },
+                                "defaultUsernamePrefix": {
+                                    "type": "string"
+                                },
+                                "importBatchSizeLimit": {
+                                    "type": "integer"
+                                },
+                                "randomBatchSizeLimit": {
+                                    "type": "integer"
+                                },
+                                "startDateFutureLimitDays": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "guestTypes": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "isDefaultGroup": {
+                            "type": "boolean"
+                        },
+                        "isEnabled": {
+                            "type": "boolean"
+                        },
+                        "locations": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "managePermission": {
+                            "type": "string"
+                        },
+                        "memberGroups": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "otherPermissions": {
+                            "properties": {
+                                "canAccessViaRest": {
+                                    "type": "boolean"
+                                },
+                                "canApproveSelfregGuests": {
+                                    "type": "boolean"
+                                },
+                                "canDeleteGuestAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canExtendGuestAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canReinstateSuspendedAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canResetGuestPasswords": {
+                                    "type": "boolean"
+                                },
+                                "canSendSmsNotifications": {
+                                    "type": "boolean"
+                                },
+                                "canSuspendGuestAccounts": {
+                                    "type": "boolean"
+                                },
+                                "canUpdateGuestContactInfo": {
+                                    "type": "boolean"
+                                },
+                                "canViewGuestPasswords": {
+                                    "type": "boolean"
+                                },
+                                "limitApprovalToSponsorsGuests": {
+                                    "type": "boolean"
+                                },
+                                "requireSuspensionReason": {
+                                    "type": "boolean"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
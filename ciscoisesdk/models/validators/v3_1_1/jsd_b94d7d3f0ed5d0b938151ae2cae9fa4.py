@@ -25,74 +25,75 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB94D7D3F0Ed5D0B938151Ae2Cae9Fa4(object):
     """bindCSR request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB94D7D3F0Ed5D0B938151Ae2Cae9Fa4, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "admin": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowExtendedValidity": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowOutOfDateCert": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfCertificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfPortalGroupTag": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "data": {
-                "type": "string"
+                    "type": "string"
                 },
                 "eap": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "hostName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "ims": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "portal": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "portalGroupTag": {
-                "type": "string"
+                    "type": "string"
                 },
                 "pxgrid": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "radius": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "saml": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "validateCertificateExtensions": {
-                "type": "boolean"
+                    "type": "boolean"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowExtendedValidity",
                 "allowOutOfDateCert",
                 "allowReplacementOfCertificates",
@@ -100,10 +101,9 @@ class JSONSchemaValidatorB94D7D3F0Ed5D0B938151Ae2Cae9Fa4(object):
                 "data",
                 "hostName",
                 "id"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
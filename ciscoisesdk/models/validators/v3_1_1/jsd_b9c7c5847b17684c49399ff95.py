@@ -25,125 +25,124 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB9C7C5847B17684C49399Ff95(object):
     """updateGuestUserById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB9C7C5847B17684C49399Ff95, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "GuestUser": {
-                "properties": {
-                "customFields": {
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "guestAccessInfo": {
-                "properties": {
-                "fromDate": {
-                "type": "string"
-                },
-                "groupTag": {
-                "type": "string"
-                },
-                "location": {
-                "type": "string"
-                },
-                "ssid": {
-                "type": "string"
-                },
-                "toDate": {
-                "type": "string"
-                },
-                "validDays": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "guestInfo": {
-                "properties": {
-                "company": {
-                "type": "string"
-                },
-                "creationTime": {
-                "type": "string"
-                },
-                "emailAddress": {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "firstName": {
-                "type": "string"
-                },
-                "lastName": {
-                "type": "string"
-                },
-                "notificationLanguage": {
-                "type": "string"
-                },
-                "password": {
-                "type": "string"
-                },
-                "phoneNumber": {
-                "type": "string"
-                },
-                "smsServiceProvider": {
-                "type": "string"
-                },
-                "userName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "guestType": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalId": {
-                "type": "string"
-                },
-                "reasonForVisit": {
-                "type": "string"
-                },
-                "sponsorUserId": {
-                "type": "string"
-                },
-                "sponsorUserName": {
-                "type": "string"
-                },
-                "status": {
-                "type": "string"
-                },
-                "statusReason": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customFields": {
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "guestAccessInfo": {
+                            "properties": {
+                                "fromDate": {
+                                    "type": "string"
+                                },
+                                "groupTag": {
+                                    "type": "string"
+                                },
+                                "location": {
+                                    "type": "string"
+                                },
+                                "ssid": {
+                                    "type": "string"
+                                },
+                                "toDate": {
+                                    "type": "string"
+                                },
+                                "validDays": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "guestInfo": {
+                            "properties": {
+                                "company": {
+                                    "type": "string"
+                                },
+                                "creationTime": {
+                                    "type": "string"
+                                },
+                                "emailAddress": {
+                                    "type": "string"
+                                },
+                                "enabled": {
+                                    "type": "boolean"
+                                },
+                                "firstName": {
+                                    "type": "string"
+                                },
+                                "lastName": {
+                                    "type": "string"
+                                },
+                                "notificationLanguage": {
+                                    "type": "string"
+                                },
+                                "password": {
+                                    "type": "string"
+                                },
+                                "phoneNumber": {
+                                    "type": "string"
+                                },
+                                "smsServiceProvider": {
+                                    "type": "string"
+                                },
+                                "userName": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "guestType": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalId": {
+                            "type": "string"
+                        },
+                        "reasonForVisit": {
+                            "type": "string"
+                        },
+                        "sponsorUserId": {
+                            "type": "string"
+                        },
+                        "sponsorUserName": {
+                            "type": "string"
+                        },
+                        "status": {
+                            "type": "string"
+                        },
+                        "statusReason": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,295 +25,294 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBd8691C5D9435E48A3C7A08658Bda585(object):
     """updateSponsorPortalById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBd8691C5D9435E48A3C7A08658Bda585, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SponsorPortal": {
-                "properties": {
-                "customizations": {
-                "properties": {
-                "globalCustomizations": {
-                "properties": {
-                "backgroundImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "bannerTitle": {
-                "type": "string"
-                },
-                "contactText": {
-                "type": "string"
-                },
-                "desktopLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "footerElement": {
-                "type": "string"
-                },
-                "mobileLogoImage": {
-                "properties": {
-                "data": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "language": {
-                "properties": {
-                "viewLanguage": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "pageCustomizations": {
-                "properties": {
-                "data": {
-                "items": {
-                "properties": {
-                "key": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "portalTheme": {
-                "properties": {
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "themeData": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "portalTweakSettings": {
-                "properties": {
-                "bannerColor": {
-                "type": "string"
-                },
-                "bannerTextColor": {
-                "type": "string"
-                },
-                "pageBackgroundColor": {
-                "type": "string"
-                },
-                "pageLabelAndTextColor": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "portalTestUrl": {
-                "type": "string"
-                },
-                "portalType": {
-                "type": "string"
-                },
-                "settings": {
-                "properties": {
-                "aupSettings": {
-                "properties": {
-                "displayFrequency": {
-                "type": "string"
-                },
-                "displayFrequencyIntervalDays": {
-                "type": "integer"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "requireScrolling": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "loginPageSettings": {
-                "properties": {
-                "aupDisplay": {
-                "type": "string"
-                },
-                "includeAup": {
-                "type": "boolean"
-                },
-                "maxFailedAttemptsBeforeRateLimit": {
-                "type": "integer"
-                },
-                "requireAupAcceptance": {
-                "type": "boolean"
-                },
-                "requireAupScrolling": {
-                "type": "boolean"
-                },
-                "socialConfigs": {
-                "items": {},
-                "type": "array"
-                },
-                "timeBetweenLoginsDuringRateLimit": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "portalSettings": {
-                "properties": {
-                "allowedInterfaces": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "authenticationMethod": {
-                "type": "string"
-                },
-                "availableSsids": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "certificateGroupTag": {
-                "type": "string"
-                },
-                "displayLang": {
-                "type": "string"
-                },
-                "fallbackLanguage": {
-                "type": "string"
-                },
-                "fqdn": {
-                "type": "string"
-                },
-                "httpsPort": {
-                "type": "integer"
-                },
-                "idleTimeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "postAccessBannerSettings": {
-                "properties": {
-                "includePostAccessBanner": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "postLoginBannerSettings": {
-                "properties": {
-                "includePostAccessBanner": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "sponsorChangePasswordSettings": {
-                "properties": {
-                "allowSponsorToChangePwd": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                },
-                "supportInfoSettings": {
-                "properties": {
-                "defaultEmptyFieldValue": {
-                "type": "string"
-                },
-                "emptyFieldDisplay": {
-                "type": "string"
-                },
-                "includeBrowserUserAgent": {
-                "type": "boolean"
-                },
-                "includeFailureCode": {
-                "type": "boolean"
-                },
-                "includeIpAddress": {
-                "type": "boolean"
-                },
-                "includeMacAddr": {
-                "type": "boolean"
-                },
-                "includePolicyServer": {
-                "type": "boolean"
-                },
-                "includeSupportInfoPage": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "customizations": {
+                            "properties": {
+                                "globalCustomizations": {
+                                    "properties": {
+                                        "backgroundImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "bannerTitle": {
+                                            "type": "string"
+                                        },
+                                        "contactText": {
+                                            "type": "string"
+                                        },
+                                        "desktopLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        },
+                                        "footerElement": {
+                                            "type": "string"
+                                        },
+                                        "mobileLogoImage": {
+                                            "properties": {
+                                                "data": {
+                                                    "type": "string"
+                                                }
+                                            },
+                                            "type": "object"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "language": {
+                                    "properties": {
+                                        "viewLanguage": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "pageCustomizations": {
+                                    "properties": {
+                                        "data": {
+                                            "items": {
+                                                "properties": {
+                                                    "key": {
+                                                        "type": "string"
+                                                    },
+                                                    "value": {
+                                                        "type": "string"
+                                                    }
+                                                },
+                                                "type": "object"
+                                            },
+                                            "type": "array"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTheme": {
+                                    "properties": {
+                                        "id": {
+                                            "type": "string"
+                                        },
+                                        "name": {
+                                            "type": "string"
+                                        },
+                                        "themeData": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalTweakSettings": {
+                                    "properties": {
+                                        "bannerColor": {
+                                            "type": "string"
+                                        },
+                                        "bannerTextColor": {
+                                            "type": "string"
+                                        },
+                                        "pageBackgroundColor": {
+                                            "type": "string"
+                                        },
+                                        "pageLabelAndTextColor": {
+                                            "type": "string"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "portalTestUrl": {
+                            "type": "string"
+                        },
+                        "portalType": {
+                            "type": "string"
+                        },
+                        "settings": {
+                            "properties": {
+                                "aupSettings": {
+                                    "properties": {
+                                        "displayFrequency": {
+                                            "type": "string"
+                                        },
+                                        "displayFrequencyIntervalDays": {
+                                            "type": "integer"
+                                        },
+                                        "includeAup": {
+                                            "type": "boolean"
+                                        },
+                                        "requireScrolling": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "loginPageSettings": {
+                                    "properties": {
+                                        "aupDisplay": {
+                                            "type": "string"
+                                        },
+                                        "includeAup": {
+                                            "type": "boolean"
+                                        },
+                                        "maxFailedAttemptsBeforeRateLimit": {
+                                            "type": "integer"
+                                        },
+                                        "requireAupAcceptance": {
+                                            "type": "boolean"
+                                        },
+                                        "requireAupScrolling": {
+                                            "type": "boolean"
+                                        },
+                                        "socialConfigs": {
+                                            "items": {},
+                                            "type": "array"
+                                        },
+                                        "timeBetweenLoginsDuringRateLimit": {
+                                            "type": "integer"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "portalSettings": {
+                                    "properties": {
+                                        "allowedInterfaces": {
+                                            "items": {
+                                                "type": "string"
+                                            },
+                                            "type": "array"
+                                        },
+                                        "authenticationMethod": {
+                                            "type": "string"
+                                        },
+                                        "availableSsids": {
+                                            "items": {
+                                                "type": "string"
+                                            },
+                                            "type": "array"
+                                        },
+                                        "certificateGroupTag": {
+                                            "type": "string"
+                                        },
+                                        "displayLang": {
+                                            "type": "string"
+                                        },
+                                        "fallbackLanguage": {
+                                            "type": "string"
+                                        },
+                                        "fqdn": {
+                                            "type": "string"
+                                        },
+                                        "httpsPort": {
+                                            "type": "integer"
+                                        },
+                                        "idleTimeout": {
+                                            "type": "integer"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "postAccessBannerSettings": {
+                                    "properties": {
+                                        "includePostAccessBanner": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "postLoginBannerSettings": {
+                                    "properties": {
+                                        "includePostAccessBanner": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "sponsorChangePasswordSettings": {
+                                    "properties": {
+                                        "allowSponsorToChangePwd": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                },
+                                "supportInfoSettings": {
+                                    "properties": {
+                                        "defaultEmptyFieldValue": {
+                                            "type": "string"
+                                        },
+                                        "emptyFieldDisplay": {
+                                            "type": "string"
+                                        },
+                                        "includeBrowserUserAgent": {
+                                            "type": "boolean"
+                                        },
+                                        "includeFailureCode": {
+                                            "type": "boolean"
+                                        },
+                                        "includeIpAddress": {
+                                            "type": "boolean"
+                                        },
+                                        "includeMacAddr": {
+                                            "type": "boolean"
+                                        },
+                                        "includePolicyServer": {
+                                            "type": "boolean"
+                                        },
+                                        "includeSupportInfoPage": {
+                                            "type": "boolean"
+                                        }
+                                    },
+                                    "type": "object"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,224 +25,223 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBea2910401185295A9715D65Cb1C07C9(object):
     """updateNetworkAccessConditionByName request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBea2910401185295A9715D65Cb1C07C9, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "properties": {
+        self._validator = compile_schema({
+            "properties": {
                 "attributeName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "attributeValue": {
-                "type": "string"
+                    "type": "string"
                 },
                 "children": {
-                "items": {
-                "properties": {
-                "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
-                },
-                "isNegate": {
-                "type": "boolean"
-                },
-                "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "properties": {
+                            "conditionType": {
+                                "enum": [
+                                    "ConditionAndBlock",
+                                    "ConditionAttributes",
+                                    "ConditionOrBlock",
+                                    "ConditionReference",
+                                    "LibraryConditionAndBlock",
+                                    "LibraryConditionAttributes",
+                                    "LibraryConditionOrBlock",
+                                    "TimeAndDateCondition"
+                                ],
+                                "type": "string"
+                            },
+                            "isNegate": {
+                                "type": "boolean"
+                            },
+                            "link": {
+                                "properties": {
+                                    "href": {
+                                        "type": "string"
+                                    },
+                                    "rel": {
+                                        "enum": [
+                                            "next",
+                                            "previous",
+                                            "self",
+                                            "status"
+                                        ],
+                                        "type": "string"
+                                    },
+                                    "type": {
+                                        "type": "string"
+                                    }
+                                },
+                                "type": "object"
+                            }
+                        },
+                        "type": "object"
+                    },
+                    "type": "array"
                 },
                 "conditionType": {
-                "enum": [
-                "ConditionAndBlock",
-                "ConditionAttributes",
-                "ConditionOrBlock",
-                "ConditionReference",
-                "LibraryConditionAndBlock",
-                "LibraryConditionAttributes",
-                "LibraryConditionOrBlock",
-                "TimeAndDateCondition"
-                ],
-                "type": "string"
+                    "enum": [
+                        "ConditionAndBlock",
+                        "ConditionAttributes",
+                        "ConditionOrBlock",
+                        "ConditionReference",
+                        "LibraryConditionAndBlock",
+                        "LibraryConditionAttributes",
+                        "LibraryConditionOrBlock",
+                        "TimeAndDateCondition"
+                    ],
+                    "type": "string"
                 },
                 "datesRange": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "endDate": {
+                            "type": "string"
+                        },
+                        "startDate": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 },
                 "datesRangeException": {
-                "properties": {
-                "endDate": {
-                "type": "string"
-                },
-                "startDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
+                    "properties": {
+                        "endDate": {
+                            "type": "string"
+                        },
+                        "startDate": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
+                },
+                "description": {
+                    "type": "string"
                 },
                 "dictionaryName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "dictionaryValue": {
-                "type": "string"
+                    "type": "string"
                 },
                 "hoursRange": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "endTime": {
+                            "type": "string"
+                        },
+                        "startTime": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 },
                 "hoursRangeException": {
-                "properties": {
-                "endTime": {
-                "type": "string"
-                },
-                "startTime": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "endTime": {
+                            "type": "string"
+                        },
+                        "startTime": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 },
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "isNegate": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "link": {
-                "properties": {
-                "href": {
-                "type": "string"
-                },
-                "rel": {
-                "enum": [
-                "next",
-                "previous",
-                "self",
-                "status"
-                ],
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "href": {
+                            "type": "string"
+                        },
+                        "rel": {
+                            "enum": [
+                                "next",
+                                "previous",
+                                "self",
+                                "status"
+                            ],
+                            "type": "string"
+                        },
+                        "type": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "operator": {
-                "enum": [
-                "contains",
-                "endsWith",
-                "equals",
-                "greaterOrEquals",
-                "greaterThan",
-                "in",
-                "ipEquals",
-                "ipGreaterThan",
-                "ipLessThan",
-                "ipNotEquals",
-                "lessOrEquals",
-                "lessThan",
-                "matches",
-                "notContains",
-                "notEndsWith",
-                "notEquals",
-                "notIn",
-                "notStartsWith",
-                "startsWith"
-                ],
-                "type": "string"
+                    "enum": [
+                        "contains",
+                        "endsWith",
+                        "equals",
+                        "greaterOrEquals",
+                        "greaterThan",
+                        "in",
+                        "ipEquals",
+                        "ipGreaterThan",
+                        "ipLessThan",
+                        "ipNotEquals",
+                        "lessOrEquals",
+                        "lessThan",
+                        "matches",
+                        "notContains",
+                        "notEndsWith",
+                        "notEquals",
+                        "notIn",
+                        "notStartsWith",
+                        "startsWith"
+                    ],
+                    "type": "string"
                 },
                 "weekDays": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "Friday",
+                            "Monday",
+                            "Saturday",
+                            "Sunday",
+                            "Thursday",
+                            "Tuesday",
+                            "Wednesday"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "weekDaysException": {
-                "items": {
-                "enum": [
-                "Friday",
-                "Monday",
-                "Saturday",
-                "Sunday",
-                "Thursday",
-                "Tuesday",
-                "Wednesday"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "Friday",
+                            "Monday",
+                            "Saturday",
+                            "Sunday",
+                            "Thursday",
+                            "Tuesday",
+                            "Wednesday"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
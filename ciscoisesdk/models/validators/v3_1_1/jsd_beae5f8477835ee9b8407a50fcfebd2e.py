@@ -25,53 +25,53 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBeae5F8477835Ee9B8407A50Fcfebd2E(object):
     """updatePanHA request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBeae5F8477835Ee9B8407A50Fcfebd2E, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "failedAttempts": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "isEnabled": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "pollingInterval": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "primaryHealthCheckNode": {
-                "properties": {
-                "hostname": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "hostname": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 },
                 "secondaryHealthCheckNode": {
-                "properties": {
-                "hostname": {
-                "type": "string"
+                    "properties": {
+                        "hostname": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }
-                },
-                "required": [
+            },
+            "required": [
                 "isEnabled"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,63 +25,62 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC316D5E2Fdd51BdAb039Ea9E2A417Bd(object):
     """updateIdentitySequenceById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC316D5E2Fdd51BdAb039Ea9E2A417Bd, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "IdStoreSequence": {
-                "properties": {
-                "breakOnStoreFail": {
-                "type": "boolean"
-                },
-                "certificateAuthenticationProfile": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "idSeqItem": {
-                "items": {
-                "properties": {
-                "idstore": {
-                "type": "string"
-                },
-                "order": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "name": {
-                "type": "string"
-                },
-                "parent": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "breakOnStoreFail": {
+                            "type": "boolean"
+                        },
+                        "certificateAuthenticationProfile": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "idSeqItem": {
+                            "items": {
+                                "properties": {
+                                    "idstore": {
+                                        "type": "string"
+                                    },
+                                    "order": {
+                                        "type": "integer"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "parent": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
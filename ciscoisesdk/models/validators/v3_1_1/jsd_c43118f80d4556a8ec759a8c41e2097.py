@@ -25,195 +25,194 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC43118F80D4556A8Ec759A8C41E2097(object):
     """createAuthorizationProfile request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC43118F80D4556A8Ec759A8C41E2097, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "AuthorizationProfile": {
-                "properties": {
-                "accessType": {
-                "type": "string"
-                },
-                "acl": {
-                "type": "string"
-                },
-                "advancedAttributes": {
-                "items": {
-                "properties": {
-                "leftHandSideDictionaryAttribue": {
-                "properties": {
-                "AdvancedAttributeValueType": {
-                "enum": [
-                "AttributeValue",
-                "AdvancedDictionaryAttribute"
-                ],
-                "type": "string"
-                },
-                "attributeName": {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "rightHandSideAttribueValue": {
-                "properties": {
-                "AdvancedAttributeValueType": {
-                "enum": [
-                "AttributeValue",
-                "AdvancedDictionaryAttribute"
-                ],
-                "type": "string"
-                },
-                "attributeName": {
-                "type": "string"
-                },
-                "dictionaryName": {
-                "type": "string"
-                },
-                "value": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "agentlessPosture": {
-                "type": "boolean"
-                },
-                "airespaceACL": {
-                "type": "string"
-                },
-                "airespaceIPv6ACL": {
-                "type": "string"
-                },
-                "asaVpn": {
-                "type": "string"
-                },
-                "authzProfileType": {
-                "type": "string"
-                },
-                "autoSmartPort": {
-                "type": "string"
-                },
-                "avcProfile": {
-                "type": "string"
-                },
-                "daclName": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "easywiredSessionCandidate": {
-                "type": "boolean"
-                },
-                "id": {
-                "type": "string"
-                },
-                "interfaceTemplate": {
-                "type": "string"
-                },
-                "ipv6ACLFilter": {
-                "type": "string"
-                },
-                "ipv6DaclName": {
-                "type": "string"
-                },
-                "macSecPolicy": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "neat": {
-                "type": "boolean"
-                },
-                "profileName": {
-                "type": "string"
-                },
-                "reauth": {
-                "properties": {
-                "connectivity": {
-                "type": "string"
-                },
-                "timer": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "serviceTemplate": {
-                "type": "boolean"
-                },
-                "trackMovement": {
-                "type": "boolean"
-                },
-                "vlan": {
-                "properties": {
-                "nameID": {
-                "type": "string"
-                },
-                "tagID": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
-                },
-                "voiceDomainPermission": {
-                "type": "boolean"
-                },
-                "webAuth": {
-                "type": "boolean"
-                },
-                "webRedirection": {
-                "properties": {
-                "WebRedirectionType": {
-                "type": "string"
-                },
-                "acl": {
-                "type": "string"
-                },
-                "displayCertificatesRenewalMessages": {
-                "type": "boolean"
-                },
-                "portalName": {
-                "type": "string"
-                },
-                "staticIPHostNameFQDN": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "accessType": {
+                            "type": "string"
+                        },
+                        "acl": {
+                            "type": "string"
+                        },
+                        "advancedAttributes": {
+                            "items": {
+                                "properties": {
+                                    "leftHandSideDictionaryAttribue": {
+                                        "properties": {
+                                            "AdvancedAttributeValueType": {
+                                                "enum": [
+                                                    "AttributeValue",
+                                                    "AdvancedDictionaryAttribute"
+                                                ],
+                                                "type": "string"
+                                            },
+                                            "attributeName": {
+                                                "type": "string"
+                                            },
+                                            "dictionaryName": {
+                                                "type": "string"
+                                            },
+                                            "value": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "rightHandSideAttribueValue": {
+                                        "properties": {
+                                            "AdvancedAttributeValueType": {
+                                                "enum": [
+                                                    "AttributeValue",
+                                                    "AdvancedDictionaryAttribute"
+                                                ],
+                                                "type": "string"
+                                            },
+                                            "attributeName": {
+                                                "type": "string"
+                                            },
+                                            "dictionaryName": {
+                                                "type": "string"
+                                            },
+                                            "value": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "type": "object"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "agentlessPosture": {
+                            "type": "boolean"
+                        },
+                        "airespaceACL": {
+                            "type": "string"
+                        },
+                        "airespaceIPv6ACL": {
+                            "type": "string"
+                        },
+                        "asaVpn": {
+                            "type": "string"
+                        },
+                        "authzProfileType": {
+                            "type": "string"
+                        },
+                        "autoSmartPort": {
+                            "type": "string"
+                        },
+                        "avcProfile": {
+                            "type": "string"
+                        },
+                        "daclName": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "easywiredSessionCandidate": {
+                            "type": "boolean"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "interfaceTemplate": {
+                            "type": "string"
+                        },
+                        "ipv6ACLFilter": {
+                            "type": "string"
+                        },
+                        "ipv6DaclName": {
+                            "type": "string"
+                        },
+                        "macSecPolicy": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "neat": {
+                            "type": "boolean"
+                        },
+                        "profileName": {
+                            "type": "string"
+                        },
+                        "reauth": {
+                            "properties": {
+                                "connectivity": {
+                                    "type": "string"
+                                },
+                                "timer": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "serviceTemplate": {
+                            "type": "boolean"
+                        },
+                        "trackMovement": {
+                            "type": "boolean"
+                        },
+                        "vlan": {
+                            "properties": {
+                                "nameID": {
+                                    "type": "string"
+                                },
+                                "tagID": {
+                                    "type": "integer"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "voiceDomainPermission": {
+                            "type": "boolean"
+                        },
+                        "webAuth": {
+                            "type": "boolean"
+                        },
+                        "webRedirection": {
+                            "properties": {
+                                "WebRedirectionType": {
+                                    "type": "string"
+                                },
+                                "acl": {
+                                    "type": "string"
+                                },
+                                "displayCertificatesRenewalMessages": {
+                                    "type": "boolean"
+                                },
+                                "portalName": {
+                                    "type": "string"
+                                },
+                                "staticIPHostNameFQDN": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC560004D8B5F64A10F2Cc070368C12(object):
     """createEgressMatrixCell request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC560004D8B5F64A10F2Cc070368C12, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "EgressMatrixCell": {
-                "properties": {
-                "defaultRule": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "destinationSgtId": {
-                "type": "string"
-                },
-                "matrixCellStatus": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sgacls": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "sourceSgtId": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "defaultRule": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "destinationSgtId": {
+                            "type": "string"
+                        },
+                        "matrixCellStatus": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sgacls": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "sourceSgtId": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
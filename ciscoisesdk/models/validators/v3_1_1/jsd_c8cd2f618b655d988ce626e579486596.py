@@ -25,65 +25,64 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC8Cd2F618B655D988Ce626E579486596(object):
     """ImportTrustCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC8Cd2F618B655D988Ce626E579486596, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "allowBasicConstraintCAFalse": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowOutOfDateCert": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowSHA1Certificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "data": {
-                "type": "string"
+                    "type": "string"
                 },
-                "description":
-                 {
-                "type": "string"
+                "description": {
+                    "type": "string"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "trustForCertificateBasedAdminAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForCiscoServicesAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForClientAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForIseAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "validateCertificateExtensions": {
-                "type": "boolean"
+                    "type": "boolean"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowBasicConstraintCAFalse",
                 "allowOutOfDateCert",
                 "allowSHA1Certificates",
                 "data"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,58 +25,57 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCab8440E21553C3A807D23D05E5E1Aa(object):
     """updateSXPConnectionsById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCab8440E21553C3A807D23D05E5E1Aa, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSSxpConnection": {
-                "properties": {
-                "description":
-                 {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "id": {
-                "type": "string"
-                },
-                "ipAddress": {
-                "type": "string"
-                },
-                "sxpMode": {
-                "type": "string"
-                },
-                "sxpNode": {
-                "type": "string"
-                },
-                "sxpPeer": {
-                "type": "string"
-                },
-                "sxpVersion": {
-                "type": "string"
-                },
-                "sxpVpn": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "description": {
+                            "type": "string"
+                        },
+                        "enabled": {
+                            "type": "boolean"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "ipAddress": {
+                            "type": "string"
+                        },
+                        "sxpMode": {
+                            "type": "string"
+                        },
+                        "sxpNode": {
+                            "type": "string"
+                        },
+                        "sxpPeer": {
+                            "type": "string"
+                        },
+                        "sxpVersion": {
+                            "type": "string"
+                        },
+                        "sxpVpn": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
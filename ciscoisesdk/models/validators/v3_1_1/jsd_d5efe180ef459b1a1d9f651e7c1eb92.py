@@ -25,52 +25,51 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD5Efe180Ef459B1A1D9F651E7C1Eb92(object):
     """createNodeGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD5Efe180Ef459B1A1D9F651E7C1Eb92, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
-                "description":
-                 {
-                "type": "string"
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
+                "description": {
+                    "type": "string"
                 },
                 "marCache": {
-                "properties": {
-                "query-attempts": {
-                "type": "integer"
-                },
-                "query-timeout": {
-                "type": "integer"
-                },
-                "replication-attempts": {
-                "type": "integer"
-                },
-                "replication-timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "query-attempts": {
+                            "type": "integer"
+                        },
+                        "query-timeout": {
+                            "type": "integer"
+                        },
+                        "replication-attempts": {
+                            "type": "integer"
+                        },
+                        "replication-timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
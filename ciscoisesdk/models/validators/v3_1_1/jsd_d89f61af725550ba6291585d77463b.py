@@ -25,49 +25,49 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD89F61Af725550Ba6291585D77463B(object):
     """updateTierStateInfo request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD89F61Af725550Ba6291585D77463B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "items": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "items": {
                 "properties": {
-                "name": {
-                "enum": [
-                "ADVANTAGE",
-                "DEVICEADMIN",
-                "ESSENTIAL",
-                "PREMIER",
-                "VM"
-                ],
-                "type": "string"
-                },
-                "status": {
-                "enum": [
-                "DISABLED",
-                "ENABLED"
-                ],
-                "type": "string"
-                }
+                    "name": {
+                        "enum": [
+                            "ADVANTAGE",
+                            "DEVICEADMIN",
+                            "ESSENTIAL",
+                            "PREMIER",
+                            "VM"
+                        ],
+                        "type": "string"
+                    },
+                    "status": {
+                        "enum": [
+                            "DISABLED",
+                            "ENABLED"
+                        ],
+                        "type": "string"
+                    }
                 },
                 "required": [
-                "name",
-                "status"
+                    "name",
+                    "status"
                 ],
                 "type": "object"
-                },
-                "type": "array"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "array"
+        })
 
     def validate(self, request):
         try:
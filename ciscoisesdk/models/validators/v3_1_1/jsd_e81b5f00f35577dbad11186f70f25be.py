@@ -25,46 +25,46 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE81B5F00F35577DBad11186F70F25Be(object):
     """bulkCreateSgVnMappings request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE81B5F00F35577DBad11186F70F25Be, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "items": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "items": {
                 "properties": {
-                "id": {
-                "type": "string"
-                },
-                "lastUpdate": {
-                "type": "string"
-                },
-                "sgName": {
-                "type": "string"
-                },
-                "sgtId": {
-                "type": "string"
-                },
-                "vnId": {
-                "type": "string"
-                },
-                "vnName": {
-                "type": "string"
-                }
+                    "id": {
+                        "type": "string"
+                    },
+                    "lastUpdate": {
+                        "type": "string"
+                    },
+                    "sgName": {
+                        "type": "string"
+                    },
+                    "sgtId": {
+                        "type": "string"
+                    },
+                    "vnId": {
+                        "type": "string"
+                    },
+                    "vnName": {
+                        "type": "string"
+                    }
                 },
                 "type": "object"
-                },
-                "type": "array"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "array"
+        })
 
     def validate(self, request):
         try:
@@ -25,207 +25,206 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE9318040A456978757D7Abfa3E66B1(object):
     """createActiveDirectory request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE9318040A456978757D7Abfa3E66B1, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSActiveDirectory": {
-                "properties": {
-                "adAttributes": {
-                "properties": {
-                "attributes": {
-                "items": {
-                "properties": {
-                "defaultValue": {
-                "type": "string"
-                },
-                "internalName": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "adScopesNames": {
-                "default": "Default_Scope",
-                "type": "string"
-                },
-                "adgroups": {
-                "properties": {
-                "groups": {
-                "items": {
-                "properties": {
-                "name": {
-                "type": "string"
-                },
-                "sid": {
-                "type": "string"
-                },
-                "type": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "name",
-                "sid"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
-                },
-                "advancedSettings": {
-                "properties": {
-                "agingTime": {
-                "type": "integer"
-                },
-                "authProtectionType": {
-                "type": "string"
-                },
-                "country": {
-                "type": "string"
-                },
-                "department": {
-                "type": "string"
-                },
-                "email": {
-                "type": "string"
-                },
-                "enableCallbackForDialinClient": {
-                "type": "boolean"
-                },
-                "enableDialinPermissionCheck": {
-                "type": "boolean"
-                },
-                "enableFailedAuthProtection": {
-                "type": "boolean"
-                },
-                "enableMachineAccess": {
-                "type": "boolean"
-                },
-                "enableMachineAuth": {
-                "type": "boolean"
-                },
-                "enablePassChange": {
-                "type": "boolean"
-                },
-                "enableRewrites": {
-                "type": "boolean"
-                },
-                "failedAuthThreshold": {
-                "type": "integer"
-                },
-                "firstName": {
-                "type": "string"
-                },
-                "identityNotInAdBehaviour": {
-                "type": "string"
-                },
-                "jobTitle": {
-                "type": "string"
-                },
-                "lastName": {
-                "type": "string"
-                },
-                "locality": {
-                "type": "string"
-                },
-                "organizationalUnit": {
-                "type": "string"
-                },
-                "plaintextAuth": {
-                "type": "boolean"
-                },
-                "rewriteRules": {
-                "items": {
-                "properties": {
-                "rewriteMatch": {
-                "type": "string"
-                },
-                "rewriteResult": {
-                "type": "string"
-                },
-                "rowId": {
-                "type": "integer"
-                }
-                },
-                "required": [
-                "rowId",
-                "rewriteMatch",
-                "rewriteResult"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "schema": {
-                "type": "string"
-                },
-                "stateOrProvince": {
-                "type": "string"
-                },
-                "streetAddress": {
-                "type": "string"
-                },
-                "telephone": {
-                "type": "string"
-                },
-                "unreachableDomainsBehaviour": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "domain": {
-                "type": "string"
-                },
-                "enableDomainWhiteList": {
-                "type": "boolean"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "name",
-                "domain"
-                ],
-                "type": "object"
+                    "properties": {
+                        "adAttributes": {
+                            "properties": {
+                                "attributes": {
+                                    "items": {
+                                        "properties": {
+                                            "defaultValue": {
+                                                "type": "string"
+                                            },
+                                            "internalName": {
+                                                "type": "string"
+                                            },
+                                            "name": {
+                                                "type": "string"
+                                            },
+                                            "type": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "adScopesNames": {
+                            "default": "Default_Scope",
+                            "type": "string"
+                        },
+                        "adgroups": {
+                            "properties": {
+                                "groups": {
+                                    "items": {
+                                        "properties": {
+                                            "name": {
+                                                "type": "string"
+                                            },
+                                            "sid": {
+                                                "type": "string"
+                                            },
+                                            "type": {
+                                                "type": "string"
+                                            }
+                                        },
+                                        "required": [
+                                            "name",
+                                            "sid"
+                                        ],
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "advancedSettings": {
+                            "properties": {
+                                "agingTime": {
+                                    "type": "integer"
+                                },
+                                "authProtectionType": {
+                                    "type": "string"
+                                },
+                                "country": {
+                                    "type": "string"
+                                },
+                                "department": {
+                                    "type": "string"
+                                },
+                                "email": {
+                                    "type": "string"
+                                },
+                                "enableCallbackForDialinClient": {
+                                    "type": "boolean"
+                                },
+                                "enableDialinPermissionCheck": {
+                                    "type": "boolean"
+                                },
+                                "enableFailedAuthProtection": {
+                                    "type": "boolean"
+                                },
+                                "enableMachineAccess": {
+                                    "type": "boolean"
+                                },
+                                "enableMachineAuth": {
+                                    "type": "boolean"
+                                },
+                                "enablePassChange": {
+                                    "type": "boolean"
+                                },
+                                "enableRewrites": {
+                                    "type": "boolean"
+                                },
+                                "failedAuthThreshold": {
+                                    "type": "integer"
+                                },
+                                "firstName": {
+                                    "type": "string"
+                                },
+                                "identityNotInAdBehaviour": {
+                                    "type": "string"
+                                },
+                                "jobTitle": {
+                                    "type": "string"
+                                },
+                                "lastName": {
+                                    "type": "string"
+                                },
+                                "locality": {
+                                    "type": "string"
+                                },
+                                "organizationalUnit": {
+                                    "type": "string"
+                                },
+                                "plaintextAuth": {
+                                    "type": "boolean"
+                                },
+                                "rewriteRules": {
+                                    "items": {
+                                        "properties": {
+                                            "rewriteMatch": {
+                                                "type": "string"
+                                            },
+                                            "rewriteResult": {
+                                                "type": "string"
+                                            },
+                                            "rowId": {
+                                                "type": "integer"
+                                            }
+                                        },
+                                        "required": [
+                                            "rowId",
+                                            "rewriteMatch",
+                                            "rewriteResult"
+                                        ],
+                                        "type": "object"
+                                    },
+                                    "type": "array"
+                                },
+                                "schema": {
+                                    "type": "string"
+                                },
+                                "stateOrProvince": {
+                                    "type": "string"
+                                },
+                                "streetAddress": {
+                                    "type": "string"
+                                },
+                                "telephone": {
+                                    "type": "string"
+                                },
+                                "unreachableDomainsBehaviour": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "domain": {
+                            "type": "string"
+                        },
+                        "enableDomainWhiteList": {
+                            "type": "boolean"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "required": [
+                        "name",
+                        "domain"
+                    ],
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,42 +25,42 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorF8082B07Ce528F82545E210B84D7De(object):
     """createFilterPolicy request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorF8082B07Ce528F82545E210B84D7De, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSFilterPolicy": {
-                "properties": {
-                "domains": {
-                "type": "string"
-                },
-                "sgt": {
-                "type": "string"
-                },
-                "subnet": {
-                "type": "string"
-                },
-                "vn": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "domains": {
+                            "type": "string"
+                        },
+                        "sgt": {
+                            "type": "string"
+                        },
+                        "subnet": {
+                            "type": "string"
+                        },
+                        "vn": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,52 +25,51 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFbd772420B8851349Aa58Fb4A9B006B8(object):
     """updateNodeGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFbd772420B8851349Aa58Fb4A9B006B8, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
-                "description":
-                 {
-                "type": "string"
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
+                "description": {
+                    "type": "string"
                 },
                 "marCache": {
-                "properties": {
-                "query-attempts": {
-                "type": "integer"
-                },
-                "query-timeout": {
-                "type": "integer"
-                },
-                "replication-attempts": {
-                "type": "integer"
-                },
-                "replication-timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "query-attempts": {
+                            "type": "integer"
+                        },
+                        "query-timeout": {
+                            "type": "integer"
+                        },
+                        "replication-attempts": {
+                            "type": "integer"
+                        },
+                        "replication-timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,55 +25,55 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFd28158D85D37Ab1A1D616C56448C(object):
     """bulkCreateVnVlanMappings request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFd28158D85D37Ab1A1D616C56448C, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "items": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "items": {
                 "properties": {
-                "id": {
-                "type": "string"
-                },
-                "isData": {
-                "type": "boolean"
-                },
-                "isDefaultVlan": {
-                "type": "boolean"
-                },
-                "lastUpdate": {
-                "type": "string"
-                },
-                "maxValue": {
-                "type": "integer"
-                },
-                "name": {
-                "type": "string"
-                },
-                "vnId": {
-                "type": "string"
-                },
-                "vnName": {
-                "type": "string"
-                }
+                    "id": {
+                        "type": "string"
+                    },
+                    "isData": {
+                        "type": "boolean"
+                    },
+                    "isDefaultVlan": {
+                        "type": "boolean"
+                    },
+                    "lastUpdate": {
+                        "type": "string"
+                    },
+                    "maxValue": {
+                        "type": "integer"
+                    },
+                    "name": {
+                        "type": "string"
+                    },
+                    "vnId": {
+                        "type": "string"
+                    },
+                    "vnName": {
+                        "type": "string"
+                    }
                 },
                 "required": [
-                "name"
+                    "name"
                 ],
                 "type": "object"
-                },
-                "type": "array"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "array"
+        })
 
     def validate(self, request):
         try:
@@ -25,63 +25,63 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorA7500F6E473A50E19452683E303Dd021(object):
     """updateGuestSmtpNotificationSettingsById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorA7500F6E473A50E19452683E303Dd021, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSGuestSmtpNotificationSettings": {
-                "properties": {
-                "connectionTimeout": {
-                "type": "string"
-                },
-                "defaultFromAddress": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "notificationEnabled": {
-                "type": "boolean"
-                },
-                "password": {
-                "type": "string"
-                },
-                "smtpPort": {
-                "type": "string"
-                },
-                "smtpServer": {
-                "type": "string"
-                },
-                "useDefaultFromAddress": {
-                "type": "boolean"
-                },
-                "usePasswordAuthentication": {
-                "type": "boolean"
-                },
-                "useTLSorSSLEncryption": {
-                "type": "boolean"
-                },
-                "userName": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "connectionTimeout": {
+                            "type": "string"
+                        },
+                        "defaultFromAddress": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "notificationEnabled": {
+                            "type": "boolean"
+                        },
+                        "password": {
+                            "type": "string"
+                        },
+                        "smtpPort": {
+                            "type": "string"
+                        },
+                        "smtpServer": {
+                            "type": "string"
+                        },
+                        "useDefaultFromAddress": {
+                            "type": "boolean"
+                        },
+                        "usePasswordAuthentication": {
+                            "type": "boolean"
+                        },
+                        "useTLSorSSLEncryption": {
+                            "type": "boolean"
+                        },
+                        "userName": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,45 +25,45 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAcfdb4060De5A1895B383238C205986(object):
     """createAncPolicy request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAcfdb4060De5A1895B383238C205986, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ErsAncPolicy": {
-                "properties": {
-                "actions": {
-                "items": {
-                "enum": [
-                "QUARANTINE",
-                "PORTBOUNCE",
-                "SHUTDOWN",
-                "RE_AUTHENTICATE"
-                ],
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "actions": {
+                            "items": {
+                                "enum": [
+                                    "QUARANTINE",
+                                    "PORTBOUNCE",
+                                    "SHUTDOWN",
+                                    "RE_AUTHENTICATE"
+                                ],
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
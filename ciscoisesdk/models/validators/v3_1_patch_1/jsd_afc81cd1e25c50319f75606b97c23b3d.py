@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorAfc81Cd1E25C50319F75606B97C23B3D(object):
     """updateSecurityGroupsAclById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorAfc81Cd1E25C50319F75606B97C23B3D, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "Sgacl": {
-                "properties": {
-                "aclcontent": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "generationId": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "ipVersion": {
-                "type": "string"
-                },
-                "isReadOnly": {
-                "type": "boolean"
-                },
-                "modelledContent": {
-                "type": "object"
-                },
-                "name": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "aclcontent": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "generationId": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "ipVersion": {
+                            "type": "string"
+                        },
+                        "isReadOnly": {
+                            "type": "boolean"
+                        },
+                        "modelledContent": {
+                            "type": "object"
+                        },
+                        "name": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,52 +25,51 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB5097E4DB7505Ba390914B50B1C2046B(object):
     """createTACACSExternalServers request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB5097E4DB7505Ba390914B50B1C2046B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "TacacsExternalServer": {
-                "properties": {
-                "connectionPort": {
-                "type": "integer"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "hostIP": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sharedSecret": {
-                "type": "string"
-                },
-                "singleConnect": {
-                "type": "boolean"
-                },
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "connectionPort": {
+                            "type": "integer"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "hostIP": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sharedSecret": {
+                            "type": "string"
+                        },
+                        "singleConnect": {
+                            "type": "boolean"
+                        },
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
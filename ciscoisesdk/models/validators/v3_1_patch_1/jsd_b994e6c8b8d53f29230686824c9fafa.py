@@ -25,85 +25,85 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorB994E6C8B8D53F29230686824C9Fafa(object):
     """createScheduledConfigBackup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorB994E6C8B8D53F29230686824C9Fafa, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "backupDescription": {
-                "type": "string"
+                    "type": "string"
                 },
                 "backupEncryptionKey": {
-                "type": "string"
+                    "type": "string"
                 },
                 "backupName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "endDate": {
-                "type": "string"
+                    "type": "string"
                 },
                 "frequency": {
-                "enum": [
-                "DAILY",
-                "MONTHLY",
-                "ONCE",
-                "WEEKLY"
-                ],
-                "type": "string"
+                    "enum": [
+                        "DAILY",
+                        "MONTHLY",
+                        "ONCE",
+                        "WEEKLY"
+                    ],
+                    "type": "string"
                 },
                 "monthDay": {
-                "type": "string"
+                    "type": "string"
                 },
                 "repositoryName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "startDate": {
-                "type": "string"
+                    "type": "string"
                 },
                 "status": {
-                "enum": [
-                "DISABLE",
-                "ENABLE"
-                ],
-                "type": "string"
+                    "enum": [
+                        "DISABLE",
+                        "ENABLE"
+                    ],
+                    "type": "string"
                 },
                 "time": {
-                "type": "string"
+                    "type": "string"
                 },
                 "weekDay": {
-                "enum": [
-                "FRI",
-                "MON",
-                "SAT",
-                "SUN",
-                "THU",
-                "TUE",
-                "WED"
-                ],
-                "type": "string"
+                    "enum": [
+                        "FRI",
+                        "MON",
+                        "SAT",
+                        "SUN",
+                        "THU",
+                        "TUE",
+                        "WED"
+                    ],
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "backupEncryptionKey",
                 "backupName",
                 "frequency",
                 "repositoryName",
                 "startDate",
                 "time"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
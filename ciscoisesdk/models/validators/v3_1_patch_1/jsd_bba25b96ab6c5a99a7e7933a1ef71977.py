@@ -25,183 +25,183 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBba25B96Ab6C5A99A7E7933A1Ef71977(object):
     """setProfilerProbeConfig request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBba25B96Ab6C5A99A7E7933A1Ef71977, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "activeDirectory": {
-                "properties": {
-                "daysBeforeRescan": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "daysBeforeRescan": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "dhcp": {
-                "properties": {
-                "interfaces": {
-                "items": {
-                "properties": {
-                "interface": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "interface"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "port": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "interfaces": {
+                            "items": {
+                                "properties": {
+                                    "interface": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": [
+                                    "interface"
+                                ],
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "port": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "dhcpSpan": {
-                "properties": {
-                "interfaces": {
-                "items": {
-                "properties": {
-                "interface": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "interface"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "interfaces": {
+                            "items": {
+                                "properties": {
+                                    "interface": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": [
+                                    "interface"
+                                ],
+                                "type": "object"
+                            },
+                            "type": "array"
+                        }
+                    },
+                    "type": "object"
                 },
                 "dns": {
-                "properties": {
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "http": {
-                "properties": {
-                "interfaces": {
-                "items": {
-                "properties": {
-                "interface": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "interface"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "interfaces": {
+                            "items": {
+                                "properties": {
+                                    "interface": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": [
+                                    "interface"
+                                ],
+                                "type": "object"
+                            },
+                            "type": "array"
+                        }
+                    },
+                    "type": "object"
                 },
                 "netflow": {
-                "properties": {
-                "interfaces": {
-                "items": {
-                "properties": {
-                "interface": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "interface"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "port": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "interfaces": {
+                            "items": {
+                                "properties": {
+                                    "interface": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": [
+                                    "interface"
+                                ],
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "port": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "nmap": {
-                "items": {
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "object"
+                    },
+                    "type": "array"
                 },
                 "pxgrid": {
-                "items": {
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "object"
+                    },
+                    "type": "array"
                 },
                 "radius": {
-                "items": {
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "object"
+                    },
+                    "type": "array"
                 },
                 "snmpQuery": {
-                "properties": {
-                "eventTimeout": {
-                "type": "integer"
-                },
-                "retries": {
-                "type": "integer"
-                },
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "eventTimeout": {
+                            "type": "integer"
+                        },
+                        "retries": {
+                            "type": "integer"
+                        },
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 },
                 "snmpTrap": {
-                "properties": {
-                "interfaces": {
-                "items": {
-                "properties": {
-                "interface": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "interface"
-                ],
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "linkTrapQuery": {
-                "type": "boolean"
-                },
-                "macTrapQuery": {
-                "type": "boolean"
-                },
-                "port": {
-                "type": "integer"
+                    "properties": {
+                        "interfaces": {
+                            "items": {
+                                "properties": {
+                                    "interface": {
+                                        "type": "string"
+                                    }
+                                },
+                                "required": [
+                                    "interface"
+                                ],
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "linkTrapQuery": {
+                            "type": "boolean"
+                        },
+                        "macTrapQuery": {
+                            "type": "boolean"
+                        },
+                        "port": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
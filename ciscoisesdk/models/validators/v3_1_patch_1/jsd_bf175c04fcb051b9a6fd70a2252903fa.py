@@ -25,73 +25,72 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorBf175C04Fcb051B9A6Fd70A2252903Fa(object):
     """createInternalUser request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorBf175C04Fcb051B9A6Fd70A2252903Fa, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "InternalUser": {
-                "properties": {
-                "changePassword": {
-                "type": "boolean"
-                },
-                "customAttributes": {
-                "type": "object"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "email": {
-                "type": "string"
-                },
-                "enablePassword": {
-                "type": "string"
-                },
-                "enabled": {
-                "type": "boolean"
-                },
-                "expiryDate": {
-                "type": "string"
-                },
-                "expiryDateEnabled": {
-                "type": "boolean"
-                },
-                "firstName": {
-                "type": "string"
-                },
-                "identityGroups": {
-                "type": "string"
-                },
-                "lastName": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "password": {
-                "type": "string"
-                },
-                "passwordIDStore": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "changePassword": {
+                            "type": "boolean"
+                        },
+                        "customAttributes": {
+                            "type": "object"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "email": {
+                            "type": "string"
+                        },
+                        "enablePassword": {
+                            "type": "string"
+                        },
+                        "enabled": {
+                            "type": "boolean"
+                        },
+                        "expiryDate": {
+                            "type": "string"
+                        },
+                        "expiryDateEnabled": {
+                            "type": "boolean"
+                        },
+                        "firstName": {
+                            "type": "string"
+                        },
+                        "identityGroups": {
+                            "type": "string"
+                        },
+                        "lastName": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "password": {
+                            "type": "string"
+                        },
+                        "passwordIDStore": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,60 +25,60 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC1Fa3Bf115C77Be99B602Aca1493B(object):
     """UpdateNode request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC1Fa3Bf115C77Be99B602Aca1493B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "roles": {
-                "items": {
-                "enum": [
-                "PrimaryAdmin",
-                "PrimaryDedicatedMonitoring",
-                "PrimaryMonitoring",
-                "SecondaryAdmin",
-                "SecondaryDedicatedMonitoring",
-                "SecondaryMonitoring",
-                "Standalone"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "PrimaryAdmin",
+                            "PrimaryDedicatedMonitoring",
+                            "PrimaryMonitoring",
+                            "SecondaryAdmin",
+                            "SecondaryDedicatedMonitoring",
+                            "SecondaryMonitoring",
+                            "Standalone"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "services": {
-                "items": {
-                "enum": [
-                "DeviceAdmin",
-                "PassiveIdentity",
-                "Profiler",
-                "SXP",
-                "Session",
-                "TC-NAC",
-                "pxGrid",
-                "pxGridCloud"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "DeviceAdmin",
+                            "PassiveIdentity",
+                            "Profiler",
+                            "SXP",
+                            "Session",
+                            "TC-NAC",
+                            "pxGrid",
+                            "pxGridCloud"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "roles",
                 "services"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
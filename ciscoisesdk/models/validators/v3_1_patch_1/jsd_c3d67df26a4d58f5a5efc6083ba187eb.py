@@ -25,52 +25,52 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC3D67Df26A4D58F5A5EfC6083Ba187Eb(object):
     """updateVnVlanMappingById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC3D67Df26A4D58F5A5EfC6083Ba187Eb, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "isData": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "isDefaultVlan": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "lastUpdate": {
-                "type": "string"
+                    "type": "string"
                 },
                 "maxValue": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "vnId": {
-                "type": "string"
+                    "type": "string"
                 },
                 "vnName": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
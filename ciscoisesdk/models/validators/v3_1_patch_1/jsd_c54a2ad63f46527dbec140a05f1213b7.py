@@ -25,63 +25,62 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC54A2Ad63F46527DBec140A05F1213B7(object):
     """updateNativeSupplicantProfileById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC54A2Ad63F46527DBec140A05F1213B7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSNSPProfile": {
-                "properties": {
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "wirelessProfiles": {
-                "items": {
-                "properties": {
-                "actionType": {
-                "type": "string"
-                },
-                "allowedProtocol": {
-                "type": "string"
-                },
-                "certificateTemplateId": {
-                "type": "string"
-                },
-                "previousSsid": {
-                "type": "string"
-                },
-                "ssid": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                },
-                "type": "array"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "wirelessProfiles": {
+                            "items": {
+                                "properties": {
+                                    "actionType": {
+                                        "type": "string"
+                                    },
+                                    "allowedProtocol": {
+                                        "type": "string"
+                                    },
+                                    "certificateTemplateId": {
+                                        "type": "string"
+                                    },
+                                    "previousSsid": {
+                                        "type": "string"
+                                    },
+                                    "ssid": {
+                                        "type": "string"
+                                    }
+                                },
+                                "type": "object"
+                            },
+                            "type": "array"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
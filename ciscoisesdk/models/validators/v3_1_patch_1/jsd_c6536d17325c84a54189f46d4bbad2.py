@@ -25,73 +25,72 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorC6536D17325C84A54189F46D4Bbad2(object):
     """updateExternalRadiusServerById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorC6536D17325C84A54189F46D4Bbad2, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ExternalRadiusServer": {
-                "properties": {
-                "accountingPort": {
-                "type": "integer"
-                },
-                "authenticationPort": {
-                "type": "integer"
-                },
-                "authenticatorKey": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "enableKeyWrap": {
-                "type": "boolean"
-                },
-                "encryptionKey": {
-                "type": "string"
-                },
-                "hostIP": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "keyInputFormat": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "proxyTimeout": {
-                "type": "integer"
-                },
-                "retries": {
-                "type": "integer"
-                },
-                "sharedSecret": {
-                "type": "string"
-                },
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "accountingPort": {
+                            "type": "integer"
+                        },
+                        "authenticationPort": {
+                            "type": "integer"
+                        },
+                        "authenticatorKey": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "enableKeyWrap": {
+                            "type": "boolean"
+                        },
+                        "encryptionKey": {
+                            "type": "string"
+                        },
+                        "hostIP": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "keyInputFormat": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "proxyTimeout": {
+                            "type": "integer"
+                        },
+                        "retries": {
+                            "type": "integer"
+                        },
+                        "sharedSecret": {
+                            "type": "string"
+                        },
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
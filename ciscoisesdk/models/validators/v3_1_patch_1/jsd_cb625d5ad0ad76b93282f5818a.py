@@ -25,120 +25,119 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCb625D5Ad0Ad76B93282F5818A(object):
     """updateTrustedCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCb625D5Ad0Ad76B93282F5818A, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "authenticateBeforeCRLReceived": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "automaticCRLUpdate": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "automaticCRLUpdatePeriod": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "automaticCRLUpdateUnits": {
-                "enum": [
-                "Days",
-                "Hours",
-                "Minutes",
-                "Weeks"
-                ],
-                "type": "string"
+                    "enum": [
+                        "Days",
+                        "Hours",
+                        "Minutes",
+                        "Weeks"
+                    ],
+                    "type": "string"
                 },
                 "crlDistributionUrl": {
-                "type": "string"
+                    "type": "string"
                 },
                 "crlDownloadFailureRetries": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "crlDownloadFailureRetriesUnits": {
-                "enum": [
-                "Days",
-                "Hours",
-                "Minutes",
-                "Weeks"
-                ],
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
+                    "enum": [
+                        "Days",
+                        "Hours",
+                        "Minutes",
+                        "Weeks"
+                    ],
+                    "type": "string"
+                },
+                "description": {
+                    "type": "string"
                 },
                 "downloadCRL": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "enableOCSPValidation": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "enableServerIdentityCheck": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "ignoreCRLExpiration": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "nonAutomaticCRLUpdatePeriod": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "nonAutomaticCRLUpdateUnits": {
-                "enum": [
-                "Days",
-                "Hours",
-                "Minutes",
-                "Weeks"
-                ],
-                "type": "string"
+                    "enum": [
+                        "Days",
+                        "Hours",
+                        "Minutes",
+                        "Weeks"
+                    ],
+                    "type": "string"
                 },
                 "rejectIfNoStatusFromOCSP": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "rejectIfUnreachableFromOCSP": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "selectedOCSPService": {
-                "type": "string"
+                    "type": "string"
                 },
                 "status": {
-                "enum": [
-                "Disabled",
-                "Enabled"
-                ],
-                "type": "string"
+                    "enum": [
+                        "Disabled",
+                        "Enabled"
+                    ],
+                    "type": "string"
                 },
                 "trustForCertificateBasedAdminAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForCiscoServicesAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForClientAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "trustForIseAuth": {
-                "type": "boolean"
+                    "type": "boolean"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
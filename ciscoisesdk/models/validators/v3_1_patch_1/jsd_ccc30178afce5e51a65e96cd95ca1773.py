@@ -25,57 +25,56 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCcc30178Afce5E51A65E96Cd95Ca1773(object):
     """createNBARApp request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCcc30178Afce5E51A65E96Cd95Ca1773, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
-                "description":
-                 {
-                "type": "string"
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
+                "description": {
+                    "type": "string"
                 },
                 "id": {
-                "type": "string"
+                    "type": "string"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "networkIdentities": {
-                "items": {
-                "properties": {
-                "ports": {
-                "type": "string"
-                },
-                "protocol": {
-                "type": "string"
-                }
-                },
-                "required": [
-                "ports",
-                "protocol"
-                ],
-                "type": "object"
-                },
-                "type": "array"
+                    "items": {
+                        "properties": {
+                            "ports": {
+                                "type": "string"
+                            },
+                            "protocol": {
+                                "type": "string"
+                            }
+                        },
+                        "required": [
+                            "ports",
+                            "protocol"
+                        ],
+                        "type": "object"
+                    },
+                    "type": "array"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "description",
                 "name"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,58 +25,57 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorCe83Fba942C25938Bae0C7012Df68317(object):
     """updateEgressMatrixCellById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorCe83Fba942C25938Bae0C7012Df68317, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "EgressMatrixCell": {
-                "properties": {
-                "defaultRule": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "destinationSgtId": {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "matrixCellStatus": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "sgacls": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
-                },
-                "sourceSgtId": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "defaultRule": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "destinationSgtId": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "matrixCellStatus": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "sgacls": {
+                            "items": {
+                                "type": "string"
+                            },
+                            "type": "array"
+                        },
+                        "sourceSgtId": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,55 +25,54 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD0290Eb241F5Bd79221Afc8D6Cb32Da(object):
     """createSecurityGroup request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD0290Eb241F5Bd79221Afc8D6Cb32Da, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "Sgt": {
-                "properties": {
-                "defaultSGACLs": {
-                "items": {
-                "type": "object"
-                },
-                "type": "array"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "generationId": {
-                "type": "string"
-                },
-                "isReadOnly": {
-                "type": "boolean"
-                },
-                "name": {
-                "type": "string"
-                },
-                "propogateToApic": {
-                "type": "boolean"
-                },
-                "value": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "defaultSGACLs": {
+                            "items": {
+                                "type": "object"
+                            },
+                            "type": "array"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "generationId": {
+                            "type": "string"
+                        },
+                        "isReadOnly": {
+                            "type": "boolean"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "propogateToApic": {
+                            "type": "boolean"
+                        },
+                        "value": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,76 +25,76 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorD0Ee193Cc65780Af11Ed96B1758755(object):
     """registerNode request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorD0Ee193Cc65780Af11Ed96B1758755, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "allowCertImport": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "fqdn": {
-                "type": "string"
+                    "type": "string"
                 },
                 "password": {
-                "type": "string"
+                    "type": "string"
                 },
                 "roles": {
-                "items": {
-                "enum": [
-                "PrimaryAdmin",
-                "PrimaryDedicatedMonitoring",
-                "PrimaryMonitoring",
-                "SecondaryAdmin",
-                "SecondaryDedicatedMonitoring",
-                "SecondaryMonitoring",
-                "Standalone"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "PrimaryAdmin",
+                            "PrimaryDedicatedMonitoring",
+                            "PrimaryMonitoring",
+                            "SecondaryAdmin",
+                            "SecondaryDedicatedMonitoring",
+                            "SecondaryMonitoring",
+                            "Standalone"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "services": {
-                "items": {
-                "enum": [
-                "DeviceAdmin",
-                "PassiveIdentity",
-                "Profiler",
-                "SXP",
-                "Session",
-                "TC-NAC",
-                "pxGrid",
-                "pxGridCloud"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "DeviceAdmin",
+                            "PassiveIdentity",
+                            "Profiler",
+                            "SXP",
+                            "Session",
+                            "TC-NAC",
+                            "pxGrid",
+                            "pxGridCloud"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "userName": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowCertImport",
                 "fqdn",
                 "password",
                 "roles",
                 "services",
                 "userName"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
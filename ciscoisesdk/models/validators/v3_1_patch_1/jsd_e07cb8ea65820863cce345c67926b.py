@@ -25,52 +25,51 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorE07Cb8Ea65820863CCe345C67926B(object):
     """updateSXPLocalBindingsById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorE07Cb8Ea65820863CCe345C67926B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ERSSxpLocalBindings": {
-                "properties": {
-                "bindingName": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "ipAddressOrHost": {
-                "type": "string"
-                },
-                "sgt": {
-                "type": "string"
-                },
-                "sxpVpn": {
-                "type": "string"
-                },
-                "vns": {
-                "type": "string"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "bindingName": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "ipAddressOrHost": {
+                            "type": "string"
+                        },
+                        "sgt": {
+                            "type": "string"
+                        },
+                        "sxpVpn": {
+                            "type": "string"
+                        },
+                        "vns": {
+                            "type": "string"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
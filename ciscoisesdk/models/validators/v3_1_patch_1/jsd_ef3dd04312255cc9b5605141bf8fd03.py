@@ -25,62 +25,62 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorEf3Dd04312255Cc9B5605141Bf8Fd03(object):
     """createRegistrationInfo request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorEf3Dd04312255Cc9B5605141Bf8Fd03, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "connectionType": {
-                "enum": [
-                "HTTP_DIRECT",
-                "PROXY",
-                "SSM_ONPREM_SERVER",
-                "TRANSPORT_GATEWAY"
-                ],
-                "type": "string"
+                    "enum": [
+                        "HTTP_DIRECT",
+                        "PROXY",
+                        "SSM_ONPREM_SERVER",
+                        "TRANSPORT_GATEWAY"
+                    ],
+                    "type": "string"
                 },
                 "registrationType": {
-                "enum": [
-                "DEREGISTER",
-                "REGISTER",
-                "RENEW",
-                "UPDATE"
-                ],
-                "type": "string"
+                    "enum": [
+                        "DEREGISTER",
+                        "REGISTER",
+                        "RENEW",
+                        "UPDATE"
+                    ],
+                    "type": "string"
                 },
                 "ssmOnPremServer": {
-                "type": "string"
+                    "type": "string"
                 },
                 "tier": {
-                "items": {
-                "enum": [
-                "ADVANTAGE",
-                "DEVICEADMIN",
-                "ESSENTIAL",
-                "PREMIER",
-                "VM"
-                ],
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "enum": [
+                            "ADVANTAGE",
+                            "DEVICEADMIN",
+                            "ESSENTIAL",
+                            "PREMIER",
+                            "VM"
+                        ],
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "token": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,61 +25,60 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorF6De5797735Bbd95Dc8683C6A7Aebf(object):
     """updateTACACSServerSequenceById request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorF6De5797735Bbd95Dc8683C6A7Aebf, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "TacacsServerSequence": {
-                "properties": {
-                "description":
-                 {
-                "type": "string"
-                },
-                "id": {
-                "type": "string"
-                },
-                "localAccounting": {
-                "type": "boolean"
-                },
-                "name": {
-                "type": "string"
-                },
-                "prefixDelimiter": {
-                "type": "string"
-                },
-                "prefixStrip": {
-                "type": "boolean"
-                },
-                "remoteAccounting": {
-                "type": "boolean"
-                },
-                "serverList": {
-                "type": "string"
-                },
-                "suffixDelimiter": {
-                "type": "string"
-                },
-                "suffixStrip": {
-                "type": "boolean"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "description": {
+                            "type": "string"
+                        },
+                        "id": {
+                            "type": "string"
+                        },
+                        "localAccounting": {
+                            "type": "boolean"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "prefixDelimiter": {
+                            "type": "string"
+                        },
+                        "prefixStrip": {
+                            "type": "boolean"
+                        },
+                        "remoteAccounting": {
+                            "type": "boolean"
+                        },
+                        "serverList": {
+                            "type": "string"
+                        },
+                        "suffixDelimiter": {
+                            "type": "string"
+                        },
+                        "suffixStrip": {
+                            "type": "boolean"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,55 +25,55 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorF757B04825Bb5C29A1B3475Aae870D04(object):
     """updateRepository request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorF757B04825Bb5C29A1B3475Aae870D04, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "properties": {
+        self._validator = compile_schema({
+            "properties": {
                 "enablePki": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "password": {
-                "type": "string"
+                    "type": "string"
                 },
                 "path": {
-                "type": "string"
+                    "type": "string"
                 },
                 "protocol": {
-                "enum": [
-                "CDROM",
-                "DISK",
-                "FTP",
-                "HTTP",
-                "HTTPS",
-                "NFS",
-                "SFTP",
-                "TFTP"
-                ],
-                "type": "string"
+                    "enum": [
+                        "CDROM",
+                        "DISK",
+                        "FTP",
+                        "HTTP",
+                        "HTTPS",
+                        "NFS",
+                        "SFTP",
+                        "TFTP"
+                    ],
+                    "type": "string"
                 },
                 "serverName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "userName": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,72 +25,71 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFaC48E5C63Abfe2Feec6Fd1903(object):
     """createSupportBundle request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFaC48E5C63Abfe2Feec6Fd1903, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "SupportBundle": {
-                "properties": {
-                "description":
-                 {
-                "type": "string"
-                },
-                "hostName": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "supportBundleIncludeOptions": {
-                "properties": {
-                "fromDate": {
-                "type": "string"
-                },
-                "includeConfigDB": {
-                "type": "boolean"
-                },
-                "includeCoreFiles": {
-                "type": "boolean"
-                },
-                "includeDebugLogs": {
-                "type": "boolean"
-                },
-                "includeLocalLogs": {
-                "type": "boolean"
-                },
-                "includeSystemLogs": {
-                "type": "boolean"
-                },
-                "mntLogs": {
-                "type": "boolean"
-                },
-                "policyXml": {
-                "type": "boolean"
-                },
-                "toDate": {
-                "type": "string"
-                }
-                },
-                "type": "object"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "description": {
+                            "type": "string"
+                        },
+                        "hostName": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "supportBundleIncludeOptions": {
+                            "properties": {
+                                "fromDate": {
+                                    "type": "string"
+                                },
+                                "includeConfigDB": {
+                                    "type": "boolean"
+                                },
+                                "includeCoreFiles": {
+                                    "type": "boolean"
+                                },
+                                "includeDebugLogs": {
+                                    "type": "boolean"
+                                },
+                                "includeLocalLogs": {
+                                    "type": "boolean"
+                                },
+                                "includeSystemLogs": {
+                                    "type": "boolean"
+                                },
+                                "mntLogs": {
+                                    "type": "boolean"
+                                },
+                                "policyXml": {
+                                    "type": "boolean"
+                                },
+                                "toDate": {
+                                    "type": "string"
+                                }
+                            },
+                            "type": "object"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,85 +25,84 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFb9C22Ad9A5EddB590C85Abdab460B(object):
     """UpdateSystemCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFb9C22Ad9A5EddB590C85Abdab460B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "admin": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowPortalTagTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfPortalGroupTag": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowRoleTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
-                "description":
-                 {
-                "type": "string"
+                "description": {
+                    "type": "string"
                 },
                 "eap": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "expirationTTLPeriod": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "expirationTTLUnits": {
-                "enum": [
-                "days",
-                "months",
-                "weeks",
-                "years"
-                ],
-                "type": "string"
+                    "enum": [
+                        "days",
+                        "months",
+                        "weeks",
+                        "years"
+                    ],
+                    "type": "string"
                 },
                 "ims": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "portal": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "portalGroupTag": {
-                "type": "string"
+                    "type": "string"
                 },
                 "pxgrid": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "radius": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "renewSelfSignedCertificate": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "saml": {
-                "type": "boolean"
+                    "type": "boolean"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowPortalTagTransferForSameSubject",
                 "allowReplacementOfPortalGroupTag",
                 "allowRoleTransferForSameSubject"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,70 +25,69 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFc1C74B35Ae5050B4F7Fd702570Ad5B(object):
     """createExternalRadiusServer request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFc1C74B35Ae5050B4F7Fd702570Ad5B, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "ExternalRadiusServer": {
-                "properties": {
-                "accountingPort": {
-                "type": "integer"
-                },
-                "authenticationPort": {
-                "type": "integer"
-                },
-                "authenticatorKey": {
-                "type": "string"
-                },
-                "description":
-                 {
-                "type": "string"
-                },
-                "enableKeyWrap": {
-                "type": "boolean"
-                },
-                "encryptionKey": {
-                "type": "string"
-                },
-                "hostIP": {
-                "type": "string"
-                },
-                "keyInputFormat": {
-                "type": "string"
-                },
-                "name": {
-                "type": "string"
-                },
-                "proxyTimeout": {
-                "type": "integer"
-                },
-                "retries": {
-                "type": "integer"
-                },
-                "sharedSecret": {
-                "type": "string"
-                },
-                "timeout": {
-                "type": "integer"
-                }
-                },
-                "type": "object"
+                    "properties": {
+                        "accountingPort": {
+                            "type": "integer"
+                        },
+                        "authenticationPort": {
+                            "type": "integer"
+                        },
+                        "authenticatorKey": {
+                            "type": "string"
+                        },
+                        "description": {
+                            "type": "string"
+                        },
+                        "enableKeyWrap": {
+                            "type": "boolean"
+                        },
+                        "encryptionKey": {
+                            "type": "string"
+                        },
+                        "hostIP": {
+                            "type": "string"
+                        },
+                        "keyInputFormat": {
+                            "type": "string"
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "proxyTimeout": {
+                            "type": "integer"
+                        },
+                        "retries": {
+                            "type": "integer"
+                        },
+                        "sharedSecret": {
+                            "type": "string"
+                        },
+                        "timeout": {
+                            "type": "integer"
+                        }
+                    },
+                    "type": "object"
                 }
-                },
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            },
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
@@ -25,149 +25,150 @@ SOFTWARE.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import json
 from builtins import *
 
 import fastjsonschema
 from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.models.validators import compile_schema
 
 
 class JSONSchemaValidatorFdc480AdA5105F60Af5FBe922E5690E7(object):
     """generateSelfSignedCertificate request schema definition."""
+    __slots__ = ('_validator',)
+
     def __init__(self):
         super(JSONSchemaValidatorFdc480AdA5105F60Af5FBe922E5690E7, self).__init__()
-        self._validator = fastjsonschema.compile(json.loads(
-            '''{
-                "$schema": "http://json-schema.org/draft-04/schema#",
-                "properties": {
+        self._validator = compile_schema({
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "properties": {
                 "admin": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowExtendedValidity": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowPortalTagTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfCertificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowReplacementOfPortalGroupTag": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowRoleTransferForSameSubject": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowSanDnsBadName": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowSanDnsNonResolvable": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "allowWildCardCertificates": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "certificatePolicies": {
-                "type": "string"
+                    "type": "string"
                 },
                 "digestType": {
-                "enum": [
-                "SHA-256",
-                "SHA-384",
-                "SHA-512"
-                ],
-                "type": "string"
+                    "enum": [
+                        "SHA-256",
+                        "SHA-384",
+                        "SHA-512"
+                    ],
+                    "type": "string"
                 },
                 "eap": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "expirationTTL": {
-                "type": "integer"
+                    "type": "integer"
                 },
                 "expirationTTLUnit": {
-                "enum": [
-                "days",
-                "months",
-                "weeks",
-                "years"
-                ],
-                "type": "string"
+                    "enum": [
+                        "days",
+                        "months",
+                        "weeks",
+                        "years"
+                    ],
+                    "type": "string"
                 },
                 "hostName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "keyLength": {
-                "enum": [
-                "1024",
-                "2048",
-                "4096",
-                "512"
-                ],
-                "type": "string"
+                    "enum": [
+                        "1024",
+                        "2048",
+                        "4096",
+                        "512"
+                    ],
+                    "type": "string"
                 },
                 "keyType": {
-                "enum": [
-                "ECDSA",
-                "RSA"
-                ],
-                "type": "string"
+                    "enum": [
+                        "ECDSA",
+                        "RSA"
+                    ],
+                    "type": "string"
                 },
                 "name": {
-                "type": "string"
+                    "type": "string"
                 },
                 "portal": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "portalGroupTag": {
-                "type": "string"
+                    "type": "string"
                 },
                 "pxgrid": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "radius": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "saml": {
-                "type": "boolean"
+                    "type": "boolean"
                 },
                 "sanDNS": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "sanIP": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "sanURI": {
-                "items": {
-                "type": "string"
-                },
-                "type": "array"
+                    "items": {
+                        "type": "string"
+                    },
+                    "type": "array"
                 },
                 "subjectCity": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectCommonName": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectCountry": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectOrg": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectOrgUnit": {
-                "type": "string"
+                    "type": "string"
                 },
                 "subjectState": {
-                "type": "string"
+                    "type": "string"
                 }
-                },
-                "required": [
+            },
+            "required": [
                 "allowExtendedValidity",
                 "allowPortalTagTransferForSameSubject",
                 "allowReplacementOfCertificates",
@@ -181,10 +182,9 @@ class JSONSchemaValidatorFdc480AdA5105F60Af5FBe922E5690E7(object):
                 "hostName",
                 "keyLength",
                 "keyType"
-                ],
-                "type": "object"
-                }'''.replace("\n" + ' ' * 16, '')
-        ))
+            ],
+            "type": "object"
+        })
 
     def validate(self, request):
         try:
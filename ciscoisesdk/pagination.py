@@ -29,7 +29,10 @@ from future import standard_library
 
 standard_library.install_aliases()
 native_str = str
+import itertools
 import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from .exceptions import ApiError
 
@@ -115,3 +118,109 @@ def get_next_page(function, params, access_next_list=["SearchResult", "nextPage"
                     function, {**params, **_query_params},
                     access_next_list=access_next_list, access_resource_list=access_resource_list,
                     has_been_found=has_been_found, prev_result=prev_result)
+
+
+def get_total_pages(response, size, access_total_list=["SearchResult", "total"]):
+    """
+    Args:
+        response(RestResponse): The response of the first requested page
+        size(int): The number of objects returned per page
+        access_total_list(list): List of strings. Allows to access the total number of objects
+
+    Returns:
+        int: The number of pages announced by the response, or None if it does not include a total.
+
+    """
+    value = _get_nested_value(response.response, access_total_list)
+    if not isinstance(value, int) or not size:
+        return None
+    return (value + size - 1) // size
+
+
+def get_remaining_pages(response, params,
+                        access_next_list=["SearchResult", "nextPage", "href"],
+                        access_resource_list=["SearchResult", "resources"],
+                        access_total_list=["SearchResult", "total"]):
+    """
+    Args:
+        response(RestResponse): The response of the page requested with params
+        params(dict): The parameters of the function
+        access_next_list(list): List of strings. Allows to access the URL for the next page using the previous response object
+        access_resource_list(list): List of strings. Allows to access the response object
+        access_total_list(list): List of strings. Allows to access the total number of objects
+
+    Returns:
+        tuple: The page size and the range of the remaining page numbers. The page
+        size is None if the response does not announce its total, then the
+        remaining pages have to be followed through the next page URL.
+
+    """
+    next_url = _get_nested_value(response.response, access_next_list)
+    if not isinstance(next_url, str):
+        return 0, range(0)
+    next_query_params = urllib.parse.parse_qs(urllib.parse.urlparse(next_url).query)
+
+    size = params.get('size') or next_query_params.get('size')
+    if size is None:
+        size = len(_get_nested_value(response.response, access_resource_list) or [])
+    size = get_next_page_number(size) - 1
+    total_pages = get_total_pages(response, size, access_total_list=access_total_list)
+    if total_pages is None:
+        return None, range(0)
+    return size, range(get_next_page_number(params.get('page')), total_pages + 1)
+
+
+def get_next_page_prefetch(function, params, workers=4,
+                           access_next_list=["SearchResult", "nextPage", "href"],
+                           access_resource_list=["SearchResult", "resources"],
+                           access_total_list=["SearchResult", "total"]):
+    """
+    Args:
+        function(function): The API function to call
+        params(dict): The parameters of the function
+        workers(int): The maximum number of pages requested concurrently
+        access_next_list(list): List of strings. Allows to access the URL for the next page using the previous response object
+        access_resource_list(list): List of strings. Allows to access the response object
+        access_total_list(list): List of strings. Allows to access the total number of objects
+
+    Yields:
+        Generator: A generator object containing the RestResponse objects for all pages, in page order.
+
+    """
+    params = {**params, 'page': get_next_page_number(params.get('page')) - 1}
+    response = function(**params)
+    yield response
+
+    size, page_numbers = get_remaining_pages(
+        response, params,
+        access_next_list=access_next_list, access_resource_list=access_resource_list,
+        access_total_list=access_total_list)
+    if size is None:
+        # Without a total the page count is unknown, follow the links instead
+        next_url = _get_nested_value(response.response, access_next_list)
+        _query_params = urllib.parse.parse_qs(urllib.parse.urlparse(next_url).query)
+        yield from get_next_page(
+            function, {**params, **_query_params},
+            access_next_list=access_next_list, access_resource_list=access_resource_list)
+        return
+
+    page_numbers = iter(page_numbers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            executor.submit(function, **{**params, 'page': page_number, 'size': size})
+            for page_number in itertools.islice(page_numbers, workers)
+        )
+        while pending:
+            response = pending.popleft().result()
+            for page_number in itertools.islice(page_numbers, 1):
+                pending.append(executor.submit(function, **{**params, 'page': page_number, 'size': size}))
+            yield response
+
+
+def _get_nested_value(value, access_list):
+    for access in access_list:
+        if isinstance(value, dict) and value.get(access) is not None:
+            value = value.get(access)
+        else:
+            return None
+    return value
@@ -33,6 +33,8 @@ RESPONSE_CODES = {
     204: "Successful request without body content.",
     206: "The request included a Range Header, and the server responded with "
          "the partial content matching the range.",
+    304: "The resource has not been modified since the version given in the "
+         "If-None-Match header.",
     400: "The request was invalid or cannot be otherwise served.",
     401: "Authentication credentials were missing or incorrect.",
     403: "The request is understood, but it has been refused or access is not "
@@ -62,6 +64,8 @@ RESPONSE_CODES = {
 
 RATE_LIMIT_RESPONSE_CODE = 429
 
+NOT_MODIFIED_RESPONSE_CODE = 304
+
 EXPECTED_RESPONSE_CODE = {
     'GET': [200, 202, 204, 206],
     'POST': [200, 201, 202, 204, 206],
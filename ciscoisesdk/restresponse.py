@@ -52,7 +52,9 @@ class RestResponse(object):
         # Initialize attributes and properties
         self._headers = {**response.headers}
         self._content = bytes(response.content)
-        self._text = str(response.text)
+        self._encoding = response.encoding
+        # Decoded on first access when the charset is known
+        self._text = None if self._encoding else str(response.text)
         self._response = extract_and_parse(response)
         self._status_code = response.status_code
 
@@ -69,6 +71,11 @@ class RestResponse(object):
     @property
     def text(self):
         """The text (str) of the RestResponse."""
+        if self._text is None:
+            try:
+                self._text = str(self._content, self._encoding, errors='replace')
+            except LookupError:
+                self._text = str(self._content, errors='replace')
         return self._text
 
     @property
@@ -33,18 +33,27 @@ import logging
 import os
 import re
 import socket
+import threading
 import time
 import urllib.parse
 import warnings
+import weakref
 from builtins import *
 
 import requests
 from past.builtins import basestring
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.response import HTTPResponse
+from requests.packages.urllib3.util.retry import Retry
 from requests_toolbelt.multipart import encoder
 
 from .config import (
+    DEFAULT_CONNECTION_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_BLOCK,
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_THREAD_LOCAL_SESSIONS,
+    DEFAULT_TRANSPORT,
     DEFAULT_VERIFY,
     DEFAULT_WAIT_ON_RATE_LIMIT,
 )
@@ -55,19 +64,29 @@ from .exceptions import (
     RateLimitWarning,
     ciscoisesdkException,
 )
+from .http2 import HTTP2Adapter
 from .misc import check_response_code
 from .response_codes import EXPECTED_RESPONSE_CODE
 from .restresponse import RestResponse
 from .utils import (
     check_type,
+    extract_and_parse_json,
     get_exception_additional_data,
     pprint_request_info,
     pprint_response_info,
     validate_base_url,
 )
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Smaller JSON bodies are read at once, the parsing cost is the same.
+STREAM_MIN_CONTENT_LENGTH = 64 * 1024
+
 
 class DownloadResponse(HTTPResponse):
     """Download Response wrapper.
@@ -134,6 +153,31 @@ class DownloadResponse(HTTPResponse):
         return self._path
 
 
+# ijson events that open, close or name the members of a container
+_CONTAINER_EVENTS = ('start_map', 'end_map', 'start_array', 'end_array', 'map_key')
+
+
+def _get_json_path(value, path):
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def _build_json_value(event, value, events):
+    # Consumes the events of one object or array, opened by event
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if not depth:
+                return builder.value
+        _, event, value = next(events)
+
+
 # Main module interface
 class RestSession(object):
     """RESTful HTTP session class for making calls to the Identity Services Engine APIs."""
@@ -147,7 +191,12 @@ class RestSession(object):
                           'Accept': 'application/json'},
                  debug=False,
                  uses_csrf_token=None,
-                 get_csrf_token=None):
+                 get_csrf_token=None,
+                 connection_pool_size=DEFAULT_CONNECTION_POOL_SIZE,
+                 transport=DEFAULT_TRANSPORT,
+                 thread_local_sessions=DEFAULT_THREAD_LOCAL_SESSIONS,
+                 max_retries=DEFAULT_MAX_RETRIES,
+                 pool_block=DEFAULT_POOL_BLOCK):
         """Initialize a new RestSession object.
 
         Args:
@@ -174,9 +223,27 @@ class RestSession(object):
             uses_csrf_token(bool): Controls whether we send the CSRF token to ISE's ERS APIs.
             get_csrf_token(callable):  The Identity Services Engine method to get a new
                 CSRF token.
+            connection_pool_size(int): Number of keep-alive connections kept
+                per host, and shared by the requests of this session.
+            transport(basestring): 'h1' to send the requests over HTTP/1.1
+                with requests, or 'h2' to multiplex them over HTTP/2 with the
+                optional httpx package.
+            thread_local_sessions(bool): Give every thread its own
+                `requests` session and connection pool, sharing the headers
+                and cookies of this session. Threads then never wait on each
+                other for a connection, at the cost of one pool per thread.
+            max_retries(int): Number of times the idempotent requests are
+                retried, with backoff, after a connection error or a 500,
+                502, 503 or 504 response. Applies to the 'h1' transport.
+            pool_block(bool): Make a request wait for a pooled connection
+                when all of them are in use, instead of opening an extra one
+                that is closed after the response. Keeps bursts of concurrent
+                requests on warm connections. Applies to the 'h1' transport.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If the transport is not 'h1' or 'h2'.
+            ImportError: If the 'h2' transport is used without httpx.
 
         """
         check_type(access_token, basestring, may_be_none=False)
@@ -187,6 +254,14 @@ class RestSession(object):
         check_type(version, basestring, may_be_none=False)
         check_type(debug, (bool), may_be_none=False)
         check_type(uses_csrf_token, (bool), may_be_none=False)
+        check_type(connection_pool_size, int, may_be_none=False)
+        check_type(transport, basestring, may_be_none=False)
+        check_type(thread_local_sessions, bool, may_be_none=False)
+        check_type(max_retries, int, may_be_none=False)
+        check_type(pool_block, bool, may_be_none=False)
+        if transport not in ('h1', 'h2'):
+            raise ValueError("transport must be 'h1' or 'h2', "
+                             "received: {}".format(transport))
 
         super(RestSession, self).__init__()
 
@@ -202,6 +277,13 @@ class RestSession(object):
         self._verify = verify
         self._version = version
         self._debug = debug
+        self._connection_pool_size = connection_pool_size
+        self._transport = transport
+        self._max_retries = max_retries
+        self._pool_block = pool_block
+        self._local = threading.local() if thread_local_sessions else None
+        # Only to close them, each is kept alive by its thread
+        self._local_sessions = weakref.WeakSet()
 
         if self._debug:
             logger.setLevel(logging.DEBUG)
@@ -214,12 +296,65 @@ class RestSession(object):
 
         # Initialize a new `requests` session
         self._req_session = requests.session()
+        self._mount_adapter(self._req_session)
 
         # Update the headers of the `requests` session
         self.update_headers({'authorization': 'Basic ' + access_token})
         if headers and isinstance(headers, dict):
             self.update_headers(headers)
 
+    def _mount_adapter(self, req_session):
+        # Keep the TCP+TLS connections open and reuse them across requests
+        if self._transport == 'h2':
+            adapter = HTTP2Adapter(max_connections=self._connection_pool_size)
+        else:
+            max_retries = 0
+            if self._max_retries:
+                # Only the idempotent methods are retried. The last response
+                # is returned rather than raised, and goes through the usual
+                # response code checks
+                max_retries = Retry(total=self._max_retries,
+                                    backoff_factor=0.2,
+                                    status_forcelist=(500, 502, 503, 504),
+                                    raise_on_status=False)
+            adapter = HTTPAdapter(
+                pool_connections=self._connection_pool_size,
+                pool_maxsize=self._connection_pool_size,
+                max_retries=max_retries,
+                pool_block=self._pool_block,
+            )
+        req_session.mount('https://', adapter)
+        req_session.mount('http://', adapter)
+
+    def _get_req_session(self):
+        if self._local is None:
+            return self._req_session
+        req_session = getattr(self._local, 'req_session', None)
+        if req_session is None:
+            req_session = requests.session()
+            # Shared objects, so token and cookie updates reach every thread
+            req_session.headers = self._req_session.headers
+            req_session.cookies = self._req_session.cookies
+            self._mount_adapter(req_session)
+            self._local.req_session = req_session
+            self._local_sessions.add(req_session)
+        return req_session
+
+    def close(self):
+        """Close the pooled keep-alive connections of this session.
+
+        The session stays usable, the next request opens a new connection.
+        """
+        for req_session in list(self._local_sessions):
+            req_session.close()
+        self._req_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @property
     def version(self):
         """The API version of Identity Services Engine."""
@@ -230,6 +365,31 @@ class RestSession(object):
         """The verify (TLS Certificate) for the API endpoints."""
         return self._verify
 
+    @property
+    def connection_pool_size(self):
+        """The number of keep-alive connections kept per host."""
+        return self._connection_pool_size
+
+    @property
+    def transport(self):
+        """The HTTP version of the requests, 'h1' or 'h2'."""
+        return self._transport
+
+    @property
+    def max_retries(self):
+        """The number of times an idempotent request is retried."""
+        return self._max_retries
+
+    @property
+    def pool_block(self):
+        """Whether a request waits for a pooled connection when all are in use."""
+        return self._pool_block
+
+    @property
+    def thread_local_sessions(self):
+        """Whether every thread uses its own `requests` session."""
+        return self._local is not None
+
     @verify.setter
     def verify(self, value):
         """The verify (TLS Certificate) for the API endpoints."""
@@ -282,6 +442,18 @@ class RestSession(object):
         """The HTTP headers used for requests in this session."""
         return self._req_session.headers.copy()
 
+    def get_header(self, name, default=None):
+        """The value of one HTTP header used for requests in this session.
+
+        Unlike `headers`, it does not copy the session headers.
+
+        Args:
+            name(basestring): The header name, case-insensitive.
+            default: Returned when the header is not set.
+
+        """
+        return self._req_session.headers.get(name, default)
+
     @property
     def debug(self):
         """If log information about this REST session of the Identity Services Engine API's request and response process is shown."""
@@ -494,14 +666,14 @@ class RestSession(object):
                 logger.debug(pprint_request_info(abs_url, method,
                                                  _headers=self.headers,
                                                  **kwargs))
-                response = self._req_session.request(method, abs_url, **kwargs)
+                response = self._get_req_session().request(method, abs_url, **kwargs)
             except socket.error:
                 # A socket error
                 self.reset_csrf_token()
                 try:
                     c += 1
                     logger.debug('Attempt {}'.format(c))
-                    response = self._req_session.request(method, abs_url,
+                    response = self._get_req_session().request(method, abs_url,
                                                          **kwargs)
                 except Exception as e:
                     raise ciscoisesdkException('Socket error {}'.format(e))
@@ -512,7 +684,7 @@ class RestSession(object):
                     try:
                         c += 1
                         logger.debug('Attempt {}'.format(c))
-                        response = self._req_session.request(method, abs_url,
+                        response = self._get_req_session().request(method, abs_url,
                                                              **kwargs)
                     except Exception as e:
                         raise ciscoisesdkException('PipeError {}'.format(e))
@@ -549,7 +721,9 @@ class RestSession(object):
                     logger.debug(pprint_response_info(response))
                     raise
             else:
-                logger.debug(pprint_response_info(response))
+                # Formatting reads the body, which get_items streams instead
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(pprint_response_info(response))
                 return response
 
     def multipart_data(self, fields, create_callback):
@@ -609,6 +783,72 @@ class RestSession(object):
             response = self.request('GET', url, erc, 0, params=params, **kwargs)
             return RestResponse(response)
 
+    def get_items(self, url, items_path, params=None, next_path=None, **kwargs):
+        """Sends a GET request and yields the items of a JSON array.
+
+        When the optional ijson package is installed and the body is large
+        (or of unknown length), the items are parsed while the body is
+        received, so memory stays flat and the first item is available
+        before the whole body arrives. Otherwise the body is parsed at once.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            items_path(list): List of strings. Keys leading to the array in
+                the JSON body, for example ["SearchResult", "resources"].
+            params(dict): The parameters for the HTTP GET request.
+            next_path(list): List of strings. Keys leading to a scalar of the
+                JSON body, for example ["SearchResult", "nextPage", "href"],
+                that is returned once the items are exhausted.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to the requests package.
+
+        Yields:
+            The items of the array, as native Python objects.
+
+        Returns:
+            The value found at next_path, or None if it is missing or
+            next_path is not given. It is the value of the StopIteration, and
+            of a `yield from` expression.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Identity Services Engine API endpoint.
+
+        """
+        check_type(url, basestring, may_be_none=False)
+        check_type(items_path, list, may_be_none=False)
+        check_type(params, dict)
+        check_type(next_path, list)
+
+        # Expected response code
+        erc = kwargs.pop('erc', EXPECTED_RESPONSE_CODE['GET'])
+        kwargs['stream'] = True
+
+        with self.request('GET', url, erc, 0, params=params, **kwargs) as response:
+            content_length = int(response.headers.get('Content-Length') or 0)
+            # The debug log of request() already reads the body
+            if ijson is not None and not logger.isEnabledFor(logging.DEBUG) \
+                    and (not content_length or content_length >= STREAM_MIN_CONTENT_LENGTH):
+                response.raw.decode_content = True
+                item_prefix = '.'.join(list(items_path) + ['item'])
+                next_prefix = '.'.join(next_path) if next_path else None
+                next_value = None
+                events = ijson.parse(response.raw, use_float=True)
+                for prefix, event, value in events:
+                    if prefix == item_prefix:
+                        if event in ('start_map', 'start_array'):
+                            yield _build_json_value(event, value, events)
+                        else:
+                            yield value
+                    elif prefix == next_prefix and event not in _CONTAINER_EVENTS:
+                        next_value = value
+                return next_value
+            else:
+                body = extract_and_parse_json(response)
+                yield from _get_json_path(body, items_path) or []
+                return _get_json_path(body, next_path) if next_path else None
+
     def post(self, url, params=None, json=None, data=None, **kwargs):
         """Sends a POST request.
 
@@ -43,6 +43,11 @@ from datetime import datetime, timedelta, tzinfo
 import xmltodict
 from past.builtins import basestring
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 EncodableFile = namedtuple('EncodableFile',
                            ['file_name', 'file_object', 'content_type'])
 
@@ -173,6 +178,43 @@ def check_type(o, acceptable_types, may_be_none=True):
         raise TypeError(error_message)
 
 
+def check_types(values, type_checks):
+    """Check several objects at once with `check_type`.
+
+    The common case, an instance of an acceptable type or an allowed None, is
+    resolved inline; anything else goes through `check_type`, which also
+    accepts single-item lists and builds the error message.
+
+    Args:
+        values(tuple): The objects to be inspected.
+        type_checks(tuple): One (acceptable_types, may_be_none) pair per
+            object, where acceptable_types is a tuple of types.
+
+    Raises:
+        TypeError: If any of the objects fails its check.
+
+    """
+    for o, (acceptable_types, may_be_none) in zip(values, type_checks):
+        if isinstance(o, acceptable_types) or (o is None and may_be_none):
+            continue
+        check_type(o, acceptable_types, may_be_none=may_be_none)
+
+
+def skip_check_type(o, acceptable_types, may_be_none=True):
+    """Stand-in for `check_type` that accepts any object.
+
+    API wrapper modules bind `check_type` to this function when the
+    IDENTITY_SERVICES_ENGINE_SKIP_CHECKS environment variable is set, for
+    callers that cannot run Python with the -O flag.
+    """
+    pass
+
+
+def skip_check_types(values, type_checks):
+    """Stand-in for `check_types` that accepts any objects."""
+    pass
+
+
 def dict_from_items_with_values(*dictionaries, **items):
     """Creates a dict with the inputted items; pruning any that are `None`.
 
@@ -232,6 +274,24 @@ def extract_and_parse_json(response):
         return None
 
 
+def json_dumps(obj):
+    """Serialize obj to a JSON encoded request body.
+
+    Uses the optional orjson package when it is installed, the standard
+    library json module otherwise.
+
+    Args:
+        obj: The JSON serializable Python object.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
 def extract_and_parse_xml(response):
     result = None
     if response.text:
@@ -272,9 +332,13 @@ def json_dict(json_data):
 
 def apply_path_params(URL, path_params):
     if isinstance(URL, str) and isinstance(path_params, dict):
-        for k in path_params:
-            URL = URL.replace('${' + k + '}', str(path_params[k]))
-            URL = URL.replace('{' + k + '}', str(path_params[k]))
+        # None of the generated URLs use the ${name} form, skip it unless present
+        dollar_form = '$' in URL
+        for k, v in path_params.items():
+            v = str(v)
+            if dollar_form:
+                URL = URL.replace('${' + k + '}', v)
+            URL = URL.replace('{' + k + '}', v)
         return URL
     else:
         raise TypeError(
@@ -291,7 +355,7 @@ def pprint_request_info(url, method, _headers, **kwargs):
         "\n\tMethod: {}"
         "\n\tHeaders: \n{}"
     )
-    _headers.update(kwargs.get('headers', {}))
+    _headers.update(kwargs.get('headers') or {})
     _headers = '\n'.join(['\t\t{}: {}'.format(a, b)
                          for a, b in _headers.items()])
     debug_print = debug_print.format(url, method, _headers)
@@ -369,10 +433,8 @@ def dict_of_str(json_dict):
     Returns:
         A Python dictionary with the contents of the JSON object as strings.
     """
-    result = {}
-    for key, value in json_dict.items():
-        result[key] = '{}'.format(value)
-    return result
+    return {key: value if type(value) is str else '{}'.format(value)
+            for key, value in json_dict.items()}
 
 
 def walk_through_dict(resp, access_next_list, omit_first_single_key=False):
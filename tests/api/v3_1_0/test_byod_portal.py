@@ -21,9 +21,19 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import asyncio
+import base64
+import gzip
+import io
+import json
+import sys
+import types
+
 import pytest
 from fastjsonschema.exceptions import JsonSchemaException
-from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.exceptions import BatchError, MalformedRequest
+from ciscoisesdk.api.v3_1_0.byod_portal import ByodPortal
+from ciscoisesdk.api.v3_1_0.byod_portal_async import AsyncByodPortal
 from ciscoisesdk.exceptions import ciscoisesdkException
 from tests.environment import IDENTITY_SERVICES_ENGINE_VERSION
 
@@ -376,3 +386,504 @@ def test_get_version_default(api, validator):
     except Exception as original_e:
         with pytest.raises((JsonSchemaException, MalformedRequest, TypeError)):
             raise original_e
+
+
+async def gather_byod_portal_by_id_async(api):
+    byod_portal_async = AsyncByodPortal(api.byod_portal)
+    return await asyncio.gather(
+        byod_portal_async.get_byod_portal_by_id(id='string'),
+        byod_portal_async.get_version(),
+    )
+
+
+def get_byod_portal_by_id_async(api):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(gather_byod_portal_by_id_async(api))
+    finally:
+        loop.close()
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_async(api, validator):
+    portal_result, version_result = get_byod_portal_by_id_async(api)
+    assert is_valid_get_byod_portal_by_id(validator, portal_result)
+    assert is_valid_get_version(validator, version_result)
+
+
+def get_byod_portal_prefetch(api):
+    return list(api.byod_portal.get_byod_portal_prefetch(
+        page=1,
+        size=20,
+        workers=2
+    ))
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_prefetch(api, validator):
+    endpoint_results = get_byod_portal_prefetch(api)
+    assert endpoint_results
+    for endpoint_result in endpoint_results:
+        assert is_valid_get_byod_portal(validator, endpoint_result)
+
+
+async def collect_byod_portal_generator_async(api):
+    byod_portal_async = AsyncByodPortal(api.byod_portal)
+    return [response async for response in byod_portal_async.get_byod_portal_generator(
+        page=1,
+        size=20,
+        window=2
+    )]
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_generator_async(api, validator):
+    loop = asyncio.new_event_loop()
+    try:
+        endpoint_results = loop.run_until_complete(collect_byod_portal_generator_async(api))
+    finally:
+        loop.close()
+    assert endpoint_results
+    for endpoint_result in endpoint_results:
+        assert is_valid_get_byod_portal(validator, endpoint_result)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_cached(api, validator, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             cache_enabled=True)
+    first_result = byod_portal.get_byod_portal_by_id(id='string')
+    assert is_valid_get_byod_portal_by_id(validator, first_result)
+
+    def session_get(*args, **kwargs):
+        raise AssertionError('the cached response was not used')
+
+    monkeypatch.setattr(api.session_ers, 'get', session_get)
+    cached_result = byod_portal.get_byod_portal_by_id(id='string')
+    assert cached_result is not first_result
+    assert cached_result.response == first_result.response
+    assert is_valid_get_byod_portal_by_id(validator, cached_result)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_not_modified(api, validator, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             conditional_requests=True)
+    status_codes = []
+    get = api.session_ers.get
+
+    def session_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        status_codes.append(response.status_code)
+        return response
+
+    monkeypatch.setattr(api.session_ers, 'get', session_get)
+    first_result = byod_portal.get_byod_portal_by_id(id='string')
+    assert first_result.status_code == 200
+    assert is_valid_get_byod_portal_by_id(validator, first_result)
+
+    second_result = byod_portal.get_byod_portal_by_id(id='string')
+    assert status_codes == [200, 304]
+    assert second_result is not first_result
+    assert second_result.response == first_result.response
+    assert is_valid_get_byod_portal_by_id(validator, second_result)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_not_modified_per_headers(api, validator, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             conditional_requests=True)
+    sent = []
+    get = api.session_ers.get
+
+    def session_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        sent.append((kwargs['headers'].get('If-None-Match'), response.status_code))
+        return response
+
+    monkeypatch.setattr(api.session_ers, 'get', session_get)
+    byod_portal.get_byod_portal_by_id(id='string')
+    result = byod_portal.get_byod_portal_by_id(
+        id='string', headers={'Accept': 'application/xml'})
+    assert sent == [(None, 200), (None, 200)]
+    assert is_valid_get_byod_portal_by_id(validator, result)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_caller_if_none_match(api, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             conditional_requests=True)
+    object_factory_calls = []
+
+    def object_factory(model, response):
+        object_factory_calls.append(model)
+        return api.object_factory(model, response)
+
+    byod_portal._object_factory = object_factory
+    result = byod_portal.get_byod_portal_by_id(
+        id='string', headers={'If-None-Match': '"string"'})
+    assert result.status_code == 304
+    assert object_factory_calls == []
+
+
+@pytest.mark.byod_portal
+def test_get_version_not_modified(api, validator, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             conditional_requests=True)
+    status_codes = []
+    get = api.session_ers.get
+
+    def session_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        status_codes.append(response.status_code)
+        return response
+
+    monkeypatch.setattr(api.session_ers, 'get', session_get)
+    first_result = byod_portal.get_version()
+    assert first_result.status_code == 200
+    assert is_valid_get_version(validator, first_result)
+
+    second_result = byod_portal.get_version()
+    assert status_codes == [200, 304]
+    assert second_result is not first_result
+    assert second_result.response == first_result.response
+    assert is_valid_get_version(validator, second_result)
+
+
+def create_byod_portal_many(api):
+    endpoint_result = api.byod_portal.create_byod_portal_many(
+        items=[
+            {'active_validation': False, 'name': 'string', 'portal_type': 'BYOD'},
+            {'active_validation': False, 'name': 'string', 'description': 'string'},
+        ],
+        max_concurrent=2
+    )
+    return endpoint_result
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_many(api, validator):
+    endpoint_results = create_byod_portal_many(api)
+    assert len(endpoint_results) == 2
+    for endpoint_result in endpoint_results:
+        assert is_valid_create_byod_portal(validator, endpoint_result)
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_many_partial_failure(api, validator):
+    with pytest.raises(BatchError) as excinfo:
+        api.byod_portal.create_byod_portal_many(
+            items=[
+                {'active_validation': False, 'name': 'string'},
+                {'active_validation': False, 'name': 'string', 'headers': 'string'},
+            ]
+        )
+    assert [index for index, error in excinfo.value.errors] == [1]
+    assert isinstance(excinfo.value.errors[0][1], TypeError)
+    assert is_valid_create_byod_portal(validator, excinfo.value.results[0])
+    assert excinfo.value.results[1] is None
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_items(api):
+    items = list(api.byod_portal.get_byod_portal_items(size=20))
+    assert items
+    for item in items:
+        assert item.id == 'string'
+        assert item.link.href == 'string'
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_items_exact_multiple_of_size(api, monkeypatch):
+    pages = []
+
+    def get_items(url, items_path, params=None, next_path=None, **kwargs):
+        pages.append(params['page'])
+        yield {'id': 'string'}
+        yield {'id': 'string'}
+        return 'next' if params['page'] < 2 else None
+
+    monkeypatch.setattr(api.session_ers, 'get_items', get_items)
+    items = list(api.byod_portal.get_byod_portal_items(size=2))
+    assert len(items) == 4
+    assert pages == [1, 2]
+
+
+@pytest.mark.byod_portal
+def test_byod_portal_slots(api):
+    assert not hasattr(api.byod_portal, '__dict__')
+    with pytest.raises(AttributeError):
+        api.byod_portal.unknown_attribute = None
+
+
+@pytest.mark.byod_portal
+def test_byod_portal_aliases():
+    assert ByodPortal.get_by_id is ByodPortal.get_byod_portal_by_id
+    assert ByodPortal.update_by_id is ByodPortal.update_byod_portal_by_id
+    assert ByodPortal.delete_by_id is ByodPortal.delete_byod_portal_by_id
+    assert ByodPortal.get_all is ByodPortal.get_byod_portal
+    assert ByodPortal.get_all_generator is ByodPortal.get_byod_portal_generator
+    assert ByodPortal.create is ByodPortal.create_byod_portal
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_invalid_enum(api):
+    with pytest.raises(MalformedRequest):
+        api.byod_portal.create_byod_portal(
+            active_validation=True,
+            name='string',
+            portal_type='UNKNOWN'
+        )
+    with pytest.raises(MalformedRequest):
+        api.byod_portal.create_byod_portal(
+            active_validation=True,
+            name='string',
+            portal_type='BYOD',
+            settings={'portalSettings': {'allowedInterfaces': ['eth0', 'eth9']}}
+        )
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_compressed(api, validator, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator,
+                             compress_requests=True)
+    session_post = api.session_ers.post
+    sent = {}
+
+    def post(*args, **kwargs):
+        sent.update(kwargs)
+        return session_post(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ers, 'post', post)
+    description = 'string' * 1000
+    result = byod_portal.create_byod_portal(
+        active_validation=False,
+        name='string',
+        description=description
+    )
+    assert is_valid_create_byod_portal(validator, result)
+    assert sent['headers']['Content-Encoding'] == 'gzip'
+    body = json.loads(gzip.decompress(sent['data']))
+    assert body['BYODPortal']['description'] == description
+
+
+@pytest.mark.byod_portal
+def test_get_all_byod_portal_columnar(api):
+    columns = api.byod_portal.get_all_byod_portal_columnar(size=20)
+    assert columns['id']
+    assert all(len(values) == len(columns['id']) for values in columns.values())
+    assert columns['link_href'][0] == 'string'
+
+
+@pytest.mark.byod_portal
+def test_get_all_byod_portal_columnar_dataframe(api, monkeypatch):
+    # The function imports pandas itself, so a stub module stands in for it
+    pandas = types.ModuleType('pandas')
+    pandas.DataFrame = lambda columns: ('DataFrame', columns)
+    monkeypatch.setitem(sys.modules, 'pandas', pandas)
+    name, columns = api.byod_portal.get_all_byod_portal_columnar(size=20, as_dataframe=True)
+    assert name == 'DataFrame'
+    assert columns['link_href'][0] == 'string'
+
+
+@pytest.mark.byod_portal
+def test_get_all_byod_portal_columnar_dataframe_without_pandas(api, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pandas', None)
+    with pytest.raises(ImportError, match='pip install pandas'):
+        api.byod_portal.get_all_byod_portal_columnar(size=20, as_dataframe=True)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_invalid_header(api):
+    with pytest.raises(TypeError):
+        api.byod_portal.get_byod_portal_by_id(id='string', headers={'Accept': 1})
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_xml(api, monkeypatch):
+    session_post = api.session_ers.post
+    sent = {}
+
+    def post(*args, **kwargs):
+        sent.update(kwargs)
+        return session_post(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ers, 'post', post)
+    payload = '<BYODPortal><name>string</name></BYODPortal>'
+    api.byod_portal.create_byod_portal(
+        payload=payload,
+        headers={'Content-Type': 'application/xml;charset=utf-8'}
+    )
+    assert sent['data'] == payload
+
+
+@pytest.mark.byod_portal
+def test_byod_portal_xml_lower_case_header(api, monkeypatch):
+    sent = []
+
+    def send(url, **kwargs):
+        sent.append(kwargs['data'])
+        raise RuntimeError()
+
+    monkeypatch.setattr(api.session_ers, 'post', send)
+    monkeypatch.setattr(api.session_ers, 'put', send)
+    payload = '<BYODPortal><name>string</name></BYODPortal>'
+    with pytest.raises(RuntimeError):
+        api.byod_portal.create_byod_portal(
+            payload=payload, headers={'content-type': 'application/xml'})
+    with pytest.raises(RuntimeError):
+        api.byod_portal.update_byod_portal_by_id(
+            id='string', payload=payload, headers={'content-type': 'application/xml'})
+    assert sent == [payload, payload]
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_custom_headers(api, validator, monkeypatch):
+    session_get = api.session_ers.get
+    sent = {}
+
+    def get(*args, **kwargs):
+        sent.update(kwargs)
+        return session_get(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ers, 'get', get)
+    result = api.byod_portal.get_byod_portal_by_id(id='string',
+                                                   headers={'ERS-Media-Type': 'identity.byodportal.1.0'})
+    assert is_valid_get_byod_portal_by_id(validator, result)
+    assert sent['headers'] == {'ERS-Media-Type': 'identity.byodportal.1.0'}
+    assert 'ERS-Media-Type' not in api.session_ers.headers
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_quoted(api, monkeypatch):
+    sent = []
+
+    def get(url, **kwargs):
+        sent.append(url)
+        raise RuntimeError()
+
+    monkeypatch.setattr(api.session_ers, 'get', get)
+    with pytest.raises(RuntimeError):
+        api.byod_portal.get_byod_portal_by_id(id='a/b?c')
+    assert sent == ['/ers/config/byodportal/a%2Fb%3Fc']
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_encoded_twice(api, monkeypatch):
+    sent = []
+
+    def get(url, **kwargs):
+        sent.append(url)
+        raise RuntimeError()
+
+    monkeypatch.setattr(api.session_ers, 'get', get)
+    with pytest.raises(RuntimeError):
+        api.byod_portal.get_byod_portal_by_id(id='a%2Fb')
+    assert sent == ['/ers/config/byodportal/a%252Fb']
+
+
+@pytest.mark.byod_portal
+def test_update_byod_portal_by_id_custom_headers(api, validator, monkeypatch):
+    session_put = api.session_ers.put
+    sent = {}
+
+    def put(*args, **kwargs):
+        sent.update(kwargs)
+        return session_put(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ers, 'put', put)
+    result = api.byod_portal.update_byod_portal_by_id(id='string', name='portal',
+                                                      headers={'ERS-Media-Type': 'identity.byodportal.1.0'})
+    assert is_valid_update_byod_portal_by_id(validator, result)
+    assert sent['headers'] == {'ERS-Media-Type': 'identity.byodportal.1.0'}
+
+
+@pytest.mark.byod_portal
+def test_create_byod_portal_validates_before_sending(api, monkeypatch):
+    byod_portal = ByodPortal(api.session_ers, api.object_factory, api.validator)
+    validate_create = byod_portal._validate_create
+    validated = []
+
+    def validate(payload):
+        validated.append(payload)
+        return validate_create(payload)
+
+    byod_portal._validate_create = validate
+    for name in ('template', 'template', 'other'):
+        byod_portal.create_byod_portal(name=name, portal_type='BYOD')
+    assert len(validated) == 3
+
+    sent = []
+    monkeypatch.setattr(api.session_ers, 'post', lambda *args, **kwargs: sent.append(kwargs))
+    with pytest.raises(MalformedRequest):
+        byod_portal.create_byod_portal(name='template', portal_type='UNKNOWN')
+    assert sent == []
+
+
+@pytest.mark.byod_portal
+def test_delete_byod_portal_by_id_many(api, validator):
+    endpoint_results = api.byod_portal.delete_byod_portal_by_id_many(
+        ['string', 'string'], max_concurrent=2)
+    assert len(endpoint_results) == 2
+    for endpoint_result in endpoint_results:
+        assert is_valid_delete_byod_portal_by_id(validator, endpoint_result)
+    with pytest.raises(TypeError):
+        api.byod_portal.delete_byod_portal_by_id_many(['string', 1])
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_many(api, validator):
+    results = api.byod_portal.get_byod_portal_by_id_many(['string', 'string'])
+    assert len(results) == 2
+    for result in results:
+        assert is_valid_get_byod_portal_by_id(validator, result)
+    with pytest.raises(TypeError):
+        api.byod_portal.get_byod_portal_by_id_many(['string', 1])
+
+
+async def get_byod_portal_by_id_many_async(api, ids):
+    byod_portal_async = AsyncByodPortal(api.byod_portal)
+    return await byod_portal_async.get_byod_portal_by_id_many(ids, max_concurrent=2)
+
+
+@pytest.mark.byod_portal
+def test_get_byod_portal_by_id_many_async(api, validator):
+    loop = asyncio.new_event_loop()
+    try:
+        endpoint_results = loop.run_until_complete(
+            get_byod_portal_by_id_many_async(api, ['string'] * 3))
+        assert len(endpoint_results) == 3
+        for endpoint_result in endpoint_results:
+            assert is_valid_get_byod_portal_by_id(validator, endpoint_result)
+        with pytest.raises(BatchError) as excinfo:
+            loop.run_until_complete(
+                get_byod_portal_by_id_many_async(api, ['string', 1]))
+        assert [index for index, _ in excinfo.value.errors] == [1]
+        assert excinfo.value.results[0] is not None
+    finally:
+        loop.close()
+
+
+@pytest.mark.byod_portal
+def test_update_byod_portal_by_id_binary_customizations(api, monkeypatch):
+    session_put = api.session_ers.put
+    sent = {}
+
+    def put(*args, **kwargs):
+        sent.update(kwargs)
+        return session_put(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ers, 'put', put)
+    image = bytes(range(256)) * 20
+    customizations = {'portalTheme': {'id': 'string', 'themeData': b'body {}'},
+                      'globalCustomizations': {'bannerImage': {'data': io.BytesIO(image)}}}
+    api.byod_portal.update_byod_portal_by_id(
+        id='string',
+        name='string',
+        portal_type='BYOD',
+        customizations=customizations
+    )
+    body = json.loads(sent['data'])['BYODPortal']['customizations']
+    assert base64.b64decode(body['portalTheme']['themeData']) == b'body {}'
+    assert base64.b64decode(body['globalCustomizations']['bannerImage']['data']) == image
+    assert customizations['portalTheme']['themeData'] == b'body {}'
@@ -21,9 +21,14 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import asyncio
+import json
+
 import pytest
 from fastjsonschema.exceptions import JsonSchemaException
-from ciscoisesdk.exceptions import MalformedRequest
+from ciscoisesdk.exceptions import BatchError, MalformedRequest
+from ciscoisesdk.api.v3_1_0.network_access_conditions import NetworkAccessConditions
+from ciscoisesdk.api.v3_1_0.network_access_conditions_async import AsyncNetworkAccessConditions
 from ciscoisesdk.exceptions import ciscoisesdkException
 from tests.environment import IDENTITY_SERVICES_ENGINE_VERSION
 
@@ -703,3 +708,349 @@ def test_delete_network_access_condition_by_id_default(api, validator):
     except Exception as original_e:
         with pytest.raises((JsonSchemaException, MalformedRequest, TypeError)):
             raise original_e
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_conditions_context_manager(api, validator):
+    with api.network_access_conditions as network_access_conditions:
+        assert network_access_conditions is api.network_access_conditions
+        assert is_valid_get_network_access_conditions(
+            validator,
+            network_access_conditions.get_network_access_conditions()
+        )
+    assert is_valid_get_network_access_conditions(
+        validator,
+        get_network_access_conditions(api)
+    )
+
+
+async def gather_network_access_conditions_async(api):
+    network_access_conditions_async = AsyncNetworkAccessConditions(api.network_access_conditions)
+    return await asyncio.gather(
+        network_access_conditions_async.get_network_access_conditions(),
+        network_access_conditions_async.get_network_access_conditions_for_authentication_rules(),
+        network_access_conditions_async.get_network_access_conditions_for_authorization_rules(),
+    )
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_async(api, validator):
+    loop = asyncio.new_event_loop()
+    try:
+        conditions, authentication, authorization = loop.run_until_complete(
+            gather_network_access_conditions_async(api))
+    finally:
+        loop.close()
+    assert is_valid_get_network_access_conditions(validator, conditions)
+    assert is_valid_get_network_access_conditions_for_authentication_rules(validator, authentication)
+    assert is_valid_get_network_access_conditions_for_authorization_rules(validator, authorization)
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_for_all_scopes(api, validator):
+    endpoint_result = api.network_access_conditions.get_network_access_conditions_for_all_scopes()
+    assert is_valid_get_network_access_conditions(validator, endpoint_result['conditions'])
+    assert is_valid_get_network_access_conditions_for_authentication_rules(
+        validator, endpoint_result['authentication_rules'])
+    assert is_valid_get_network_access_conditions_for_authorization_rules(
+        validator, endpoint_result['authorization_rules'])
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_not_modified(api, validator, monkeypatch):
+    network_access_conditions = NetworkAccessConditions(
+        api.session_ui, api.object_factory, api.validator,
+        conditional_requests=True)
+    status_codes = []
+    get = api.session_ui.get
+
+    def session_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        status_codes.append(response.status_code)
+        return response
+
+    monkeypatch.setattr(api.session_ui, 'get', session_get)
+    first_result = network_access_conditions.get_network_access_conditions()
+    assert is_valid_get_network_access_conditions(validator, first_result)
+
+    second_result = network_access_conditions.get_network_access_conditions()
+    assert status_codes == [200, 304]
+    assert second_result is not first_result
+    assert second_result.response == first_result.response
+    assert is_valid_get_network_access_conditions(validator, second_result)
+
+    network_access_conditions.create_network_access_condition(active_validation=False)
+    network_access_conditions.get_network_access_conditions()
+    assert status_codes == [200, 304, 200]
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_not_modified_per_headers(api, validator, monkeypatch):
+    network_access_conditions = NetworkAccessConditions(
+        api.session_ui, api.object_factory, api.validator,
+        conditional_requests=True)
+    sent = []
+    get = api.session_ui.get
+
+    def session_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        sent.append((kwargs['headers'].get('Accept'),
+                     kwargs['headers'].get('If-None-Match'),
+                     response.status_code))
+        return response
+
+    monkeypatch.setattr(api.session_ui, 'get', session_get)
+    network_access_conditions.get_network_access_conditions(
+        headers={'Accept': 'application/json'})
+    result = network_access_conditions.get_network_access_conditions(
+        headers={'Accept': 'application/xml'})
+    assert sent == [('application/json', None, 200),
+                    ('application/xml', None, 200)]
+    assert is_valid_get_network_access_conditions(validator, result)
+
+    network_access_conditions.get_network_access_conditions(
+        headers={'Accept': 'application/json'})
+    assert sent[-1] == ('application/json', '"string"', 304)
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_condition_by_name_cached(api, validator, monkeypatch):
+    network_access_conditions = NetworkAccessConditions(
+        api.session_ui, api.object_factory, api.validator,
+        cache_enabled=True)
+    first_result = network_access_conditions.get_network_access_condition_by_name(name='string')
+    assert first_result.status_code == 200
+
+    def session_get(*args, **kwargs):
+        raise AssertionError('the cached response was not used')
+
+    monkeypatch.setattr(api.session_ui, 'get', session_get)
+    cached_result = network_access_conditions.get_network_access_condition_by_name(name='string')
+    assert cached_result is not first_result
+    assert cached_result.response == first_result.response
+
+    monkeypatch.undo()
+    network_access_conditions.update_network_access_condition_by_name(
+        name='string', active_validation=False)
+    monkeypatch.setattr(api.session_ui, 'get', session_get)
+    with pytest.raises(AssertionError):
+        network_access_conditions.get_network_access_condition_by_name(name='string')
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_condition_by_name_quoted(api, monkeypatch):
+    sent = []
+
+    def get(url, **kwargs):
+        sent.append(url)
+        raise RuntimeError()
+
+    monkeypatch.setattr(api.session_ui, 'get', get)
+    with pytest.raises(RuntimeError):
+        api.network_access_conditions.get_network_access_condition_by_name(name='a/b c')
+    assert sent == ['/api/v1/policy/network-access/condition/condition-by-name/a%2Fb%20c']
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_custom_headers(api, monkeypatch):
+    session_get = api.session_ui.get
+    sent = []
+
+    def get(*args, **kwargs):
+        sent.append(kwargs.get('headers'))
+        return session_get(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ui, 'get', get)
+    api.network_access_conditions.get_network_access_conditions()
+    api.network_access_conditions.get_network_access_conditions(headers={'X-Request-ID': 'abc'})
+    assert sent == [None, {'X-Request-ID': 'abc'}]
+
+
+@pytest.mark.network_access_conditions
+def test_create_network_access_condition_body(api, monkeypatch):
+    session_post = api.session_ui.post
+    sent = {}
+
+    def post(*args, **kwargs):
+        sent.update(kwargs)
+        return session_post(*args, **kwargs)
+
+    monkeypatch.setattr(api.session_ui, 'post', post)
+    api.network_access_conditions.create_network_access_condition(
+        active_validation=False, name='condition', is_negate=False,
+        week_days=['Monday'], payload={'description': None})
+    assert 'json' not in sent
+    assert json.loads(sent['data']) == {'name': 'condition', 'isNegate': False,
+                                        'weekDays': ['Monday']}
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_items(api):
+    items = list(api.network_access_conditions.get_network_access_conditions_items())
+    assert items
+    for item in items:
+        assert item.name == 'string'
+        assert item.link.href == 'string'
+
+
+@pytest.mark.network_access_conditions
+def test_create_network_access_condition_many(api):
+    endpoint_results = api.network_access_conditions.create_network_access_condition_many(
+        items=[
+            {'active_validation': False, 'name': 'first'},
+            {'active_validation': False, 'name': 'second', 'is_negate': True},
+        ],
+        max_concurrent=2
+    )
+    assert len(endpoint_results) == 2
+    for endpoint_result in endpoint_results:
+        assert endpoint_result.status_code == 200
+
+
+@pytest.mark.network_access_conditions
+def test_create_network_access_condition_many_partial_failure(api):
+    with pytest.raises(BatchError) as excinfo:
+        api.network_access_conditions.create_network_access_condition_many(
+            items=[
+                {'active_validation': False, 'name': 'first'},
+                {'active_validation': False, 'name': 'second', 'headers': 'string'},
+            ]
+        )
+    assert [index for index, error in excinfo.value.errors] == [1]
+    assert isinstance(excinfo.value.errors[0][1], TypeError)
+    assert excinfo.value.results[0].status_code == 200
+    assert excinfo.value.results[1] is None
+
+
+@pytest.mark.network_access_conditions
+def test_update_network_access_condition_by_id_many(api):
+    endpoint_results = api.network_access_conditions.update_network_access_condition_by_id_many(
+        items=[
+            {'id': 'string', 'is_negate': True},
+            {'id': 'string', 'operator': 'equals'},
+        ],
+        max_concurrent=2
+    )
+    assert len(endpoint_results) == 2
+    for endpoint_result in endpoint_results:
+        assert endpoint_result.status_code == 200
+
+    with pytest.raises(BatchError) as excinfo:
+        api.network_access_conditions.update_network_access_condition_by_id_many(
+            items=[{'id': 'string'}, {'id': 'string', 'operator': 'unknown'}]
+        )
+    assert [index for index, error in excinfo.value.errors] == [1]
+    assert isinstance(excinfo.value.errors[0][1], MalformedRequest)
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_conditions_validators_resolved_on_use(api):
+    models = []
+
+    def request_validator(model):
+        models.append(model)
+        return api.validator(model)
+
+    network_access_conditions = NetworkAccessConditions(
+        api.session_ui, api.object_factory, request_validator)
+    assert models == []
+    network_access_conditions.create_network_access_condition(name='string', active_validation=False)
+    network_access_conditions.update_network_access_condition_by_id(
+        id='string', children=[], active_validation=False)
+    assert models == []
+    for _ in range(2):
+        network_access_conditions.update_network_access_condition_by_id(id='string', children=[])
+    assert models == ['jsd_e405a20316825460a1f37a2f161e7ac5_v3_1_0']
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_condition_xml_lower_case_header(api, monkeypatch):
+    sent = []
+
+    def send(url, **kwargs):
+        sent.append(kwargs['data'])
+        raise RuntimeError()
+
+    monkeypatch.setattr(api.session_ui, 'post', send)
+    monkeypatch.setattr(api.session_ui, 'put', send)
+    payload = '<condition><name>string</name></condition>'
+    headers = {'content-type': 'application/xml'}
+    with pytest.raises(RuntimeError):
+        api.network_access_conditions.create_network_access_condition(payload=payload, headers=headers)
+    with pytest.raises(RuntimeError):
+        api.network_access_conditions.update_network_access_condition_by_name(
+            name='string', payload=payload, headers=headers)
+    with pytest.raises(RuntimeError):
+        api.network_access_conditions.update_network_access_condition_by_id(
+            id='string', payload=payload, headers=headers)
+    assert sent == [payload, payload, payload]
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_conditions_aliases():
+    assert NetworkAccessConditions.get_all is NetworkAccessConditions.get_network_access_conditions
+    assert NetworkAccessConditions.create is NetworkAccessConditions.create_network_access_condition
+    assert NetworkAccessConditions.get_by_name is NetworkAccessConditions.get_network_access_condition_by_name
+    assert NetworkAccessConditions.update_by_name is NetworkAccessConditions.update_network_access_condition_by_name
+    assert NetworkAccessConditions.delete_by_name is NetworkAccessConditions.delete_network_access_condition_by_name
+    assert NetworkAccessConditions.get_by_id is NetworkAccessConditions.get_network_access_condition_by_id
+    assert NetworkAccessConditions.update_by_id is NetworkAccessConditions.update_network_access_condition_by_id
+    assert NetworkAccessConditions.delete_by_id is NetworkAccessConditions.delete_network_access_condition_by_id
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_conditions_slots(api):
+    assert not hasattr(api.network_access_conditions, '__dict__')
+    with pytest.raises(AttributeError):
+        api.network_access_conditions.unknown_attribute = None
+
+
+@pytest.mark.network_access_conditions
+def test_get_network_access_conditions_request_id_type(api):
+    with pytest.raises(TypeError):
+        api.network_access_conditions.get_network_access_conditions(headers={'X-Request-ID': 1})
+    with pytest.raises(TypeError):
+        api.network_access_conditions.get_network_access_conditions(headers='string')
+
+
+async def network_access_conditions_many_async(api, ids, names):
+    network_access_conditions_async = AsyncNetworkAccessConditions(api.network_access_conditions)
+    return await asyncio.gather(
+        network_access_conditions_async.get_network_access_condition_by_id_many(ids, max_concurrent=2),
+        network_access_conditions_async.delete_network_access_condition_by_name_many(names, max_concurrent=2),
+    )
+
+
+@pytest.mark.network_access_conditions
+def test_network_access_conditions_many_async(api):
+    loop = asyncio.new_event_loop()
+    try:
+        got, deleted = loop.run_until_complete(
+            network_access_conditions_many_async(api, ['string'] * 3, ['string'] * 2))
+        assert [result.status_code for result in got] == [200] * 3
+        assert [result.status_code for result in deleted] == [200] * 2
+        with pytest.raises(BatchError) as excinfo:
+            loop.run_until_complete(
+                network_access_conditions_many_async(api, ['string', 1], []))
+        assert [index for index, _ in excinfo.value.errors] == [1]
+        assert excinfo.value.results[0] is not None
+    finally:
+        loop.close()
+
+
+@pytest.mark.network_access_conditions
+def test_update_network_access_condition_by_name_flat_payload(api):
+    network_access_conditions = NetworkAccessConditions(
+        api.session_ui, api.object_factory, api.validator)
+    validated = []
+    network_access_conditions._validate_update_by_name = validated.append
+
+    network_access_conditions.update_network_access_condition_by_name(
+        name='string', is_negate=True, operator='equals', condition_type='LibraryConditionAttributes')
+    assert validated == []
+    network_access_conditions.update_network_access_condition_by_name(name='string', operator='unknown')
+    network_access_conditions.update_network_access_condition_by_name(name='string', week_days=['Monday'])
+    assert validated == [{'name': 'string', 'operator': 'unknown'},
+                         {'name': 'string', 'weekDays': ['Monday']}]
+    with pytest.raises(MalformedRequest):
+        api.network_access_conditions.update_network_access_condition_by_name(name='string', operator='unknown')
@@ -3592,11 +3592,16 @@ class MockServerRequestHandler_v3_1_0(BaseHTTPRequestHandler):
         )
 
     def network_access_conditions_get_network_access_conditions_response(self):
+        if self.headers.get('If-None-Match') == '"string"':
+            self.send_response(requests.codes.not_modified)
+            self.end_headers()
+            return
         # Add response status code.
         self.send_response(requests.codes.ok)
         # Add response headers.
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Accept', 'application/json')
+        self.send_header('ETag', '"string"')
         self.end_headers()
         # Add response content.
         response_content = json.dumps({'response': [{'conditionType': 'string', 'isNegate': True, 'link': {'href': 'string', 'rel': 'string', 'type': 'string'}, 'description': 'string', 'id': 'string', 'name': 'string', 'attributeName': 'string', 'attributeValue': 'string', 'dictionaryName': 'string', 'dictionaryValue': 'string', 'operator': 'string', 'children': [{'conditionType': 'string', 'isNegate': True, 'link': {'href': 'string', 'rel': 'string', 'type': 'string'}}], 'datesRange': {'endDate': 'string', 'startDate': 'string'}, 'datesRangeException': {'endDate': 'string', 'startDate': 'string'}, 'hoursRange': {'endTime': 'string', 'startTime': 'string'}, 'hoursRangeException': {'endTime': 'string', 'startTime': 'string'}, 'weekDays': ['string'], 'weekDaysException': ['string']}], 'version': 'string'})
@@ -5806,11 +5811,16 @@ class MockServerRequestHandler_v3_1_0(BaseHTTPRequestHandler):
         )
 
     def byod_portal_get_byod_portal_by_id_response(self):
+        if self.headers.get('If-None-Match') == '"string"':
+            self.send_response(requests.codes.not_modified)
+            self.end_headers()
+            return
         # Add response status code.
         self.send_response(requests.codes.ok)
         # Add response headers.
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Accept', 'application/json')
+        self.send_header('ETag', '"string"')
         self.end_headers()
         # Add response content.
         response_content = json.dumps({'BYODPortal': {'id': 'string', 'name': 'string', 'description': 'string', 'portalType': 'string', 'portalTestUrl': 'string', 'settings': {'portalSettings': {'httpsPort': 0, 'allowedInterfaces': ['string'], 'certificateGroupTag': 'string', 'endpointIdentityGroup': 'string', 'displayLang': 'string', 'fallbackLanguage': 'string', 'alwaysUsedLanguage': 'string'}, 'byodSettings': {'byodWelcomeSettings': {'enableBYOD': True, 'enableGuestAccess': True, 'requireMDM': True, 'includeAup': True, 'aupDisplay': 'string', 'requireAupAcceptance': True, 'requireScrolling': True}, 'byodRegistrationSettings': {'showDeviceID': True, 'endPointIdentityGroupId': 'string'}, 'byodRegistrationSuccessSettings': {'successRedirect': 'string', 'redirectUrl': 'string'}}, 'supportInfoSettings': {'includeSupportInfoPage': True, 'includeMacAddr': True, 'includeIpAddress': True, 'includeBrowserUserAgent': True, 'includePolicyServer': True, 'includeFailureCode': True, 'emptyFieldDisplay': 'string', 'defaultEmptyFieldValue': 'string'}}, 'customizations': {'portalTheme': {'id': 'string', 'name': 'string', 'themeData': 'string'}, 'portalTweakSettings': {'bannerColor': 'string', 'bannerTextColor': 'string', 'pageBackgroundColor': 'string', 'pageLabelAndTextColor': 'string'}, 'language': {'viewLanguage': 'string'}, 'globalCustomizations': {'mobileLogoImage': {'data': 'string'}, 'desktopLogoImage': {'data': 'string'}, 'bannerImage': {'data': 'string'}, 'backgroundImage': {'data': 'string'}, 'bannerTitle': 'string', 'contactText': 'string', 'footerElement': 'string'}, 'pageCustomizations': {'data': [{'key': 'string', 'value': 'string'}]}}, 'link': {'rel': 'string', 'href': 'string', 'type': 'string'}}})
@@ -5896,11 +5906,16 @@ class MockServerRequestHandler_v3_1_0(BaseHTTPRequestHandler):
         )
 
     def byod_portal_get_version_response(self):
+        if self.headers.get('If-None-Match') == '"string"':
+            self.send_response(requests.codes.not_modified)
+            self.end_headers()
+            return
         # Add response status code.
         self.send_response(requests.codes.ok)
         # Add response headers.
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Accept', 'application/json')
+        self.send_header('ETag', '"string"')
         self.end_headers()
         # Add response content.
         response_content = json.dumps({'VersionInfo': {'currentServerVersion': 'string', 'supportedVersions': 'string', 'link': {'rel': 'string', 'href': 'string', 'type': 'string'}}})
@@ -13127,14 +13142,14 @@ class MockServerRequestHandler_v3_1_0(BaseHTTPRequestHandler):
             self.byod_portal_get_byod_portal_by_id_response()
             return
 
-        if self.matches_BYOD_PORTAL_41a23b580495514394b125800e073c9a():
-            self.byod_portal_get_byod_portal_response()
-            return
-
         if self.matches_BYOD_PORTAL_c5d2d9d8c20b58049cd3326850f2292f():
             self.byod_portal_get_version_response()
             return
 
+        if self.matches_BYOD_PORTAL_41a23b580495514394b125800e073c9a():
+            self.byod_portal_get_byod_portal_response()
+            return
+
         if self.matches_CERTIFICATE_PROFILE_337e7884eb9c548698cdc54e033f35f4():
             self.certificate_profile_get_certificate_profile_by_name_response()
             return
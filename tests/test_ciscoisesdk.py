@@ -23,8 +23,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from collections import OrderedDict
+
 import ciscoisesdk
 import pytest
+import requests
 from ciscoisesdk.api.authentication import Authentication
 from ciscoisesdk.api.custom_caller import CustomCaller
 from ciscoisesdk.api.v3_1_0.aci_bindings import AciBindings as AciBindings_v3_1_0
@@ -390,6 +393,13 @@ from ciscoisesdk.api.v3_1_patch_1.tasks import Tasks as Tasks_v3_1_patch_1
 from ciscoisesdk.api.v3_1_patch_1.telemetry import Telemetry as Telemetry_v3_1_patch_1
 from ciscoisesdk.api.v3_1_patch_1.virtual_network import VirtualNetwork as VirtualNetwork_v3_1_patch_1
 from ciscoisesdk.api.v3_1_patch_1.vn_vlan_mapping import VnVlanMapping as VnVlanMapping_v3_1_patch_1
+from ciscoisesdk.config import (
+    DEFAULT_CACHE_ENABLED,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COMPRESS_REQUESTS,
+    DEFAULT_CONDITIONAL_REQUESTS
+)
+from ciscoisesdk.models.schema_validator import SchemaValidator
 
 from tests.config import (
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
@@ -478,6 +488,33 @@ class TestIdentityServicesEngineSDK:
         assert connection_object.wait_on_rate_limit != \
             DEFAULT_WAIT_ON_RATE_LIMIT
 
+    @pytest.mark.ciscoisesdk
+    def test_default_cache_options(self, api):
+        assert api.cache_enabled == DEFAULT_CACHE_ENABLED
+        assert api.cache_ttl == DEFAULT_CACHE_TTL
+        assert api.conditional_requests == DEFAULT_CONDITIONAL_REQUESTS
+        assert api.compress_requests == DEFAULT_COMPRESS_REQUESTS
+
+    @pytest.mark.ciscoisesdk
+    def test_custom_cache_options(self, base_url):
+        connection_object = ciscoisesdk.IdentityServicesEngineAPI(username=IDENTITY_SERVICES_ENGINE_USERNAME,
+                                                                  password=IDENTITY_SERVICES_ENGINE_PASSWORD,
+                                                                  encoded_auth=IDENTITY_SERVICES_ENGINE_ENCODED_AUTH,
+                                                                  base_url=base_url,
+                                                                  cache_enabled=True,
+                                                                  cache_ttl=5,
+                                                                  conditional_requests=True,
+                                                                  compress_requests=True,
+                                                                  verify=DEFAULT_VERIFY,
+                                                                  version='3.1.0',
+                                                                  uses_api_gateway=True)
+        assert connection_object.cache_enabled
+        assert connection_object.byod_portal._cache.ttl == 5
+        assert connection_object.byod_portal._etags.ttl == 5
+        assert connection_object.byod_portal._compress_requests
+        assert connection_object.network_access_conditions._cache.ttl == 5
+        assert connection_object.network_access_conditions._etags.ttl == 5
+
     @pytest.mark.ciscoisesdk
     def test_api_object_creation(self, api):
         assert isinstance(api.authentication, Authentication)
@@ -848,3 +885,49 @@ class TestIdentityServicesEngineSDK:
             assert isinstance(api.telemetry, Telemetry_v3_1_patch_1)
             assert isinstance(api.virtual_network, VirtualNetwork_v3_1_patch_1)
             assert isinstance(api.vn_vlan_mapping, VnVlanMapping_v3_1_patch_1)
+
+
+@pytest.mark.ciscoisesdk
+def test_schema_validators_are_shared():
+    first = SchemaValidator('3.1.0')
+    second = SchemaValidator('3.1.0')
+    assert first.json_schema_validators is second.json_schema_validators
+    assert first.json_schema_validate('unknown') is second.json_schema_validate('unknown')
+
+
+@pytest.mark.ciscoisesdk
+def test_schema_validators_are_compiled_on_first_use():
+    schema_validator = SchemaValidator('3.1.0')
+    model = 'jsd_f2fcf04554db9ea4cdc3a7024322_v3_1_0'
+    schema_validator.json_schema_validators.pop(model, None)
+    validator = schema_validator.json_schema_validate(model)
+    assert isinstance(validator, schema_validator.json_schema_validator_classes[model])
+    assert schema_validator.json_schema_validators[model] is validator
+    assert schema_validator.json_schema_validate(model) is validator
+    schema_validator.json_schema_validate('unknown')
+    assert 'unknown' not in schema_validator.json_schema_validators
+
+
+@pytest.mark.ciscoisesdk
+def test_identical_schemas_share_a_compiled_validator():
+    schema_validator = SchemaValidator('3.1.0')
+    first = schema_validator.json_schema_validate('jsd_b050fff6a5302ace3e16674c8b19a_v3_1_0')
+    second = schema_validator.json_schema_validate('jsd_a66f9651fca28e85b97cf1b968_v3_1_0')
+    assert first is not second
+    assert first._validator is second._validator
+
+
+@pytest.mark.ciscoisesdk
+def test_schema_validators_have_no_instance_dict():
+    validator = SchemaValidator('3.1.0').json_schema_validate('jsd_f2fcf04554db9ea4cdc3a7024322_v3_1_0')
+    assert not hasattr(validator, '__dict__')
+
+
+@pytest.mark.ciscoisesdk
+def test_extract_and_parse_json_keeps_stdlib_semantics():
+    response = requests.models.Response()
+    response._content = b'{"b": NaN, "a": 18446744073709551616}'
+    parsed = ciscoisesdk.utils.extract_and_parse_json(response)
+    assert isinstance(parsed, OrderedDict)
+    assert list(parsed) == ['b', 'a']
+    assert parsed['a'] == 2 ** 64
@@ -23,11 +23,15 @@ SOFTWARE.
 """
 
 
+import http.server
+import json
 import logging
+import threading
 import warnings
 
 import ciscoisesdk
 import pytest
+import requests
 
 logging.captureWarnings(True)
 
@@ -60,3 +64,171 @@ def test_rate_limit_retry(api):
                 break
     api.wait_on_rate_limit = original_wait_on_rate_limit
     api.reinitialize()
+
+
+def test_connection_pool_size(api):
+    session = api.session_ers
+    assert session.connection_pool_size == api.connection_pool_size
+    adapter = session._req_session.get_adapter(session.base_url)
+    assert adapter._pool_maxsize == api.connection_pool_size
+
+
+def test_transport(api):
+    session = api.session_ers
+    assert session.transport == api.transport
+    with pytest.raises(ValueError):
+        ciscoisesdk.restsession.RestSession(
+            get_access_token=None, access_token='dXNlcjpwYXNz',
+            base_url=session.base_url, version=api.version,
+            uses_csrf_token=False, transport='h3',
+        )
+
+
+@pytest.mark.skipif(ciscoisesdk.http2.httpx is not None, reason='httpx is installed')
+def test_transport_h2_requires_httpx(api):
+    with pytest.raises(ImportError):
+        ciscoisesdk.restsession.RestSession(
+            get_access_token=None, access_token='dXNlcjpwYXNz',
+            base_url=api.session_ers.base_url, version=api.version,
+            uses_csrf_token=False, transport='h2',
+        )
+
+
+class _CookieHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({'cookie': self.headers.get('Cookie')}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Set-Cookie', 'session=abc; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cookie_server():
+    server = http.server.HTTPServer(('localhost', 0), _CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://localhost:{}'.format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.skipif(ciscoisesdk.http2.httpx is None, reason='httpx is not installed')
+def test_transport_h2_send(cookie_server):
+    req_session = requests.Session()
+    req_session.trust_env = False
+    adapter = ciscoisesdk.http2.HTTP2Adapter()
+    req_session.mount('http://', adapter)
+
+    assert req_session.get(cookie_server).json() == {'cookie': None}
+    assert req_session.cookies.get('session') == 'abc'
+    response = req_session.get(cookie_server, stream=True)
+    assert json.loads(b''.join(response.iter_content(4))) == {'cookie': 'session=abc'}
+    with pytest.raises(ValueError):
+        req_session.get(cookie_server, proxies={'http': 'http://proxy:3128'})
+    adapter.close()
+
+
+def test_thread_local_sessions(api):
+    session = ciscoisesdk.restsession.RestSession(
+        get_access_token=None, access_token='dXNlcjpwYXNz',
+        base_url=api.session_ers.base_url, version=api.version,
+        uses_csrf_token=False, thread_local_sessions=True,
+    )
+    assert session.thread_local_sessions
+    req_sessions = []
+    thread = threading.Thread(target=lambda: req_sessions.append(session._get_req_session()))
+    thread.start()
+    thread.join()
+    assert session._get_req_session() is session._get_req_session()
+    assert req_sessions[0] is not session._get_req_session()
+
+    session.update_headers({'X-Test': 'value'})
+    assert req_sessions[0].headers['X-Test'] == 'value'
+
+
+def test_get_header(api):
+    session = api.session_ers
+    assert session.get_header('content-type') == session.headers['Content-Type']
+    assert session.get_header('X-Unknown-Header') is None
+    assert session.get_header('X-Unknown-Header', '') == ''
+
+
+def test_max_retries(api):
+    session = api.session_ers
+    assert session.max_retries == api.max_retries
+    session = ciscoisesdk.restsession.RestSession(
+        get_access_token=None, access_token='dXNlcjpwYXNz',
+        base_url=session.base_url, version=api.version,
+        uses_csrf_token=False, max_retries=3,
+    )
+    retries = session._req_session.get_adapter(session.base_url).max_retries
+    assert retries.total == 3
+    assert 503 in retries.status_forcelist
+    assert not retries.is_retry('POST', 503)
+    assert retries.is_retry('GET', 503)
+
+
+def test_pool_block(api):
+    session = api.session_ers
+    assert session.pool_block == api.pool_block
+    session = ciscoisesdk.restsession.RestSession(
+        get_access_token=None, access_token='dXNlcjpwYXNz',
+        base_url=session.base_url, version=api.version,
+        uses_csrf_token=False, pool_block=True,
+    )
+    assert session._req_session.get_adapter(session.base_url)._pool_block
+
+
+def test_close(api):
+    session = ciscoisesdk.restsession.RestSession(
+        get_access_token=None, access_token='dXNlcjpwYXNz',
+        base_url=api.session_ers.base_url, version=api.version,
+        uses_csrf_token=False, thread_local_sessions=True,
+    )
+    with session:
+        req_session = session._get_req_session()
+    assert list(session._local_sessions) == [req_session]
+
+
+def _get_items(session, **kwargs):
+    items = session.get_items('/ers/config/byodportal', ['SearchResult', 'resources'], **kwargs)
+    result = []
+    while True:
+        try:
+            result.append(next(items))
+        except StopIteration as e:
+            return result, e.value
+
+
+def test_get_items_next_path(api):
+    session = api.session_ers
+    items, next_href = _get_items(session, next_path=['SearchResult', 'nextPage', 'href'])
+    assert [item['id'] for item in items] == ['string']
+    assert next_href == 'string'
+    assert _get_items(session)[1] is None
+
+
+@pytest.mark.skipif(ciscoisesdk.restsession.ijson is None, reason='ijson is not installed')
+def test_get_items_next_path_streamed(api, monkeypatch):
+    monkeypatch.setattr(ciscoisesdk.restsession, 'STREAM_MIN_CONTENT_LENGTH', 0)
+    items, next_href = _get_items(api.session_ers, next_path=['SearchResult', 'nextPage', 'href'])
+    assert items == [{'id': 'string', 'name': 'string', 'description': 'string',
+                      'link': {'rel': 'string', 'href': 'string', 'type': 'string'}}]
+    assert next_href == 'string'
+
+
+def test_get_items_debug_logger(api, monkeypatch, caplog):
+    monkeypatch.setattr(ciscoisesdk.restsession, 'STREAM_MIN_CONTENT_LENGTH', 0)
+    session = api.session_ers
+    assert not session.debug
+    # Another session, or the user, may set the shared logger to DEBUG
+    caplog.set_level(logging.DEBUG, logger='ciscoisesdk.restsession')
+    items, next_href = _get_items(session, next_path=['SearchResult', 'nextPage', 'href'])
+    assert [item['id'] for item in items] == ['string']
+    assert next_href == 'string'